@@ -0,0 +1,580 @@
+"""
+Benchmark performa struktur data aplikasi manajemen mahasiswa.
+
+Jalankan dengan:
+    python benchmark.py            # semua benchmark
+    python benchmark.py muat       # hanya benchmark tertentu
+"""
+import os
+import sys
+import json
+import time
+import io
+import random
+import tempfile
+import re
+import tracemalloc
+from typing import List
+
+import pandas as pd
+
+from steamlit import (Mahasiswa, DataMahasiswa, ManajemenMahasiswa, ManajemenMahasiswaSQLite, ManajemenMahasiswaKolom,
+                      FileHandler, SnapshotBiner, AlgoritmaPencarian, RingkasanStatistik, ValidatorMahasiswa,
+                      HasilTambahBanyak, ImporMahasiswa, CacheHasilPencarian, PencarianBertahap)
+
+JURUSAN = ["Teknik Informatika", "Sistem Informasi", "Teknik Komputer",
+           "Manajemen Informatika", "Ilmu Komputer", "Teknologi Informasi"]
+NAMA_DEPAN = ["Ahmad", "Muhammad", "Dzaki", "Rizki", "Ade", "Dimas", "Vina", "Dea",
+              "Fathur", "Satria", "Maulana", "Nazril", "Azka", "Bagus", "Jason"]
+NAMA_BELAKANG = ["Ramadhan", "Ramadani", "Firdaus", "Irfan", "Aulia", "Saputra",
+                 "Pratama", "Hidayat", "Sinaga", "Gea", "Fajar", "Alam", "Kristanto"]
+
+
+def buat_data_dummy(n: int, seed: int = 42) -> List[Mahasiswa]:
+    """Membuat n data mahasiswa acak dengan NIM unik"""
+    rng = random.Random(seed)
+    data = []
+    for i in range(n):
+        nim = str(241000000000 + i)
+        nama = f"{rng.choice(NAMA_DEPAN)} {rng.choice(NAMA_BELAKANG)}"
+        angkatan = str(rng.randint(2018, 2025))
+        email = f"mhs{i}@example.com" if rng.random() < 0.8 else ""
+        data.append(Mahasiswa(nim=nim, nama=nama, jurusan=rng.choice(JURUSAN),
+                              angkatan=angkatan, email=email))
+    return data
+
+
+def ukur(fungsi, *args) -> float:
+    """Mengembalikan waktu eksekusi fungsi dalam detik"""
+    start = time.perf_counter()
+    fungsi(*args)
+    return time.perf_counter() - start
+
+
+class _ManajemenLinear:
+    """Replika penyimpanan lama (cek duplikasi dengan scan linear) sebagai pembanding"""
+
+    def __init__(self):
+        self.data = []
+
+    def tambah(self, mahasiswa: Mahasiswa) -> bool:
+        for m in self.data:
+            if m.nim == mahasiswa.nim:
+                raise ValueError(f"Mahasiswa dengan NIM {mahasiswa.nim} sudah ada")
+        self.data.append(mahasiswa)
+        return True
+
+
+def _muat(store, data: List[Mahasiswa]):
+    for m in data:
+        store.tambah(m)
+
+
+def benchmark_muat():
+    """Waktu memuat N record ke store: scan linear (lama), hash index NIM, dan tambah_banyak"""
+    print("== Muat data: scan linear vs hash index NIM ==")
+    for n in (1_000, 5_000, 10_000, 100_000):
+        data = buat_data_dummy(n)
+        lama = ukur(_muat, _ManajemenLinear(), data)  # O(n^2): beberapa menit pada n=100.000
+        baru = ukur(_muat, ManajemenMahasiswa(), data)
+        banyak = ukur(ManajemenMahasiswa().tambah_banyak, data)
+        print(f"n={n:>9,}  linear={lama:9.3f} s  index={baru:9.3f} s  tambah_banyak={banyak:9.3f} s", flush=True)
+
+
+def _lookup_acak(store, nims: List[str]):
+    for nim in nims:
+        store.get_by_nim(nim)
+
+
+def _edit_tahan_lama(store, path_json: str = None):
+    """Satu edit yang langsung tersimpan ke disk"""
+    m = store.get_by_nim("241000000000")
+    store.edit(m.nim, Mahasiswa(m.nim, "Nama Diedit", m.jurusan, m.angkatan, m.email))
+    if path_json:
+        # Backend list hanya tahan lama setelah seluruh dataset ditulis ulang
+        FileHandler.simpan_ke_file(store.get_semua(), path_json)
+
+
+def benchmark_backend():
+    """Backend list (memori + JSON) vs SQLite untuk muat, lookup, filter, urut dan edit"""
+    print("== Backend list vs SQLite ==")
+    rng = random.Random(7)
+    for n in (10_000, 100_000, 1_000_000):
+        data = buat_data_dummy(n)
+        nims = [str(241000000000 + rng.randrange(n)) for _ in range(1_000)]
+        with tempfile.TemporaryDirectory() as tmp:
+            list_store = ManajemenMahasiswa()
+            sqlite_store = ManajemenMahasiswaSQLite(os.path.join(tmp, "bench.db"))
+            path_json = os.path.join(tmp, "bench.json")
+            for nama, store, path in (("list", list_store, path_json), ("sqlite", sqlite_store, None)):
+                hasil = [
+                    ukur(store.tambah_banyak, data),
+                    ukur(_lookup_acak, store, nims),
+                    ukur(store.filter, "", "ahmad", "Sistem Informasi"),
+                    ukur(store.filter, "", "", None, "2020", "nama"),
+                    ukur(_edit_tahan_lama, store, path),
+                ]
+                print(f"n={n:>9,}  {nama:<6}  muat={hasil[0]:7.3f} s  1000x lookup={hasil[1]:7.3f} s  "
+                      f"filter={hasil[2]:7.3f} s  filter+urut={hasil[3]:7.3f} s  edit tahan lama={hasil[4]:7.3f} s")
+            del list_store, sqlite_store
+
+
+def _muat_json_lama(path: str):
+    """Jalur lama: json.load seluruh array lalu membuat Mahasiswa per baris"""
+    with open(path) as file:
+        data_dict = json.load(file)
+    return [FileHandler._ke_mahasiswa(item) for item in data_dict]
+
+
+def _buka_biner(path: str):
+    """Cold start biner: buka + mmap + ambil 12 record pertama untuk kartu dashboard"""
+    with SnapshotBiner(path) as snapshot:
+        len(snapshot)
+        snapshot[:12]
+
+
+def _iter_biner(path: str):
+    with SnapshotBiner(path) as snapshot:
+        for _ in snapshot:
+            pass
+
+
+def benchmark_snapshot():
+    """Loader JSON array lama vs NDJSON vs snapshot biner memory-mapped"""
+    print("== Loader snapshot: JSON vs NDJSON vs biner ==")
+    for n in (100_000, 1_000_000):
+        data = buat_data_dummy(n)
+        with tempfile.TemporaryDirectory() as tmp:
+            path_json = os.path.join(tmp, "lama.json")
+            with open(path_json, "w") as file:
+                json.dump([m.to_dict() for m in data], file, indent=4)
+            path_ndjson = os.path.join(tmp, "data.json")
+            FileHandler.simpan_ke_file(data, path_ndjson)
+            path_biner = FileHandler.path_biner(path_ndjson)
+            del data
+            ukuran = f"json={os.path.getsize(path_json) / 1e6:.0f}MB bin={os.path.getsize(path_biner) / 1e6:.0f}MB"
+
+            hasil = {
+                "json.load+objek": ukur(_muat_json_lama, path_json),
+                "ndjson iter": ukur(lambda: list(FileHandler.iter_dari_file(path_ndjson))),
+                "biner buka+12": ukur(_buka_biner, path_biner),
+                "biner iter semua": ukur(_iter_biner, path_biner),
+            }
+            hasil["store dari biner"] = ukur(FileHandler.muat_ke_store, ManajemenMahasiswa(), path_ndjson)
+            os.rename(path_biner, path_biner + ".off")
+            hasil["store dari ndjson"] = ukur(FileHandler.muat_ke_store, ManajemenMahasiswa(), path_ndjson)
+            print(f"n={n:>9,}  {ukuran}  " + "  ".join(f"{k}={v * 1000:.1f}ms" for k, v in hasil.items()))
+
+
+class _MahasiswaLama:
+    """Replika kelas Mahasiswa lama (atribut private + property, dengan __dict__) sebagai pembanding"""
+
+    def __init__(self, nim, nama, jurusan="Teknik Informatika", angkatan="2024", email=""):
+        self.__nim = nim
+        self.__nama = nama
+        self.__jurusan = jurusan
+        self.__angkatan = angkatan
+        self.__email = email
+
+    @property
+    def nim(self):
+        return self.__nim
+
+    @property
+    def nama(self):
+        return self.__nama
+
+    @property
+    def jurusan(self):
+        return self.__jurusan
+
+    @property
+    def angkatan(self):
+        return self.__angkatan
+
+    @property
+    def email(self):
+        return self.__email
+
+
+def _buat_objek(kelas, baris):
+    """Membuat objek dari baris NDJSON, sehingga tiap record punya string jurusan/angkatan sendiri"""
+    hasil = []
+    for teks in baris:
+        item = json.loads(teks)
+        hasil.append(kelas(item['nim'], item['nama'], item['jurusan'], item['angkatan'], item['email']))
+    return hasil
+
+
+def _baca_semua_field(data):
+    for m in data:
+        m.nim, m.nama, m.jurusan, m.angkatan, m.email
+
+
+def benchmark_memori():
+    """Memori per record dan biaya akses atribut: Mahasiswa lama vs __slots__"""
+    print("== Memori Mahasiswa: kelas lama vs __slots__ ==")
+    n = 1_000_000
+    baris = [json.dumps(m.to_dict()) for m in buat_data_dummy(n)]
+    for nama, kelas in (("lama", _MahasiswaLama), ("slots", Mahasiswa)):
+        buat = ukur(_buat_objek, kelas, baris)
+        tracemalloc.start()
+        data = _buat_objek(kelas, baris)
+        memori = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        baca = ukur(_baca_semua_field, data)
+        print(f"n={n:>9,}  {nama:<5}  memori={memori / 1e6:7.1f} MB ({memori / n:5.0f} B/record)  "
+              f"buat={buat:6.3f} s  baca 5 field={baca:6.3f} s")
+        del data
+
+
+def _hitung_jurusan(store):
+    """Hitungan per jurusan seperti halaman visualisasi"""
+    return store.ke_dataframe()['Jurusan'].value_counts()
+
+
+def _ekspor_csv(store, path: str):
+    store.ke_dataframe().to_csv(path, index=False)
+
+
+def benchmark_kolom():
+    """Backend list objek vs backend kolom NumPy untuk filter, hitungan dan ekspor CSV"""
+    print("== Backend list vs kolom ==")
+    for n in (100_000, 1_000_000, 3_000_000):
+        data = buat_data_dummy(n)
+        with tempfile.TemporaryDirectory() as tmp:
+            path_csv = os.path.join(tmp, "ekspor.csv")
+            for nama, store in (("list", ManajemenMahasiswa()), ("kolom", ManajemenMahasiswaKolom())):
+                muat = ukur(store.tambah_banyak, data)
+                store.filter("", "", "Sistem Informasi")  # Kolom teks backend kolom dibangun sekali per versi
+                hasil = [
+                    ukur(store.filter, "", "ahmad", "Sistem Informasi"),
+                    ukur(store.filter, "2410000", "", None, "2020", "nama"),
+                    ukur(_hitung_jurusan, store),
+                    ukur(_ekspor_csv, store, path_csv),
+                ]
+                print(f"n={n:>9,}  {nama:<5}  muat={muat:6.3f} s  filter={hasil[0]:6.3f} s  "
+                      f"filter+urut={hasil[1]:6.3f} s  hitung jurusan={hasil[2]:6.3f} s  ekspor csv={hasil[3]:6.3f} s")
+                del store
+        del data
+
+
+def benchmark_indeks():
+    """Filter kategori, daftar jurusan dan hitungan: scan O(n) bawaan vs index sekunder store"""
+    print("== Index sekunder jurusan/angkatan ==")
+    for n in (100_000, 1_000_000):
+        store = ManajemenMahasiswa()
+        store.tambah_banyak(buat_data_dummy(n))
+        for nama, filter_, daftar, hitung in (
+            ("scan", lambda *a: DataMahasiswa.filter(store, *a), lambda: sorted(set(m.jurusan for m in store.get_semua())),
+             lambda: DataMahasiswa.hitung_jurusan(store)),
+            ("index", store.filter, store.daftar_jurusan, store.hitung_jurusan),
+        ):
+            hasil = [
+                ukur(filter_, "", "", "Sistem Informasi", "2020"),
+                ukur(filter_, "", "", "Ilmu Komputer"),
+                ukur(daftar),
+                ukur(hitung),
+            ]
+            print(f"n={n:>9,}  {nama:<5}  filter jurusan+angkatan={hasil[0] * 1000:8.2f} ms  "
+                  f"filter jurusan={hasil[1] * 1000:8.2f} ms  daftar jurusan={hasil[2] * 1000:8.2f} ms  "
+                  f"hitung jurusan={hasil[3] * 1000:8.2f} ms")
+
+
+def benchmark_trigram():
+    """Pencarian substring: linear search vs index trigram (termasuk biaya bangun index pertama)"""
+    print("== Index trigram nama/nim/email ==")
+    for n in (100_000, 1_000_000):
+        store = ManajemenMahasiswa()
+        store.tambah_banyak(buat_data_dummy(n))
+        data = store.get_semua()
+        bangun = ukur(store.cari_teks, "xyz", None)  # Pencarian pertama membangun index
+        print(f"n={n:>9,}  bangun index={bangun:6.3f} s")
+        for keyword, by in (("mhs424242@", "email"), ("2410000123", "nim"), ("dzaki ram", "nama"), ("ahmad", "nama"), ("zzz", None)):
+            linear = ukur(AlgoritmaPencarian.linear_search, data, keyword, by or "nama") if by else \
+                ukur(AlgoritmaPencarian.sequential_search, data, keyword)
+            index = ukur(store.cari_teks, keyword, by)
+            jumlah = len(store.cari_teks(keyword, by))
+            print(f"    {keyword!r:>13} ({by or 'semua'}):  hasil={jumlah:>7,}  linear={linear * 1000:8.2f} ms  "
+                  f"index={index * 1000:8.2f} ms")
+
+
+def _binary_lama(data: List[Mahasiswa], nim: str):
+    """Pola lama halaman Pencarian: urutkan seluruh data setiap kali lalu binary search"""
+    return AlgoritmaPencarian.binary_search(sorted(data, key=lambda m: m.nim), nim)
+
+
+def benchmark_urut():
+    """Binary search/prefix/rentang NIM: sorted() per pencarian vs tampilan terurut yang dipelihara"""
+    print("== Tampilan NIM terurut ==")
+    for n in (100_000, 1_000_000):
+        store = ManajemenMahasiswa()
+        store.tambah_banyak(buat_data_dummy(n))
+        data = store.get_semua()
+        target = data[n // 2].nim
+        lama = ukur(_binary_lama, data, target)
+        baru = ukur(lambda: AlgoritmaPencarian.binary_search(store.urut_nim(), target))
+        prefiks_lama = ukur(lambda: [m for m in sorted(data, key=lambda m: m.nim) if m.nim.startswith(target[:-2])])
+        prefiks = ukur(store.prefiks_nim, target[:-2])
+        rentang = ukur(store.rentang_nim, target, target[:-3] + "999")
+        sisip = ukur(store.tambah, Mahasiswa("1" + target, "Baru Sisip", "Teknik Y", "2024", ""))
+        print(f"n={n:>9,}  binary: sort+cari={lama * 1000:8.2f} ms  tampilan={baru * 1000:6.3f} ms  "
+              f"prefiks: sort+saring={prefiks_lama * 1000:8.2f} ms  bisect={prefiks * 1000:6.3f} ms  "
+              f"rentang={rentang * 1000:6.3f} ms  tambah (insort)={sisip * 1000:6.3f} ms")
+
+
+def _statistik_lama(data: List[Mahasiswa]):
+    """Pola lama: hitung ulang semua statistik dari list setiap rerun (nama depan kuadratik)"""
+    jurusan = {}
+    for m in data:
+        jurusan[m.jurusan] = jurusan.get(m.jurusan, 0) + 1
+    dengan_email = len([m for m in data if m.email])
+    rata = sum(len(m.nama) for m in data) / len(data)
+    first_names = [m.nama.split()[0] for m in data if m.nama.split()]
+    terbanyak = max(set(first_names), key=first_names.count)
+    return jurusan, dengan_email, rata, terbanyak
+
+
+def benchmark_statistik():
+    """Statistik agregat: hitung ulang per rerun vs statistik yang dipelihara per mutasi"""
+    print("== Statistik agregat ==")
+    for n in (10_000, 100_000, 1_000_000):
+        store = ManajemenMahasiswa()
+        store.tambah_banyak(buat_data_dummy(n))
+        data = store.get_semua()
+        lama = ukur(_statistik_lama, data) if n <= 100_000 else float('nan')
+        df = ukur(lambda: RingkasanStatistik.dari_dataframe(store.ke_dataframe(data)))
+        baru = ukur(store.statistik)
+        mutasi = ukur(store.hapus, data[n // 2].nim)
+        print(f"n={n:>9,}  hitung ulang (lama)={lama * 1000:9.2f} ms  pandas={df * 1000:8.2f} ms  "
+              f"dipelihara={baru * 1000:6.3f} ms  hapus={mutasi * 1000:6.3f} ms")
+
+
+def benchmark_salinan():
+    """Pembacaan seluruh data per rerun: salinan list lama vs snapshot versi yang dibagi"""
+    print("== Snapshot baca per rerun (5 pembacaan) ==")
+    for n in (100_000, 500_000):
+        store = ManajemenMahasiswa()
+        store.tambah_banyak(buat_data_dummy(n))
+        store.hapus(store.get_semua()[0].nim)  # Ada slot kosong, seperti setelah pemakaian biasa
+        store.get_semua()
+        tracemalloc.start()
+        lama = ukur(lambda: [[m for m in store.get_semua()] for _ in range(5)])
+        puncak_lama = tracemalloc.get_traced_memory()[1]
+        tracemalloc.reset_peak()
+        baru = ukur(lambda: [store.get_semua() for _ in range(5)])
+        puncak_baru = tracemalloc.get_traced_memory()[1] - tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f"n={n:>9,}  salinan list={lama * 1000:8.2f} ms ({puncak_lama / 1e6:6.1f} MB)  "
+              f"snapshot={baru * 1000:6.3f} ms ({puncak_baru / 1e6:6.3f} MB)")
+
+
+def benchmark_hapus_banyak():
+    """Menghapus satu angkatan: hapus() per NIM vs hapus_banyak() dalam satu lintasan"""
+    print("== Hapus massal satu angkatan ==")
+    for n in (100_000, 1_000_000):
+        hasil = []
+        for massal in (False, True):
+            store = ManajemenMahasiswa()
+            store.tambah_banyak(buat_data_dummy(n))
+            store.urut_nim()  # Tampilan sedang dipegang pembaca, seperti di UI
+            nims = [m.nim for m in store.filter(angkatan="2021")]
+            if massal:
+                hasil.append(ukur(store.hapus_banyak, nims))
+            else:
+                hasil.append(ukur(lambda: [store.hapus(nim) for nim in nims]))
+        print(f"n={n:>9,}  hapus {len(nims):>7,} NIM: per NIM={hasil[0]:7.3f} s  hapus_banyak={hasil[1]:7.3f} s")
+
+
+def _ekspor_potongan(store, path: str, ukuran: int):
+    """Menulis CSV per potongan DataFrame (pola yang sama dengan EmailHandler.generate_csv_report)"""
+    with open(path, 'w', encoding='utf-8', newline='') as file:
+        for i, bagian in enumerate(store.iter_batches(ukuran, sebagai='dataframe')):
+            bagian.to_csv(file, index=False, header=i == 0)
+
+
+def benchmark_potongan():
+    """Ekspor CSV seluruh data: satu DataFrame penuh vs iter_batches (memori puncak)"""
+    print("== Ekspor CSV per potongan ==")
+    path = os.path.join(tempfile.mkdtemp(), "ekspor.csv")
+    for n in (100_000, 1_000_000):
+        store = ManajemenMahasiswa()
+        store.tambah_banyak(buat_data_dummy(n))
+        tracemalloc.start()
+        penuh = ukur(lambda: store.ke_dataframe().to_csv(path, index=False))
+        puncak_penuh = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        baris = []
+        for ukuran in (1_000, 10_000, 100_000):
+            tracemalloc.start()
+            waktu = ukur(_ekspor_potongan, store, path, ukuran)
+            baris.append(f"{ukuran:>7,}: {waktu:5.2f} s / {tracemalloc.get_traced_memory()[1] / 1e6:6.1f} MB")
+            tracemalloc.stop()
+        print(f"n={n:>9,}  penuh={penuh:5.2f} s / {puncak_penuh / 1e6:6.1f} MB  potongan " + "  ".join(baris))
+
+
+def _validasi_lama(df: pd.DataFrame) -> int:
+    """Replika validasi lama: re.match dengan pola string per baris"""
+    salah = 0
+    for nim, nama, email in zip(df['NIM'], df['Nama'], df['Email']):
+        if (not re.match(r'^\d{9,12}$', nim) or not re.match(r'^[A-Za-z\s\.\,]{3,50}$', nama)
+                or (email and not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', email))):
+            salah += 1
+    return salah
+
+
+def benchmark_validasi():
+    """Validasi impor: re.match per baris vs ValidatorMahasiswa.validasi_batch (vektor)"""
+    print("== Validasi NIM/nama/email ==")
+    for n in (100_000, 1_000_000):
+        df = ManajemenMahasiswa().ke_dataframe(buat_data_dummy(n))
+        lama = ukur(_validasi_lama, df)
+        baru = ukur(ValidatorMahasiswa.validasi_batch, df)
+        print(f"n={n:>9,}  per_baris={lama:6.2f} s  batch={baru:6.2f} s")
+
+
+def _impor_csv(store, isi: bytes) -> HasilTambahBanyak:
+    """Alur halaman impor tanpa UI: baca per potongan, validasi, commit"""
+    hasil = HasilTambahBanyak()
+    for _, df in ImporMahasiswa.validasi_paralel(ImporMahasiswa.baca_potongan(io.BytesIO(isi), "impor.csv")):
+        ImporMahasiswa.commit_potongan(store, df, hasil)
+    return hasil
+
+
+def benchmark_impor():
+    """Impor CSV per potongan ke store yang sudah berisi 100k record (NIM angkatan baru)"""
+    print(f"== Impor CSV (potongan {ImporMahasiswa.UKURAN_POTONGAN:,}, pekerja {min(4, os.cpu_count() or 1)}) ==")
+    for n in (20_000, 1_000_000):
+        df = ManajemenMahasiswa().ke_dataframe(buat_data_dummy(n, seed=7))
+        df['NIM'] = [str(251000000000 + i) for i in range(n)]
+        isi = df.to_csv(index=False).encode('utf-8')
+        for kelas in (ManajemenMahasiswa, ManajemenMahasiswaKolom):
+            store = kelas()
+            store.tambah_banyak(buat_data_dummy(100_000))
+            waktu = ukur(_impor_csv, store, isi)
+            print(f"n={n:>9,}  {kelas.__name__:<24} {waktu:6.2f} s  ({n / waktu:>9,.0f} baris/s)")
+
+
+def benchmark_vektor():
+    """Pencarian substring nama dan kondisi AND: loop Python per objek vs vectorized_search"""
+    print("== Vectorized search vs loop per objek ==")
+    for n in (100_000, 1_000_000):
+        store = ManajemenMahasiswa()
+        store.tambah_banyak(buat_data_dummy(n))
+        data = store.get_semua()
+        bangun = ukur(store.tabel_pencarian)
+        linear = ukur(AlgoritmaPencarian.linear_search, data, "ram", 'nama')
+        vektor = ukur(AlgoritmaPencarian.vectorized_search, store, [('nama', "ram", False)])
+        loop_and = ukur(lambda: [m for m in data if "ram" in m.nama.lower() and m.jurusan == "Sistem Informasi"
+                                 and m.angkatan == "2021" and "mhs1" in m.email])
+        vektor_and = ukur(AlgoritmaPencarian.vectorized_search, store,
+                          [('nama', "ram", False), ('jurusan', "Sistem Informasi", True),
+                           ('angkatan', "2021", True), ('email', "mhs1", False)])
+        print(f"n={n:>9,}  cache={bangun:6.3f} s  nama: loop={linear * 1000:8.1f} ms  vektor={vektor * 1000:7.1f} ms"
+              f"  AND 4 field: loop={loop_and * 1000:8.1f} ms  vektor={vektor_and * 1000:7.1f} ms")
+
+
+def _nama_beragam(n: int, seed: int = 3) -> List[Mahasiswa]:
+    """Nama dari ~40k kata sintetis sehingga kosakata dan nama unik mendekati data nyata"""
+    rng = random.Random(seed)
+    suku = ["ra", "ma", "dha", "ni", "sa", "tri", "a", "di", "yu", "ko", "su", "wi", "jo", "har",
+            "to", "nu", "ri", "lah", "fi", "da", "na", "put", "wan", "ti", "en", "gus", "ba", "mu"]
+    kata = sorted({"".join(rng.choice(suku) for _ in range(rng.randint(2, 4))).capitalize() for _ in range(80_000)})
+    return [Mahasiswa(nim=str(241000000000 + i), nama=" ".join(rng.choice(kata) for _ in range(rng.randint(2, 3))))
+            for i in range(n)]
+
+
+def benchmark_fuzzy():
+    """Fuzzy search nama: bangun index (sekali per versi) dan waktu query per jarak maksimum"""
+    print("== Fuzzy search nama (jarak edit) ==")
+    for n in (100_000, 1_000_000):
+        store = ManajemenMahasiswa()
+        store.tambah_banyak(_nama_beragam(n), validasi=False)
+        bangun = ukur(store.indeks_fuzzy)
+        baris = []
+        for maks in (1, 2):
+            waktu = max(ukur(AlgoritmaPencarian.fuzzy_search, store, kata, maks)
+                        for kata in ("Ramadan", "Hardhani Putra", "Sutriyu"))
+            baris.append(f"jarak<={maks}: {waktu * 1000:6.1f} ms")
+        print(f"n={n:>9,}  index={bangun:5.2f} s  query terlama " + "  ".join(baris))
+
+
+
+def benchmark_lengkapi():
+    """Pilihan selectbox: dict label semua mahasiswa per rerun vs top-k dari index prefiks"""
+    print("== Autocomplete: label semua mahasiswa vs index prefiks ==")
+    for n in (100_000, 1_000_000):
+        store = ManajemenMahasiswa()
+        tambah = ukur(store.tambah_banyak, _nama_beragam(n), False)
+        label = ukur(lambda: {f"{m.nim} - {m.nama}": m.nim for m in store.get_semua()})
+        bangun = ukur(store.lengkapi, "a")  # Saran pertama membangun index secara malas
+        saran = max(ukur(store.lengkapi, teks) for teks in ("r", "ra", "2410000", "ramadan pu"))
+        store.tambah(Mahasiswa(nim="999999999999", nama="Zulkarnain Baru"))
+        hapus = ukur(store.hapus, "999999999999")
+        print(f"n={n:>9,}  tambah_banyak={tambah:5.2f} s  label semua={label * 1000:7.1f} ms  index={bangun:5.2f} s"
+              f"  lengkapi terlama={saran * 1000:6.3f} ms  hapus satu={hapus * 1000:6.3f} ms")
+
+
+
+def benchmark_cache():
+    """Query berulang tanpa perubahan data: pencarian ulang vs lookup cache hasil"""
+    print("== Cache hasil pencarian (kunci: algoritma, keyword, field, versi) ==")
+    for n in (100_000, 1_000_000):
+        store = ManajemenMahasiswa()
+        store.tambah_banyak(buat_data_dummy(n))
+        data = store.get_semua()
+        cache = CacheHasilPencarian()
+        hitung = lambda: AlgoritmaPencarian.linear_search(data, "ram", 'nama')
+        miss = ukur(cache.ambil, 'linear', "ram", 'nama', store.versi, hitung)
+        hit = ukur(cache.ambil, 'linear', "ram", 'nama', store.versi, hitung)
+        print(f"n={n:>9,}  linear (miss)={miss * 1000:8.1f} ms  hit={hit * 1e6:6.2f} us")
+
+
+
+def benchmark_bertahap():
+    """Mengetik keyword huruf demi huruf: linear search penuh per ketikan vs penyaringan bertahap"""
+    print("== Pencarian sambil mengetik: penuh vs bertahap ==")
+    ketikan = ["r", "ra", "ram", "rama", "ramad"]
+    for n in (100_000, 1_000_000):
+        store = ManajemenMahasiswa()
+        store.tambah_banyak(buat_data_dummy(n))
+        data = store.get_semua()
+        penuh = [ukur(AlgoritmaPencarian.linear_search, data, kw, 'nama') for kw in ketikan]
+        bertahap = PencarianBertahap()
+        waktu = [ukur(bertahap.cari, 'nama', (kw,), 'nama', store.versi,
+                      lambda kw=kw: AlgoritmaPencarian.linear_search(data, kw, 'nama'),
+                      lambda lama, kw=kw: AlgoritmaPencarian.linear_search(lama, kw, 'nama'))
+                 for kw in ketikan]
+        hasil = [len(AlgoritmaPencarian.linear_search(data, kw, 'nama')) for kw in ketikan]
+        print(f"n={n:>9,}  " + "  ".join(f"'{kw}' ({h:,} hasil): {p * 1000:6.1f} -> {b * 1000:6.1f} ms"
+                                          for kw, h, p, b in zip(ketikan, hasil, penuh, waktu)))
+
+
+BENCHMARKS = {
+    'muat': benchmark_muat,
+    'backend': benchmark_backend,
+    'snapshot': benchmark_snapshot,
+    'memori': benchmark_memori,
+    'kolom': benchmark_kolom,
+    'indeks': benchmark_indeks,
+    'trigram': benchmark_trigram,
+    'urut': benchmark_urut,
+    'statistik': benchmark_statistik,
+    'salinan': benchmark_salinan,
+    'hapus_banyak': benchmark_hapus_banyak,
+    'potongan': benchmark_potongan,
+    'validasi': benchmark_validasi,
+    'impor': benchmark_impor,
+    'vektor': benchmark_vektor,
+    'fuzzy': benchmark_fuzzy,
+    'lengkapi': benchmark_lengkapi,
+    'cache': benchmark_cache,
+    'bertahap': benchmark_bertahap,
+}
+
+
+if __name__ == "__main__":
+    pilihan = sys.argv[1:] or list(BENCHMARKS)
+    for nama in pilihan:
+        BENCHMARKS[nama]()
+        print()
@@ -1,214 +1,2156 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import re
 import os
+import sys
 import json
 import time
+import atexit
 import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Tuple
+from typing import Any, Callable, List, Dict, Optional, Tuple, Iterable, Iterator
 import hashlib
+import mmap
+import pickle
 import random
+import shutil
+import sqlite3
+import struct
+import bisect
+import threading
+import uuid
+from array import array
+from collections import OrderedDict, deque
+from collections.abc import Sequence, Sized
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from itertools import chain, islice
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email import encoders
 
+try:
+    import pyarrow  # noqa: F401 - opsional: operasi string pandas berjalan di Arrow (vektor, tanpa loop Python)
+    TIPE_TEKS_VEKTOR = 'string[pyarrow]'
+except ImportError:
+    TIPE_TEKS_VEKTOR = 'string'
+
+# ==============================
+# VALIDASI
+# ==============================
+
+class ValidatorMahasiswa:
+    """
+    Satu-satunya tempat aturan validasi NIM, nama, angkatan, dan email. Pola dikompilasi sekali
+    dan hanya memakai kelas karakter ASCII eksplisit sehingga mode tunggal (re Python)
+    dan mode batch (regex vektor pandas/Arrow) memberi hasil yang sama.
+    """
+    
+    POLA_NIM = re.compile(r'[0-9]{9,12}')
+    POLA_NAMA = re.compile(r'[A-Za-z \t\n\r\f\v.,]{3,50}')
+    POLA_EMAIL = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+    POLA_ANGKATAN = re.compile(r'[0-9]{4}')
+    FIELD = ('nim', 'nama', 'angkatan', 'email')  # Urutan prioritas alasan di mode batch
+    
+    # Alasan singkat (laporan penolakan) dan pesan untuk form UI per field
+    ALASAN = {'nim': "NIM tidak valid", 'nama': "Nama tidak valid",
+              'angkatan': "Angkatan tidak valid", 'email': "Email tidak valid"}
+    PESAN = {
+        'nim': "NIM harus terdiri dari 9-12 digit angka!",
+        'nama': "Nama hanya boleh mengandung huruf, spasi, titik, dan koma!",
+        'email': "Format email tidak valid!",
+    }
+    
+    @staticmethod
+    def nim_valid(nim: str) -> bool:
+        return ValidatorMahasiswa.POLA_NIM.fullmatch(nim) is not None
+    
+    @staticmethod
+    def nama_valid(nama: str) -> bool:
+        return ValidatorMahasiswa.POLA_NAMA.fullmatch(nama) is not None
+    
+    @staticmethod
+    def angkatan_valid(angkatan: str) -> bool:
+        return ValidatorMahasiswa.POLA_ANGKATAN.fullmatch(angkatan) is not None
+    
+    @staticmethod
+    def email_valid(email: str) -> bool:
+        """Email boleh kosong"""
+        return not email or ValidatorMahasiswa.POLA_EMAIL.fullmatch(email) is not None
+    
+    @staticmethod
+    def cek(nim: str, nama: str, email: str) -> Optional[str]:
+        """Field pertama yang tidak valid ('nim', 'nama', 'email'), None jika semua valid"""
+        if not ValidatorMahasiswa.nim_valid(nim):
+            return 'nim'
+        if not ValidatorMahasiswa.nama_valid(nama):
+            return 'nama'
+        if not ValidatorMahasiswa.email_valid(email):
+            return 'email'
+        return None
+    
+    @staticmethod
+    def validasi_batch(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Validasi vektor kolom NIM, Nama, Angkatan, Email (nama kolom seperti ke_dataframe) -
+        tanpa loop Python per baris. Mengembalikan mask boolean per field (True = tidak valid)
+        dengan indeks yang sama dengan df, plus kolom 'error' untuk baris yang ditolak.
+        """
+        teks = {kolom: df[kolom].astype(TIPE_TEKS_VEKTOR) for kolom in ('NIM', 'Nama', 'Angkatan', 'Email')}
+        email = teks['Email'].fillna('')
+        salah = pd.DataFrame({
+            'nim': ~teks['NIM'].str.fullmatch(ValidatorMahasiswa.POLA_NIM.pattern).fillna(False).astype(bool),
+            'nama': ~teks['Nama'].str.fullmatch(ValidatorMahasiswa.POLA_NAMA.pattern).fillna(False).astype(bool),
+            'angkatan': ~teks['Angkatan'].str.fullmatch(ValidatorMahasiswa.POLA_ANGKATAN.pattern).fillna(False).astype(bool),
+            'email': (email != '') & ~email.str.fullmatch(ValidatorMahasiswa.POLA_EMAIL.pattern).fillna(False).astype(bool),
+        }, index=df.index)
+        salah['error'] = salah['nim'] | salah['nama'] | salah['angkatan'] | salah['email']
+        return salah
+    
+    @staticmethod
+    def alasan_batch(salah: pd.DataFrame) -> pd.Series:
+        """Alasan penolakan per baris dari mask validasi_batch (string kosong untuk baris valid)"""
+        alasan = np.select([salah[f].to_numpy(dtype=bool) for f in ValidatorMahasiswa.FIELD],
+                           [ValidatorMahasiswa.ALASAN[f] for f in ValidatorMahasiswa.FIELD], default='')
+        return pd.Series(alasan, index=salah.index)
+
 # KELAS DASAR & ENKAPSULASI
 
 class Mahasiswa:
-    """Kelas untuk merepresentasikan data mahasiswa dengan enkapsulasi"""
+    """
+    Kelas untuk merepresentasikan data mahasiswa dengan enkapsulasi.
+    
+    Memakai __slots__ (tanpa __dict__ per objek) agar hemat memori pada jutaan
+    record. Field dibaca langsung dari slot; penulisan field setelah objek dibuat
+    selalu lewat __setattr__ yang memvalidasi. Jurusan dan angkatan di-intern
+    sehingga semua record dengan nilai yang sama berbagi satu objek string.
+    """
+    __slots__ = ('nim', 'nama', 'jurusan', 'angkatan', 'email')
+    
     def __init__(self, nim: str, nama: str, jurusan: str = "Teknik Informatika", angkatan: str = "2024", email: str = ""):
-        self.__nim = nim  # Private attribute
-        self.__nama = nama  # Private attribute
-        self.__jurusan = jurusan  # Private attribute
-        self.__angkatan = angkatan  # Private attribute
-        self.__email = email  # Private attribute
+        _set = object.__setattr__  # Konstruktor tidak memvalidasi (sama seperti sebelumnya)
+        _set(self, 'nim', nim)
+        _set(self, 'nama', nama)
+        _set(self, 'jurusan', sys.intern(str(jurusan)))  # str(): file lama bisa berisi angka, mis. "angkatan": 2024
+        _set(self, 'angkatan', sys.intern(str(angkatan)))
+        _set(self, 'email', email)
+    
+    # Setter dengan validasi
+    def __setattr__(self, field: str, nilai):
+        if field == 'nim':
+            if not self._validasi_nim(nilai):
+                raise ValueError("NIM tidak valid")
+        elif field == 'nama':
+            if not self._validasi_nama(nilai):
+                raise ValueError("Nama tidak valid")
+        elif field == 'email':
+            if not self._validasi_email(nilai):
+                raise ValueError("Email tidak valid")
+        elif field in ('jurusan', 'angkatan'):
+            nilai = sys.intern(str(nilai))
+        object.__setattr__(self, field, nilai)
+    
+    # Validasi private methods (aturan ada di ValidatorMahasiswa)
+    def _validasi_nim(self, nim: str) -> bool:
+        return ValidatorMahasiswa.nim_valid(nim)
+    
+    def _validasi_nama(self, nama: str) -> bool:
+        return ValidatorMahasiswa.nama_valid(nama)
+    
+    def _validasi_email(self, email: str) -> bool:
+        return ValidatorMahasiswa.email_valid(email)
+    
+    def _cek_validasi(self) -> Optional[str]:
+        """Mengembalikan alasan jika data tidak valid, None jika valid"""
+        field = ValidatorMahasiswa.cek(self.nim, self.nama, self.email)
+        return ValidatorMahasiswa.ALASAN[field] if field else None
+    
+    def to_dict(self) -> Dict:
+        """Mengembalikan data mahasiswa sebagai dictionary"""
+        return {
+            'nim': self.nim,
+            'nama': self.nama,
+            'jurusan': self.jurusan,
+            'angkatan': self.angkatan,
+            'email': self.email
+        }
+    
+    def __str__(self) -> str:
+        return f"{self.nim} - {self.nama} - {self.jurusan}"
+
+# ==============================
+# KONKURENSI
+# ==============================
+
+class ReadWriteLock:
+    """
+    Kunci baca/tulis: banyak pembaca boleh berjalan bersamaan,
+    penulis berjalan eksklusif. Penulis yang menunggu didahulukan
+    agar tidak kelaparan oleh aliran pembaca.
+    Tidak reentrant - jangan mengambil kunci yang sama secara bersarang.
+    """
+    
+    def __init__(self):
+        self._kondisi = threading.Condition(threading.Lock())
+        self._pembaca = 0
+        self._penulis = False
+        self._penulis_menunggu = 0
+    
+    @contextmanager
+    def baca(self):
+        """Context manager untuk akses baca (shared)"""
+        with self._kondisi:
+            while self._penulis or self._penulis_menunggu:
+                self._kondisi.wait()
+            self._pembaca += 1
+        try:
+            yield
+        finally:
+            with self._kondisi:
+                self._pembaca -= 1
+                if self._pembaca == 0:
+                    self._kondisi.notify_all()
+    
+    @contextmanager
+    def tulis(self):
+        """Context manager untuk akses tulis (eksklusif)"""
+        with self._kondisi:
+            self._penulis_menunggu += 1
+            while self._penulis or self._pembaca:
+                self._kondisi.wait()
+            self._penulis_menunggu -= 1
+            self._penulis = True
+        try:
+            yield
+        finally:
+            with self._kondisi:
+                self._penulis = False
+                self._kondisi.notify_all()
+
+# ==============================
+# INDEX TRIGRAM
+# ==============================
+
+class IndeksTrigram:
+    """
+    Inverted index trigram untuk pencarian substring pada NIM, nama, dan email.
+    Setiap trigram (3 karakter, huruf kecil) dipetakan ke posisi record yang memuatnya;
+    pencarian memotong daftar posisi trigram keyword sehingga hanya sedikit kandidat
+    yang perlu diverifikasi dengan `in`.
+    
+    Index utama dibangun sekaligus dengan NumPy (kode trigram 63-bit diurutkan, format
+    CSR). Penambahan kecil masuk ke delta per trigram; record yang dihapus/diedit hanya
+    dihitung sebagai basi karena kandidat selalu diverifikasi. Index dibangun ulang
+    (secara malas, saat pencarian berikutnya) jika ditandai kotor atau delta/basi membesar.
+    """
+    
+    FIELD = ('nim', 'nama', 'email')
+    UKURAN_CHUNK = 65536
+    BATAS_INKREMENTAL = 1024  # tambah_banyak yang lebih besar memicu bangun ulang penuh
+    
+    def __init__(self):
+        self.__utama: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}  # field -> (kode, offset, posisi)
+        self.__delta: Dict[str, Dict[int, array]] = {field: {} for field in self.FIELD}
+        self.__jumlah_utama = 0  # Record yang tercakup index utama
+        self.__perubahan = 0  # Record delta + record basi sejak bangun terakhir
+        self.__kotor = True
+        self.__kunci = threading.Lock()  # Melindungi bangun ulang malas dari pencarian paralel
+    
+    @staticmethod
+    def _kode(teks: str) -> set:
+        """Kode trigram unik dari teks (titik kode 21-bit x 3 = 63-bit)"""
+        teks = teks.lower()
+        return {(ord(teks[i]) << 42) | (ord(teks[i + 1]) << 21) | ord(teks[i + 2]) for i in range(len(teks) - 2)}
+    
+    def _bangun_field(self, teks: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Membangun CSR satu field secara vektor, per chunk agar memori sementara terbatas"""
+        semua_kode, semua_posisi = [], []
+        for awal in range(0, len(teks), self.UKURAN_CHUNK):
+            arr = np.array(teks[awal:awal + self.UKURAN_CHUNK])
+            lebar = arr.dtype.itemsize // 4
+            if lebar < 3:
+                continue
+            titik = arr.view(np.uint32).reshape(len(arr), lebar).astype(np.uint64)
+            kode = (titik[:, :-2] << np.uint64(42)) | (titik[:, 1:-1] << np.uint64(21)) | titik[:, 2:]
+            ada = titik[:, 2:] != 0  # Karakter nol = padding di luar panjang teks
+            semua_kode.append(kode[ada])
+            semua_posisi.append((np.nonzero(ada)[0] + awal).astype(np.uint32))
+        
+        if not semua_kode:
+            return np.empty(0, np.uint64), np.zeros(1, np.int64), np.empty(0, np.uint32)
+        kode = np.concatenate(semua_kode)
+        posisi = np.concatenate(semua_posisi)
+        urut = np.argsort(kode, kind='stable')  # Stabil: posisi tetap naik dalam satu trigram
+        kode, posisi = kode[urut], posisi[urut]
+        # Trigram yang muncul dua kali di satu teks cukup dicatat sekali
+        unik = np.ones(len(kode), dtype=bool)
+        unik[1:] = (kode[1:] != kode[:-1]) | (posisi[1:] != posisi[:-1])
+        kode, posisi = kode[unik], posisi[unik]
+        awal_grup = np.flatnonzero(np.r_[True, kode[1:] != kode[:-1]])
+        return kode[awal_grup], np.append(awal_grup, len(kode)), posisi
+    
+    def bangun(self, data: List[Optional[Mahasiswa]]):
+        """Membangun ulang seluruh index dari array store (slot None diabaikan)"""
+        for field in self.FIELD:
+            teks = [getattr(m, field).lower() if m is not None else '' for m in data]
+            self.__utama[field] = self._bangun_field(teks)
+            self.__delta[field] = {}
+        self.__jumlah_utama = len(data)
+        self.__perubahan = 0
+        self.__kotor = False
+    
+    def tandai_kotor(self):
+        """Meminta bangun ulang penuh pada pencarian berikutnya (setelah muat massal/pemadatan)"""
+        self.__kotor = True
+    
+    def tambah(self, posisi: int, mahasiswa: Mahasiswa):
+        """Mendaftarkan satu record ke delta - O(panjang teks)"""
+        if self.__kotor:
+            return
+        for field in self.FIELD:
+            delta = self.__delta[field]
+            for kode in self._kode(getattr(mahasiswa, field)):
+                daftar = delta.get(kode)
+                if daftar is None:
+                    daftar = delta[kode] = array('I')
+                daftar.append(posisi)
+        self.__perubahan += 1
+    
+    def buang(self):
+        """Mencatat satu record basi (dihapus atau diganti); posting lama disaring saat verifikasi"""
+        self.__perubahan += 1
+    
+    def _posting(self, field: str, kode: int) -> np.ndarray:
+        kode_utama, offset, posisi = self.__utama[field]
+        i = np.searchsorted(kode_utama, kode)
+        if i < len(kode_utama) and kode_utama[i] == kode:
+            hasil = posisi[offset[i]:offset[i + 1]]
+        else:
+            hasil = posisi[:0]
+        delta = self.__delta[field].get(kode)
+        if delta:
+            hasil = np.concatenate([hasil, np.array(delta, dtype=np.uint32)])
+        return hasil
+    
+    def kandidat(self, data: List[Optional[Mahasiswa]], keyword: str, field: str) -> Optional[np.ndarray]:
+        """
+        Posisi kandidat (terurut, unik) yang mungkin memuat keyword pada field.
+        None jika keyword lebih pendek dari 3 karakter sehingga index tidak bisa mempersempit.
+        Dipanggil dengan kunci baca store dipegang.
+        """
+        semua_kode = self._kode(keyword)
+        if not semua_kode:
+            return None
+        
+        with self.__kunci:
+            if self.__kotor or self.__perubahan > max(self.BATAS_INKREMENTAL, self.__jumlah_utama // 2):
+                self.bangun(data)
+            daftar = sorted((self._posting(field, kode) for kode in semua_kode), key=len)
+        
+        hasil = np.unique(daftar[0])
+        for posting in daftar[1:]:
+            if not len(hasil) or len(posting) > 8 * len(hasil):
+                break  # Sisa posting terlalu besar; verifikasi kandidat lebih murah
+            hasil = np.intersect1d(hasil, posting)
+        return hasil
+
+class IndeksFuzzy:
+    """
+    Index jarak edit (Levenshtein) untuk pencarian nama yang toleran salah ketik.
+    Nama dipecah menjadi kata; setiap kata unik (kosakata) disimpan sebagai matriks
+    titik kode sehingga jarak keyword ke seluruh kosakata dihitung sekaligus dengan
+    NumPy (satu baris DP per huruf keyword, kandidat yang sudah melewati batas jarak
+    dibuang di tengah jalan). Nama yang sama dihitung sekali lalu dipetakan ke semua
+    baris yang memakainya.
+    """
+    
+    POLA_KATA = re.compile(r'[^\s.,]+')
+    
+    def __init__(self, nama: pd.Series):
+        """nama: kolom nama huruf kecil, berbaris sama dengan snapshot data"""
+        kode_nama, nama_unik = pd.factorize(nama)
+        # Baris per nama unik (CSR), urutan baris asli dipertahankan
+        self.__baris = np.argsort(kode_nama, kind='stable')
+        self.__offset_baris = np.r_[0, np.cumsum(np.bincount(kode_nama, minlength=len(nama_unik)))]
+        
+        # Kata unik per nama; pemetaan kata -> id kosakata dan nama -> kata lewat factorize
+        kata_per_nama = [set(self.POLA_KATA.findall(teks)) for teks in nama_unik.tolist()]
+        jumlah = np.fromiter(map(len, kata_per_nama), dtype=np.int64, count=len(kata_per_nama))
+        kode_kata, kosakata = pd.factorize(np.array(list(chain.from_iterable(kata_per_nama)), dtype=object))
+        id_nama = np.repeat(np.arange(len(nama_unik)), jumlah)
+        # Nama per kata (CSR); id nama sudah naik sehingga sort stabil menjaga urutannya
+        self.__nama_per_kata = id_nama[np.argsort(kode_kata, kind='stable')]
+        self.__offset_kata = np.r_[0, np.cumsum(np.bincount(kode_kata, minlength=len(kosakata)))]
+        
+        kata = np.asarray(kosakata, dtype=str)
+        lebar = max(kata.dtype.itemsize // 4, 1)
+        self.__titik = kata.view(np.uint32).reshape(len(kata), lebar)  # Titik kode per huruf, diisi 0
+        self.__panjang = np.char.str_len(kata)
+        self.__nama_unik = nama_unik
+    
+    @staticmethod
+    def _ambil_grup(isi: np.ndarray, offset: np.ndarray, grup: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Menggabungkan isi beberapa grup CSR berurutan; mengembalikan (isi, jumlah per grup)"""
+        awal = offset[grup]
+        jumlah = offset[grup + 1] - awal
+        indeks = np.repeat(awal - (np.cumsum(jumlah) - jumlah), jumlah) + np.arange(jumlah.sum())
+        return isi[indeks], jumlah
+    
+    @staticmethod
+    def _jarak(kata: np.ndarray, titik: np.ndarray, panjang: np.ndarray, maks: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Jarak Levenshtein kata (array titik kode) ke setiap baris titik; hanya kandidat
+        dengan jarak <= maks yang dikembalikan sebagai (indeks baris, jarak).
+        """
+        calon = np.flatnonzero(np.abs(panjang - len(kata)) <= maks)
+        titik, panjang = titik[calon], panjang[calon]
+        lebar = int(panjang.max(initial=0))
+        titik = titik[:, :lebar]
+        kolom = np.arange(lebar + 1)
+        sebelum = np.broadcast_to(kolom, (len(calon), lebar + 1))
+        for i, huruf in enumerate(kata, 1):
+            # Substitusi dan hapus dari baris sebelumnya; sisip (dari kiri) lewat minimum kumulatif
+            terbaik = np.empty_like(sebelum)
+            terbaik[:, 0] = i
+            np.minimum(sebelum[:, :-1] + (titik != huruf), sebelum[:, 1:] + 1, out=terbaik[:, 1:])
+            sebelum = np.minimum.accumulate(terbaik - kolom, axis=1) + kolom
+            masih = sebelum.min(axis=1) <= maks
+            if not masih.all():
+                calon, titik, panjang, sebelum = calon[masih], titik[masih], panjang[masih], sebelum[masih]
+        jarak = sebelum[np.arange(len(calon)), panjang]
+        cocok = jarak <= maks
+        return calon[cocok], jarak[cocok]
+    
+    def cari(self, keyword: str, maks_jarak: int = 2) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Posisi baris yang namanya memuat, untuk setiap kata keyword, sebuah kata dengan
+        jarak edit <= maks_jarak. Mengembalikan (posisi, total jarak) terurut dari yang
+        paling mirip, lalu berdasarkan nama dan urutan data.
+        """
+        semua_kata = self.POLA_KATA.findall(keyword.lower())
+        if not semua_kata:
+            return np.empty(0, np.int64), np.empty(0, np.int64)
+        
+        nama, total = None, None
+        for kata in semua_kata:
+            titik_kata = np.frombuffer(kata.encode('utf-32-le'), dtype=np.uint32)
+            id_kata, jarak = self._jarak(titik_kata, self.__titik, self.__panjang, maks_jarak)
+            # Nama yang memuat kata-kata cocok, dengan jarak terkecil per nama
+            id_nama, jumlah = self._ambil_grup(self.__nama_per_kata, self.__offset_kata, id_kata)
+            jarak_nama = np.repeat(jarak, jumlah)
+            urut = np.lexsort((jarak_nama, id_nama))
+            id_nama, jarak_nama = id_nama[urut], jarak_nama[urut]
+            pertama = np.ones(len(id_nama), dtype=bool)
+            pertama[1:] = id_nama[1:] != id_nama[:-1]
+            id_nama, jarak_nama = id_nama[pertama], jarak_nama[pertama]
+            # Semua kata keyword harus cocok (AND): jarak dijumlahkan
+            if nama is None:
+                nama, total = id_nama, jarak_nama
+            else:
+                nama, kiri, kanan = np.intersect1d(nama, id_nama, assume_unique=True, return_indices=True)
+                total = total[kiri] + jarak_nama[kanan]
+            if not len(nama):
+                break
+        
+        # Jarak sama diurutkan menurut nama (hanya nama yang cocok yang diurutkan)
+        urut = np.lexsort((np.asarray(self.__nama_unik[nama], dtype=str), total))
+        nama, total = nama[urut], total[urut]
+        posisi, jumlah = self._ambil_grup(self.__baris, self.__offset_baris, nama)
+        return posisi, np.repeat(total, jumlah)
+
+class IndeksPrefiks:
+    """
+    Index prefiks untuk autocomplete. Kuncinya NIM dan setiap kata nama (huruf kecil),
+    masing-masing menunjuk ke NIM pemiliknya. Disimpan sebagai dua list paralel yang
+    terurut menurut (kunci, NIM): trie yang diratakan, karena semua kunci berawalan p
+    menempati satu rentang yang ditemukan dengan bisect dan urutannya sudah alfabetis,
+    sehingga k saran pertama cukup diambil dari awal rentang - O(log n + k).
+    
+    Mutasi kecil disisipkan/dibuang dengan bisect; batch besar menandai index kotor dan
+    index dibangun ulang secara malas pada saran berikutnya (seperti IndeksTrigram).
+    """
+    
+    BATAS_INKREMENTAL = 64  # Batch yang lebih besar memicu bangun ulang malas
+    
+    def __init__(self):
+        self.__kunci: List[str] = []
+        self.__nim: List[str] = []
+        self.__kotor = True
+        self.__kunci_bangun = threading.Lock()  # Melindungi bangun ulang malas dari saran paralel
+    
+    @staticmethod
+    def _kata(teks: str) -> List[str]:
+        return IndeksFuzzy.POLA_KATA.findall(teks.lower())
+    
+    @staticmethod
+    def _kunci_record(mahasiswa: Mahasiswa) -> set:
+        return {mahasiswa.nim, *IndeksPrefiks._kata(mahasiswa.nama)}
+    
+    def bangun(self, data: Iterable[Optional[Mahasiswa]]):
+        """Membangun ulang seluruh index (slot None diabaikan)"""
+        kunci, nim = [], []
+        for m in data:
+            if m is not None:
+                for k in self._kunci_record(m):
+                    kunci.append(sys.intern(k))
+                    nim.append(m.nim)
+        # Dua sort stabil satu kunci lebih cepat dari sort tuple (kunci, NIM)
+        urut = sorted(range(len(nim)), key=nim.__getitem__)
+        urut.sort(key=kunci.__getitem__)
+        self.__kunci = [kunci[i] for i in urut]
+        self.__nim = [nim[i] for i in urut]
+        self.__kotor = False
+    
+    def tandai_kotor(self):
+        """Meminta bangun ulang penuh pada saran berikutnya"""
+        self.__kunci, self.__nim = [], []
+        self.__kotor = True
+    
+    def _posisi(self, kunci: str, nim: str) -> int:
+        awal = bisect.bisect_left(self.__kunci, kunci)
+        akhir = bisect.bisect_right(self.__kunci, kunci, awal)
+        return bisect.bisect_left(self.__nim, nim, awal, akhir)
+    
+    def tambah(self, mahasiswa: Mahasiswa):
+        if self.__kotor:
+            return
+        for kunci in self._kunci_record(mahasiswa):
+            i = self._posisi(kunci, mahasiswa.nim)
+            self.__kunci.insert(i, sys.intern(kunci))
+            self.__nim.insert(i, mahasiswa.nim)
+    
+    def buang(self, mahasiswa: Mahasiswa):
+        if self.__kotor:
+            return
+        for kunci in self._kunci_record(mahasiswa):
+            i = self._posisi(kunci, mahasiswa.nim)
+            if i < len(self.__nim) and self.__nim[i] == mahasiswa.nim and self.__kunci[i] == kunci:
+                del self.__kunci[i]
+                del self.__nim[i]
+    
+    def ganti_banyak(self, buang: List[Mahasiswa], tambah: List[Mahasiswa]):
+        """Membuang lalu menambah banyak record; batch besar menandai index kotor"""
+        if len(buang) + len(tambah) > self.BATAS_INKREMENTAL:
+            self.tandai_kotor()
+            return
+        for m in buang:
+            self.buang(m)
+        for m in tambah:
+            self.tambah(m)
+    
+    def lengkapi(self, muat_data: Callable[[], Iterable[Optional[Mahasiswa]]], teks: str, k: int,
+                 ambil) -> List[Mahasiswa]:
+        """
+        Sampai k mahasiswa yang setiap kata teks-nya mengawali NIM atau salah satu kata
+        nama. muat_data dipanggil hanya jika index perlu dibangun ulang; ambil: Callable[[str],
+        Optional[Mahasiswa]] mengambil record dari NIM. Rentang kata yang paling sempit
+        dipindai; kata lain diverifikasi pada record.
+        """
+        semua_kata = self._kata(teks)
+        if not semua_kata or k < 1:
+            return []
+        with self.__kunci_bangun:
+            if self.__kotor:
+                self.bangun(muat_data())
+            daftar_kunci, daftar_nim = self.__kunci, self.__nim
+        
+        def rentang(kata: str) -> Tuple[int, int]:
+            awal = bisect.bisect_left(daftar_kunci, kata)
+            return awal, bisect.bisect_left(daftar_kunci, DataMahasiswa._batas_prefiks(kata), awal)
+        
+        awal, akhir = min((rentang(kata) for kata in semua_kata), key=lambda r: r[1] - r[0])
+        hasil, dilihat = [], set()
+        for i in range(awal, akhir):  # islice akan melangkahi awal elemen satu per satu
+            nim = daftar_nim[i]
+            if nim in dilihat:
+                continue
+            dilihat.add(nim)
+            mahasiswa = ambil(nim)
+            if mahasiswa is None:
+                continue
+            if len(semua_kata) > 1:
+                kunci = self._kunci_record(mahasiswa)
+                if not all(any(x.startswith(kata) for x in kunci) for kata in semua_kata):
+                    continue
+            hasil.append(mahasiswa)
+            if len(hasil) >= k:
+                break
+        return hasil
+
+# ==============================
+# STATISTIK AGREGAT
+# ==============================
+
+class RingkasanStatistik:
+    """Statistik agregat satu versi data, siap dibaca oleh halaman dan laporan"""
+    
+    def __init__(self, total: int, per_jurusan: Dict[str, int], per_angkatan: Dict[str, int],
+                 dengan_email: int, total_panjang_nama: int, nama_depan_terbanyak: Optional[str]):
+        self.total = total
+        self.per_jurusan = per_jurusan  # Jurusan -> jumlah mahasiswa
+        self.per_angkatan = per_angkatan  # Angkatan -> jumlah mahasiswa
+        self.dengan_email = dengan_email
+        self.total_panjang_nama = total_panjang_nama
+        self.nama_depan_terbanyak = nama_depan_terbanyak
+    
+    @property
+    def rata_panjang_nama(self) -> float:
+        return self.total_panjang_nama / self.total if self.total else 0.0
+    
+    @property
+    def persen_email(self) -> float:
+        return self.dengan_email / self.total * 100 if self.total else 0.0
+    
+    @property
+    def jurusan_terbanyak(self) -> Optional[str]:
+        return max(self.per_jurusan, key=self.per_jurusan.get) if self.per_jurusan else None
+    
+    @staticmethod
+    def dari_dataframe(df: pd.DataFrame) -> 'RingkasanStatistik':
+        """Menghitung ringkasan untuk sebagian data (hasil filter) dengan operasi kolom - O(n)"""
+        per_jurusan = df['Jurusan'].value_counts(sort=False)
+        per_angkatan = df['Angkatan'].value_counts(sort=False)
+        nama_depan = df['Nama'].str.split(n=1).str[0].dropna().value_counts()
+        return RingkasanStatistik(
+            total=len(df),
+            per_jurusan={str(k): int(v) for k, v in per_jurusan.items() if v},
+            per_angkatan={str(k): int(v) for k, v in per_angkatan.items() if v},
+            dengan_email=int((df['Email'] != '').sum()),
+            total_panjang_nama=int(df['Nama'].str.len().sum()),
+            nama_depan_terbanyak=nama_depan.index[0] if len(nama_depan) else None,
+        )
+
+class StatistikAgregat:
+    """
+    Statistik agregat seluruh store yang diperbarui O(1) setiap mutasi: jumlah per
+    jurusan/angkatan, jumlah yang memiliki email, total panjang nama, dan nama depan
+    terbanyak. Nama depan disimpan dalam ember per jumlah kemunculan sehingga nilai
+    maksimum tetap diketahui tanpa memindai ulang saat data ditambah atau dihapus.
+    Pemanggil memegang kunci store; kelas ini tidak mengunci sendiri.
+    """
+    
+    def __init__(self):
+        self.__total = 0
+        self.__per_jurusan: Dict[str, int] = {}
+        self.__per_angkatan: Dict[str, int] = {}
+        self.__dengan_email = 0
+        self.__panjang_nama = 0
+        self.__nama_depan: Dict[str, int] = {}  # Nama depan -> jumlah kemunculan
+        self.__ember: Dict[int, Dict[str, None]] = {}  # Jumlah -> nama depan dengan jumlah itu (dict = set berurutan)
+        self.__maks = 0  # Jumlah kemunculan nama depan terbanyak
+    
+    @staticmethod
+    def _nama_depan(nama: str) -> Optional[str]:
+        bagian = nama.split(None, 1)
+        return bagian[0] if bagian else None
+    
+    @staticmethod
+    def _geser(hitungan: Dict[str, int], kunci: str, delta: int):
+        """Mengubah satu hitungan; kunci dengan hitungan nol dibuang"""
+        nilai = hitungan.get(kunci, 0) + delta
+        if nilai:
+            hitungan[kunci] = nilai
+        else:
+            del hitungan[kunci]
+    
+    def _geser_nama_depan(self, nama: str, delta: int):
+        """Memindahkan nama depan ke ember jumlah barunya - O(1)"""
+        lama = self.__nama_depan.get(nama, 0)
+        baru = lama + delta
+        if lama:
+            ember = self.__ember[lama]
+            del ember[nama]
+            if not ember:
+                del self.__ember[lama]
+        if baru:
+            self.__nama_depan[nama] = baru
+            self.__ember.setdefault(baru, {})[nama] = None
+        else:
+            del self.__nama_depan[nama]
+        
+        if baru > self.__maks:
+            self.__maks = baru
+        elif lama == self.__maks and lama not in self.__ember:
+            self.__maks = baru  # Ember maksimum kosong; nama ini kini berada di ember satu tingkat di bawahnya
+    
+    def ubah(self, jurusan: str, angkatan: str, nama: str, email: str, delta: int):
+        """Menambah (delta=1) atau mengurangi (delta=-1) kontribusi satu mahasiswa"""
+        self.__total += delta
+        self._geser(self.__per_jurusan, jurusan, delta)
+        self._geser(self.__per_angkatan, angkatan, delta)
+        if email:
+            self.__dengan_email += delta
+        self.__panjang_nama += delta * len(nama)
+        depan = self._nama_depan(nama)
+        if depan:
+            self._geser_nama_depan(depan, delta)
+    
+    def tambah(self, mahasiswa: Mahasiswa):
+        self.ubah(mahasiswa.jurusan, mahasiswa.angkatan, mahasiswa.nama, mahasiswa.email, 1)
+    
+    def buang(self, mahasiswa: Mahasiswa):
+        self.ubah(mahasiswa.jurusan, mahasiswa.angkatan, mahasiswa.nama, mahasiswa.email, -1)
+    
+    def hitung_jurusan(self) -> Dict[str, int]:
+        return dict(self.__per_jurusan)
+    
+    def hitung_angkatan(self) -> Dict[str, int]:
+        return dict(self.__per_angkatan)
+    
+    def ringkasan(self) -> RingkasanStatistik:
+        """Salinan nilai saat ini - O(jumlah jurusan + angkatan)"""
+        ember = self.__ember.get(self.__maks)
+        return RingkasanStatistik(
+            total=self.__total,
+            per_jurusan=dict(self.__per_jurusan),
+            per_angkatan=dict(self.__per_angkatan),
+            dengan_email=self.__dengan_email,
+            total_panjang_nama=self.__panjang_nama,
+            nama_depan_terbanyak=next(iter(ember)) if ember else None,
+        )
+
+# ==============================
+# INHERITANCE & POLYMORPHISM
+# ==============================
+
+class SnapshotData(Sequence):
+    """
+    Snapshot baca data mahasiswa pada satu versi. Dibagi oleh semua pembaca
+    versi yang sama tanpa disalin; store menyalin array-nya sendiri (copy-on-write)
+    sebelum mengubah elemen yang masih terlihat oleh snapshot.
+    """
+    
+    def __init__(self, data: List[Mahasiswa], versi: int, panjang: Optional[int] = None):
+        self.__data = data
+        self.__panjang = len(data) if panjang is None else panjang  # Elemen yang ditambahkan sesudahnya tidak terlihat
+        self.versi = versi  # Versi data saat snapshot dibuat, naik monoton (kunci cache hilir)
+    
+    def __len__(self) -> int:
+        return self.__panjang
+    
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return self.__data[slice(*i.indices(self.__panjang))]
+        if i < 0:
+            i += self.__panjang
+        if not 0 <= i < self.__panjang:
+            raise IndexError("Indeks snapshot di luar jangkauan")
+        return self.__data[i]
+    
+    def __iter__(self) -> Iterator[Mahasiswa]:
+        # Selalu dibatasi panjang snapshot: list yang sama bisa masih ditambah oleh store
+        return islice(self.__data, self.__panjang)
+    
+    def copy(self) -> List[Mahasiswa]:
+        """Salinan list biasa yang boleh diubah (dipakai algoritma pengurutan)"""
+        return self.__data[:self.__panjang]
+    
+    def ambil(self, posisi: np.ndarray) -> List[Mahasiswa]:
+        """Elemen-elemen pada posisi tertentu (hasil mask pencarian vektor)"""
+        data = self.__data
+        return [data[i] for i in posisi.tolist()]
+
+class TampilanUrutNim(Sequence):
+    """
+    Tampilan baca data mahasiswa yang terurut berdasarkan NIM (urutan teks).
+    Dipakai langsung oleh binary search tanpa mengurutkan ulang; isinya tidak
+    berubah walau store dimutasi setelah tampilan dibuat.
+    """
+    
+    def __init__(self, nims: Sequence, ambil):
+        self.__nims = nims  # NIM terurut
+        self.__ambil = ambil  # Callable(i) -> Mahasiswa ke-i dalam urutan NIM
+    
+    def __len__(self) -> int:
+        return len(self.__nims)
+    
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self.__ambil(j) for j in range(*i.indices(len(self.__nims)))]
+        if i < 0:
+            i += len(self.__nims)
+        if not 0 <= i < len(self.__nims):
+            raise IndexError("Indeks tampilan di luar jangkauan")
+        return self.__ambil(i)
+
+class DataMahasiswa(ABC):
+    """Abstract Base Class untuk manajemen data mahasiswa"""
+    
+    UKURAN_BATCH = 10_000  # Ukuran potongan default iter_batches (bisa diubah per panggilan)
+    
+    @abstractmethod
+    def tambah(self, mahasiswa: Mahasiswa) -> bool:
+        pass
+    
+    @abstractmethod
+    def hapus(self, nim: str) -> bool:
+        pass
+    
+    @abstractmethod
+    def cari(self, keyword: str) -> List[Mahasiswa]:
+        pass
+    
+    @abstractmethod
+    def get_semua(self) -> List[Mahasiswa]:
+        pass
+    
+    # Implementasi default O(n); backend boleh meng-override dengan versi yang lebih efisien
+    def filter(self, nim: str = "", nama: str = "", jurusan: Optional[str] = None,
+               angkatan: Optional[str] = None, urut: Optional[str] = None,
+               ascending: bool = True) -> List[Mahasiswa]:
+        """Menyaring (dan opsional mengurutkan) data berdasarkan beberapa kriteria sekaligus"""
+        data = self.get_semua()
+        if jurusan is not None:
+            data = [m for m in data if m.jurusan == jurusan]
+        if angkatan is not None:
+            data = [m for m in data if m.angkatan == angkatan]
+        return self._saring(data, nim, nama, urut, ascending)
+    
+    @staticmethod
+    def _saring(data: List[Mahasiswa], nim: str, nama: str, urut: Optional[str], ascending: bool) -> List[Mahasiswa]:
+        """Filter substring NIM/nama dan pengurutan di atas kandidat yang sudah dipersempit"""
+        if nim:
+            data = [m for m in data if nim in m.nim]
+        if nama:
+            data = [m for m in data if nama.lower() in m.nama.lower()]
+        if urut:
+            data = sorted(data, key=lambda m: getattr(m, urut), reverse=not ascending)
+        return data
+    
+    def daftar_jurusan(self) -> List[str]:
+        """Mengembalikan daftar jurusan unik secara terurut"""
+        return sorted(self.hitung_jurusan())
+    
+    def hapus_banyak(self, nims: Iterable[str]) -> int:
+        """Menghapus banyak NIM sekaligus; NIM yang tidak ada dilewati. Mengembalikan jumlah yang terhapus"""
+        return sum(1 for nim in set(nims) if self.hapus(nim))
+    
+    @staticmethod
+    def _cek_edit_banyak(perubahan: Dict[str, Mahasiswa], ada) -> None:
+        """
+        Validasi batch edit sekali di depan (ada: Callable[[str], bool] untuk NIM di store).
+        NIM baru harus sama dengan NIM lamanya atau belum dipakai siapa pun, termasuk
+        record lain di batch, sehingga urutan penerapan (dan replay journal) tidak berpengaruh.
+        """
+        dipakai = set()
+        for nim_lama, baru in perubahan.items():
+            if not ada(nim_lama):
+                raise ValueError(f"Mahasiswa dengan NIM {nim_lama} tidak ditemukan")
+            if baru.nim in dipakai or (baru.nim != nim_lama and ada(baru.nim)):
+                raise ValueError(f"Mahasiswa dengan NIM {baru.nim} sudah ada")
+            dipakai.add(baru.nim)
+    
+    def edit_banyak(self, perubahan: Dict[str, Mahasiswa]) -> int:
+        """Mengedit banyak mahasiswa (NIM lama -> data baru); seluruh batch divalidasi dulu, lalu diterapkan"""
+        self._cek_edit_banyak(perubahan, lambda nim: self.get_by_nim(nim) is not None)
+        return sum(1 for nim_lama, baru in perubahan.items() if self.edit(nim_lama, baru))
+    
+    @staticmethod
+    def _cek_batch(ukuran: Optional[int], sebagai: str) -> int:
+        if sebagai not in ('list', 'dataframe'):
+            raise ValueError(f"Bentuk potongan tidak dikenal: {sebagai}")
+        ukuran = DataMahasiswa.UKURAN_BATCH if ukuran is None else ukuran
+        if ukuran < 1:
+            raise ValueError("Ukuran potongan minimal 1")
+        return ukuran
+    
+    def iter_batches(self, ukuran: Optional[int] = None, sebagai: str = 'list') -> Iterator:
+        """
+        Mengiterasi seluruh data per potongan `ukuran` record dari satu snapshot.
+        sebagai='list' menghasilkan List[Mahasiswa], 'dataframe' menghasilkan DataFrame
+        berkolom sama dengan ke_dataframe(). Setiap generator punya posisinya sendiri.
+        """
+        ukuran = self._cek_batch(ukuran, sebagai)
+        snapshot = self.snapshot()
+        for awal in range(0, len(snapshot), ukuran):
+            potongan = snapshot[awal:awal + ukuran]
+            yield self.ke_dataframe(potongan) if sebagai == 'dataframe' else potongan
+    
+    def snapshot(self) -> SnapshotData:
+        """Snapshot baca seluruh data beserta versinya (default: dibangun dari get_semua)"""
+        return SnapshotData(list(self.get_semua()), self.versi)
+    
+    def urut_nim(self) -> Sequence:
+        """Data terurut berdasarkan NIM, siap untuk binary search"""
+        data = sorted(self.get_semua(), key=lambda m: m.nim)
+        return TampilanUrutNim([m.nim for m in data], data.__getitem__)
+    
+    def rentang_nim(self, awal: str, akhir: str) -> List[Mahasiswa]:
+        """Mahasiswa dengan awal <= NIM <= akhir, terurut berdasarkan NIM"""
+        return [m for m in self.urut_nim() if awal <= m.nim <= akhir]
+    
+    def prefiks_nim(self, prefiks: str) -> List[Mahasiswa]:
+        """Mahasiswa yang NIM-nya diawali prefiks, terurut berdasarkan NIM"""
+        return [m for m in self.urut_nim() if m.nim.startswith(prefiks)]
+    
+    @staticmethod
+    def _batas_prefiks(prefiks: str) -> str:
+        """Teks terkecil yang lebih besar dari semua teks berawalan prefiks (untuk pencarian rentang)"""
+        return prefiks + '\U0010ffff'
+    
+    def tabel_pencarian(self) -> Tuple[Sequence, pd.DataFrame]:
+        """
+        Snapshot data beserta kolom teks huruf kecil berbaris sama (nim, nama, jurusan,
+        angkatan, email) untuk pencarian vektor. Dibangun sekali per versi data lalu
+        dipakai ulang oleh semua pencarian dan sesi sampai data berubah.
+        """
+        cache = getattr(self, '_cache_tabel_pencarian', None)
+        if cache is not None and cache[0] == self.versi:
+            return cache[1], cache[2]
+        data = self.snapshot()
+        df = self.ke_dataframe(data)
+        frame = pd.DataFrame({kolom.lower(): df[kolom].astype(TIPE_TEKS_VEKTOR).str.lower() for kolom in df.columns})
+        for kolom in ('jurusan', 'angkatan'):
+            frame[kolom] = frame[kolom].astype('category')  # Sedikit nilai unik: == cukup membandingkan kode
+        self._cache_tabel_pencarian = (data.versi, data, frame)
+        return data, frame
+    
+    BATAS_SARAN = 10  # Jumlah saran autocomplete default
+    
+    def lengkapi(self, teks: str, k: int = BATAS_SARAN) -> List[Mahasiswa]:
+        """
+        Top-k saran autocomplete untuk input NIM/nama: mahasiswa yang setiap kata teks-nya
+        mengawali NIM atau salah satu kata nama, urut alfabetis kunci yang cocok lalu NIM.
+        Default: index prefiks dibangun ulang dari snapshot sekali per versi data.
+        """
+        cache = getattr(self, '_cache_indeks_prefiks', None)
+        if cache is None or cache[0] != self.versi:
+            cache = self._cache_indeks_prefiks = (self.versi, IndeksPrefiks())
+        return cache[1].lengkapi(self.snapshot, teks, k, self.get_by_nim)
+    
+    def indeks_fuzzy(self) -> Tuple[Sequence, IndeksFuzzy]:
+        """Snapshot data beserta index jarak edit nama-nya; dibangun sekali per versi data"""
+        cache = getattr(self, '_cache_indeks_fuzzy', None)
+        if cache is not None and cache[0] == self.versi:
+            return cache[1], cache[2]
+        data, frame = self.tabel_pencarian()
+        indeks = IndeksFuzzy(frame['nama'])
+        self._cache_indeks_fuzzy = (data.versi, data, indeks)
+        return data, indeks
+    
+    def cari_teks(self, keyword: str, by: Optional[str] = None) -> List[Mahasiswa]:
+        """
+        Pencarian substring pada satu field ('nama', 'nim', 'email') atau semua field (by=None),
+        dengan hasil yang sama seperti linear/sequential search
+        """
+        if by is None:
+            return AlgoritmaPencarian.sequential_search(self.get_semua(), keyword)
+        return AlgoritmaPencarian.linear_search(self.get_semua(), keyword, by)
+    
+    def hitung_jurusan(self) -> Dict[str, int]:
+        """Jumlah mahasiswa per jurusan"""
+        hitungan = {}
+        for m in self.get_semua():
+            hitungan[m.jurusan] = hitungan.get(m.jurusan, 0) + 1
+        return hitungan
+    
+    def hitung_angkatan(self) -> Dict[str, int]:
+        """Jumlah mahasiswa per angkatan"""
+        hitungan = {}
+        for m in self.get_semua():
+            hitungan[m.angkatan] = hitungan.get(m.angkatan, 0) + 1
+        return hitungan
+    
+    def statistik(self) -> RingkasanStatistik:
+        """Statistik agregat seluruh data (default: dihitung ulang dari DataFrame - O(n))"""
+        return RingkasanStatistik.dari_dataframe(self.ke_dataframe())
+    
+    def ke_dataframe(self, data: Optional[Iterable[Mahasiswa]] = None) -> pd.DataFrame:
+        """Membuat DataFrame (kolom NIM, Nama, Jurusan, Angkatan, Email) dari data atau seluruh store"""
+        if data is None:
+            data = self.get_semua()
+        data = list(data)
+        return pd.DataFrame({
+            'NIM': [m.nim for m in data],
+            'Nama': [m.nama for m in data],
+            'Jurusan': [m.jurusan for m in data],
+            'Angkatan': [m.angkatan for m in data],
+            'Email': [m.email for m in data],
+        })
+
+class HasilTambahBanyak:
+    """Ringkasan hasil penambahan data mahasiswa secara massal"""
+    
+    def __init__(self):
+        self.berhasil = 0  # Jumlah record yang masuk ke store
+        self.ditolak: List[Dict] = []  # Record yang ditolak beserta alasannya
+    
+    def tolak(self, baris: int, mahasiswa: Mahasiswa, alasan: str):
+        """Mencatat satu record yang ditolak"""
+        self.ditolak.append({'baris': baris, 'nim': mahasiswa.nim, 'nama': mahasiswa.nama, 'alasan': alasan})
     
-    # Getter methods
     @property
-    def nim(self) -> str:
-        return self.__nim
+    def jumlah_ditolak(self) -> int:
+        return len(self.ditolak)
+    
+    def __str__(self) -> str:
+        return f"{self.berhasil} berhasil, {self.jumlah_ditolak} ditolak"
+
+class ManajemenMahasiswa(DataMahasiswa):
+    """Kelas untuk mengelola data mahasiswa menggunakan array dan pointer"""
+    
+    def __init__(self, versi_awal: int = 0):
+        self.__data = []  # Private array untuk menyimpan data
+        self.__index = {}  # Hash index NIM -> posisi di array
+        self.__per_jurusan: Dict[str, set] = {}  # Index sekunder jurusan -> himpunan NIM
+        self.__per_angkatan: Dict[str, set] = {}  # Index sekunder angkatan -> himpunan NIM
+        self.__trigram = IndeksTrigram()  # Index substring nim/nama/email -> posisi di array
+        self.__urut_nim: List[str] = []  # NIM terurut, dipelihara dengan bisect
+        self.__urut_mhs: List[Mahasiswa] = []  # Objek sejajar dengan __urut_nim
+        self.__urut_dibagi = False  # True jika kedua list dipegang TampilanUrutNim (copy-on-write)
+        self.__prefiks = IndeksPrefiks()  # Autocomplete NIM/kata nama, dipelihara per mutasi
+        self.__statistik = StatistikAgregat()  # Diperbarui O(1) bersama index sekunder
+        self.__snapshot: Optional[SnapshotData] = None  # Snapshot versi terakhir, dibagi antar pembaca
+        self.__data_dibagi = False  # True jika __data dipegang snapshot (copy-on-write)
+        self.__lubang = 0  # Jumlah slot kosong (tombstone) di array
+        self.__versi = versi_awal  # Naik setiap kali data berubah
+        self._kunci = ReadWriteLock()  # Store bisa dipakai bersama oleh banyak sesi
     
     @property
-    def nama(self) -> str:
-        return self.__nama
+    def versi(self) -> int:
+        """Nomor versi data, naik monoton pada setiap mutasi"""
+        return self.__versi
+    
+    def _masuk_indeks(self, mahasiswa: Mahasiswa):
+        """Mendaftarkan NIM ke index sekunder (kunci tulis sudah dipegang)"""
+        self.__per_jurusan.setdefault(mahasiswa.jurusan, set()).add(mahasiswa.nim)
+        self.__per_angkatan.setdefault(mahasiswa.angkatan, set()).add(mahasiswa.nim)
+        self.__statistik.tambah(mahasiswa)
+    
+    def _keluar_indeks(self, mahasiswa: Mahasiswa):
+        """Menghapus NIM dari index sekunder; kategori kosong ikut dibuang"""
+        for indeks, kunci in ((self.__per_jurusan, mahasiswa.jurusan), (self.__per_angkatan, mahasiswa.angkatan)):
+            nims = indeks[kunci]
+            nims.discard(mahasiswa.nim)
+            if not nims:
+                del indeks[kunci]
+        self.__statistik.buang(mahasiswa)
+    
+    def _data_milik_sendiri(self):
+        """Menyalin array sebelum elemennya ditimpa jika masih dipegang snapshot"""
+        if self.__data_dibagi:
+            self.__data = self.__data.copy()
+            self.__data_dibagi = False
+    
+    def _urut_milik_sendiri(self):
+        """Menyalin list terurut sebelum diubah jika masih dipegang tampilan"""
+        if self.__urut_dibagi:
+            self.__urut_nim = self.__urut_nim.copy()
+            self.__urut_mhs = self.__urut_mhs.copy()
+            self.__urut_dibagi = False
+    
+    def _urut_sisip(self, mahasiswa: Mahasiswa):
+        """Menyisipkan ke tampilan terurut - O(log n) cari + geser memori"""
+        self._urut_milik_sendiri()
+        i = bisect.bisect_left(self.__urut_nim, mahasiswa.nim)
+        self.__urut_nim.insert(i, mahasiswa.nim)
+        self.__urut_mhs.insert(i, mahasiswa)
+    
+    def _urut_buang(self, nim: str):
+        self._urut_milik_sendiri()
+        i = bisect.bisect_left(self.__urut_nim, nim)
+        del self.__urut_nim[i]
+        del self.__urut_mhs[i]
+    
+    # Implementasi metode abstract
+    def tambah(self, mahasiswa: Mahasiswa) -> bool:
+        """Menambahkan mahasiswa ke dalam array"""
+        with self._kunci.tulis():
+            # Cek duplikasi NIM - O(1) lewat hash index
+            if mahasiswa.nim in self.__index:
+                raise ValueError(f"Mahasiswa dengan NIM {mahasiswa.nim} sudah ada")
+            
+            self.__index[mahasiswa.nim] = len(self.__data)
+            self.__data.append(mahasiswa)
+            self._masuk_indeks(mahasiswa)
+            self.__trigram.tambah(len(self.__data) - 1, mahasiswa)
+            self._urut_sisip(mahasiswa)
+            self.__prefiks.tambah(mahasiswa)
+            self.__versi += 1
+            return True
+    
+    def tambah_banyak(self, daftar_mahasiswa: Iterable[Mahasiswa], validasi: bool = True) -> HasilTambahBanyak:
+        """
+        Menambahkan banyak mahasiswa sekaligus dalam satu kali lintasan.
+        Record yang tidak valid atau NIM-nya duplikat (dengan store maupun
+        dengan record lain di batch) dicatat di hasil, bukan di-raise.
+        validasi=False melewati cek regex untuk sumber yang sudah tervalidasi
+        (misalnya snapshot biner milik aplikasi sendiri).
+        """
+        hasil = HasilTambahBanyak()
+        baru = []
+        
+        with self._kunci.tulis():
+            data = self.__data
+            index = self.__index
+            
+            for baris, m in enumerate(daftar_mahasiswa, 1):
+                alasan = m._cek_validasi() if validasi else None
+                if alasan:
+                    hasil.tolak(baris, m, alasan)
+                elif m.nim in index:
+                    hasil.tolak(baris, m, f"Mahasiswa dengan NIM {m.nim} sudah ada")
+                else:
+                    index[m.nim] = len(data)
+                    data.append(m)
+                    self._masuk_indeks(m)
+                    baru.append(m)
+                    hasil.berhasil += 1
+                    if hasil.berhasil <= IndeksTrigram.BATAS_INKREMENTAL:
+                        self.__trigram.tambah(len(data) - 1, m)
+            
+            if hasil.berhasil > IndeksTrigram.BATAS_INKREMENTAL:
+                self.__trigram.tandai_kotor()  # Batch besar: bangun ulang vektor lebih murah
+                baru.sort(key=lambda m: m.nim)
+                if self.__urut_nim and baru[0].nim < self.__urut_nim[-1]:
+                    # Tampilan terurut: satu kali sort (timsort menggabungkan run yang sudah terurut)
+                    self.__urut_mhs = sorted(self.__urut_mhs + baru, key=lambda m: m.nim)
+                    self.__urut_nim = [m.nim for m in self.__urut_mhs]
+                    self.__urut_dibagi = False
+                else:
+                    # Semua NIM baru di atas NIM terbesar (misalnya impor angkatan baru): cukup disambung
+                    self._urut_milik_sendiri()
+                    self.__urut_mhs.extend(baru)
+                    self.__urut_nim.extend(m.nim for m in baru)
+            else:
+                for m in baru:
+                    self._urut_sisip(m)
+            self.__prefiks.ganti_banyak([], baru)
+            if hasil.berhasil:
+                self.__versi += 1
+        
+        return hasil
+    
+    def hapus(self, nim: str) -> bool:
+        """Menghapus mahasiswa berdasarkan NIM"""
+        with self._kunci.tulis():
+            posisi = self.__index.pop(nim, None)
+            if posisi is None:
+                return False
+            
+            # Slot ditandai kosong agar posisi elemen lain tidak bergeser
+            self._keluar_indeks(self.__data[posisi])
+            self.__trigram.buang()
+            self._urut_buang(nim)
+            self.__prefiks.buang(self.__data[posisi])
+            self._data_milik_sendiri()
+            self.__data[posisi] = None
+            self.__lubang += 1
+            if self.__lubang > len(self.__data) // 2:
+                self._padatkan()
+            self.__versi += 1
+            return True
+    
+    def _kandidat_teks(self, keyword: str, field: Iterable[str]) -> List[Mahasiswa]:
+        """
+        Record yang mungkin memuat keyword di salah satu field, dipersempit lewat index trigram.
+        Semua record jika keyword terlalu pendek. Dipanggil dengan kunci baca dipegang.
+        """
+        posisi = None
+        for f in field:
+            kandidat = self.__trigram.kandidat(self.__data, keyword, f)
+            if kandidat is None:
+                return [m for m in self.__data if m is not None]
+            posisi = kandidat if posisi is None else np.union1d(posisi, kandidat)
+        data = self.__data
+        return [data[p] for p in posisi.tolist() if data[p] is not None]
+    
+    def cari(self, keyword: str) -> List[Mahasiswa]:
+        """Mencari mahasiswa berdasarkan keyword (NIM atau Nama)"""
+        keyword = keyword.lower()
+        with self._kunci.baca():
+            kandidat = self._kandidat_teks(keyword, ('nim', 'nama'))
+        return [m for m in kandidat if keyword in m.nim.lower() or keyword in m.nama.lower()]
+    
+    def cari_teks(self, keyword: str, by: Optional[str] = None) -> List[Mahasiswa]:
+        """Pencarian substring lewat index trigram: kandidat dipersempit, lalu diverifikasi"""
+        with self._kunci.baca():
+            kandidat = self._kandidat_teks(keyword, (by,) if by else IndeksTrigram.FIELD)
+        if by is None:
+            return AlgoritmaPencarian.sequential_search(kandidat, keyword)
+        return AlgoritmaPencarian.linear_search(kandidat, keyword, by)
+    
+    def lengkapi(self, teks: str, k: int = DataMahasiswa.BATAS_SARAN) -> List[Mahasiswa]:
+        """Saran autocomplete dari index prefiks yang dipelihara per mutasi"""
+        with self._kunci.baca():
+            return self.__prefiks.lengkapi(lambda: self.__urut_mhs, teks, k, self._ambil_nim)
+    
+    def _ambil_nim(self, nim: str) -> Optional[Mahasiswa]:
+        # Dipanggil di dalam kunci baca yang sudah dipegang (ReadWriteLock tidak reentrant)
+        posisi = self.__index.get(nim)
+        return None if posisi is None else self.__data[posisi]
+    
+    # Metode tambahan
+    def edit(self, nim_lama: str, mahasiswa_baru: Mahasiswa) -> bool:
+        """Mengedit data mahasiswa"""
+        with self._kunci.tulis():
+            posisi = self.__index.get(nim_lama)
+            if posisi is None:
+                return False
+            
+            # Cek jika NIM baru sudah ada (kecuali NIM sama)
+            if nim_lama != mahasiswa_baru.nim:
+                if mahasiswa_baru.nim in self.__index:
+                    raise ValueError(f"Mahasiswa dengan NIM {mahasiswa_baru.nim} sudah ada")
+                del self.__index[nim_lama]
+                self.__index[mahasiswa_baru.nim] = posisi
+            
+            self._keluar_indeks(self.__data[posisi])
+            self._masuk_indeks(mahasiswa_baru)
+            self.__trigram.buang()
+            self.__trigram.tambah(posisi, mahasiswa_baru)
+            self._urut_buang(nim_lama)
+            self._urut_sisip(mahasiswa_baru)
+            self.__prefiks.buang(self.__data[posisi])
+            self.__prefiks.tambah(mahasiswa_baru)
+            self._data_milik_sendiri()
+            self.__data[posisi] = mahasiswa_baru
+            self.__versi += 1
+            return True
+    
+    def _urut_ganti_banyak(self, buang: set, tambah: List[Mahasiswa]):
+        """
+        Menerapkan banyak perubahan ke tampilan terurut. Sedikit perubahan memakai bisect
+        per record; batch besar menyaring dan mengurutkan ulang sekali - O(n log n).
+        """
+        if len(buang) + len(tambah) <= 64:
+            for nim in buang:
+                self._urut_buang(nim)
+            for m in tambah:
+                self._urut_sisip(m)
+            return
+        sisa = [m for m in self.__urut_mhs if m.nim not in buang]
+        if tambah:
+            sisa = sorted(sisa + tambah, key=lambda m: m.nim)
+        self.__urut_mhs = sisa
+        self.__urut_nim = [m.nim for m in sisa]
+        self.__urut_dibagi = False
+    
+    def hapus_banyak(self, nims: Iterable[str]) -> int:
+        """
+        Menghapus banyak NIM dalam satu kunci tulis dan satu lintasan: slot ditandai
+        kosong, index diperbarui per NIM - O(1), tampilan terurut disaring sekali.
+        """
+        with self._kunci.tulis():
+            terhapus = set()
+            lama = []
+            for nim in nims:
+                posisi = self.__index.pop(nim, None)
+                if posisi is None:
+                    continue
+                if not terhapus:
+                    self._data_milik_sendiri()
+                self._keluar_indeks(self.__data[posisi])
+                lama.append(self.__data[posisi])
+                self.__data[posisi] = None
+                self.__trigram.buang()
+                terhapus.add(nim)
+            
+            if terhapus:
+                self._urut_ganti_banyak(terhapus, [])
+                self.__prefiks.ganti_banyak(lama, [])
+                self.__lubang += len(terhapus)
+                if self.__lubang > len(self.__data) // 2:
+                    self._padatkan()
+                self.__versi += 1
+            return len(terhapus)
+    
+    def edit_banyak(self, perubahan: Dict[str, Mahasiswa]) -> int:
+        """
+        Mengedit banyak mahasiswa dalam satu kunci tulis. Keunikan NIM divalidasi sekali
+        untuk seluruh batch sebelum ada yang diubah, jadi batch diterapkan utuh atau tidak sama sekali.
+        """
+        with self._kunci.tulis():
+            self._cek_edit_banyak(perubahan, self.__index.__contains__)
+            if not perubahan:
+                return 0
+            
+            self._data_milik_sendiri()
+            besar = len(perubahan) > IndeksTrigram.BATAS_INKREMENTAL
+            lama = []
+            for nim_lama, baru in perubahan.items():
+                posisi = self.__index.pop(nim_lama)
+                self.__index[baru.nim] = posisi
+                self._keluar_indeks(self.__data[posisi])
+                lama.append(self.__data[posisi])
+                self._masuk_indeks(baru)
+                self.__data[posisi] = baru
+                self.__trigram.buang()
+                if not besar:
+                    self.__trigram.tambah(posisi, baru)
+            if besar:
+                self.__trigram.tandai_kotor()
+            
+            self._urut_ganti_banyak(set(perubahan), list(perubahan.values()))
+            self.__prefiks.ganti_banyak(lama, list(perubahan.values()))
+            self.__versi += 1
+            return len(perubahan)
+    
+    def _padatkan(self):
+        """
+        Membuang slot kosong dari array dan membangun ulang index - O(n), diamortisasi.
+        Dipanggil saat kunci tulis sudah dipegang.
+        """
+        self.__data = [m for m in self.__data if m is not None]
+        self.__data_dibagi = False
+        self.__index = {m.nim: i for i, m in enumerate(self.__data)}
+        self.__trigram.tandai_kotor()  # Posisi bergeser
+        self.__lubang = 0
+    
+    def snapshot(self) -> SnapshotData:
+        """
+        Snapshot versi saat ini. Pembaca versi yang sama berbagi satu objek; tanpa slot
+        kosong snapshot memakai array store langsung (penambahan di ujung tidak terlihat,
+        penimpaan elemen menyalin array lebih dulu), jadi tidak ada salinan per pembacaan.
+        """
+        with self._kunci.baca():
+            snapshot = self.__snapshot
+            if snapshot is not None and snapshot.versi == self.__versi:
+                return snapshot
+            if self.__lubang:
+                snapshot = SnapshotData([m for m in self.__data if m is not None], self.__versi)
+            else:
+                self.__data_dibagi = True
+                snapshot = SnapshotData(self.__data, self.__versi, len(self.__data))
+            self.__snapshot = snapshot
+            return snapshot
+    
+    def get_semua(self) -> SnapshotData:
+        """Mengembalikan semua data mahasiswa sebagai snapshot baca (gunakan .copy() untuk list yang bisa diubah)"""
+        return self.snapshot()
+    
+    def get_by_nim(self, nim: str) -> Optional[Mahasiswa]:
+        """Mengembalikan mahasiswa berdasarkan NIM"""
+        with self._kunci.baca():
+            posisi = self.__index.get(nim)
+            if posisi is None:
+                return None
+            return self.__data[posisi]
+    
+    def jumlah(self) -> int:
+        """Mengembalikan jumlah mahasiswa"""
+        return len(self.__index)
+    
+    def filter(self, nim: str = "", nama: str = "", jurusan: Optional[str] = None,
+               angkatan: Optional[str] = None, urut: Optional[str] = None,
+               ascending: bool = True) -> List[Mahasiswa]:
+        """Filter lewat index trigram (NIM/nama) dan index sekunder (jurusan/angkatan)"""
+        with self._kunci.baca():
+            posisi = None
+            for field, keyword in (('nim', nim), ('nama', nama)):
+                if keyword:
+                    kandidat = self.__trigram.kandidat(self.__data, keyword, field)
+                    if kandidat is not None:
+                        posisi = kandidat if posisi is None else np.intersect1d(posisi, kandidat)
+            kandidat = None
+            if jurusan is not None:
+                kandidat = self.__per_jurusan.get(jurusan, set())
+            if angkatan is not None:
+                nims = self.__per_angkatan.get(angkatan, set())
+                kandidat = nims if kandidat is None else kandidat & nims
+            
+            if posisi is not None:
+                # Posisi dari trigram sudah terurut; lalu disaring dengan himpunan NIM index sekunder
+                data = [self.__data[p] for p in posisi.tolist()]
+                data = [m for m in data if m is not None and (kandidat is None or m.nim in kandidat)]
+            elif kandidat is None:
+                data = [m for m in self.__data if m is not None]
+            elif len(kandidat) * 16 < len(self.__data):
+                # Urutan penambahan dipertahankan lewat posisi di array
+                data = [self.__data[p] for p in sorted(self.__index[n] for n in kandidat)]
+            else:
+                # Kandidat besar: satu scan (jurusan/angkatan di-intern) lebih murah daripada mengurutkan posisinya
+                data = [m for m in self.__data if m is not None
+                        and (jurusan is None or m.jurusan == jurusan)
+                        and (angkatan is None or m.angkatan == angkatan)]
+        return self._saring(data, nim, nama, urut, ascending)
+    
+    def urut_nim(self) -> Sequence:
+        """Tampilan terurut NIM yang dipelihara store - O(1), tanpa sorting"""
+        with self._kunci.baca():
+            self.__urut_dibagi = True  # Mutasi berikutnya menyalin list sebelum mengubahnya
+            return TampilanUrutNim(self.__urut_nim, self.__urut_mhs.__getitem__)
+    
+    def rentang_nim(self, awal: str, akhir: str) -> List[Mahasiswa]:
+        """Mahasiswa dengan awal <= NIM <= akhir lewat bisect - O(log n + hasil)"""
+        with self._kunci.baca():
+            kiri = bisect.bisect_left(self.__urut_nim, awal)
+            kanan = bisect.bisect_right(self.__urut_nim, akhir)
+            return self.__urut_mhs[kiri:kanan]
+    
+    def prefiks_nim(self, prefiks: str) -> List[Mahasiswa]:
+        """Mahasiswa yang NIM-nya diawali prefiks lewat bisect - O(log n + hasil)"""
+        with self._kunci.baca():
+            kiri = bisect.bisect_left(self.__urut_nim, prefiks)
+            kanan = bisect.bisect_left(self.__urut_nim, self._batas_prefiks(prefiks))
+            return self.__urut_mhs[kiri:kanan]
+    
+    def hitung_jurusan(self) -> Dict[str, int]:
+        """Jumlah mahasiswa per jurusan dari statistik yang dipelihara - O(jumlah jurusan)"""
+        with self._kunci.baca():
+            return self.__statistik.hitung_jurusan()
+    
+    def hitung_angkatan(self) -> Dict[str, int]:
+        """Jumlah mahasiswa per angkatan dari statistik yang dipelihara - O(jumlah angkatan)"""
+        with self._kunci.baca():
+            return self.__statistik.hitung_angkatan()
+    
+    def statistik(self) -> RingkasanStatistik:
+        """Statistik agregat yang dipelihara per mutasi - tanpa memindai data"""
+        with self._kunci.baca():
+            return self.__statistik.ringkasan()
+    
+    def __iter__(self) -> Iterator[Mahasiswa]:
+        """Iterator baru di atas snapshot versi saat ini; tiap iterasi berdiri sendiri"""
+        return iter(self.snapshot())
+
+# ==============================
+# SQLITE BACKEND
+# ==============================
+
+class ManajemenMahasiswaSQLite(DataMahasiswa):
+    """
+    Backend data mahasiswa berbasis file SQLite (mode WAL).
+    Setiap perubahan langsung tahan lama tanpa menulis ulang seluruh dataset,
+    dan filter/pengurutan dijalankan sebagai query SQL yang memakai index.
+    """
+    
+    KOLOM = "nim, nama, jurusan, angkatan, email"
+    
+    def __init__(self, path: str = 'data_mahasiswa.db'):
+        self.__path = path
+        self.__lokal = threading.local()  # Satu koneksi per thread
+        self.__versi = 0
+        self.__kunci_versi = threading.Lock()
+        
+        conn = self._koneksi()
+        with conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS mahasiswa (
+                    nim TEXT PRIMARY KEY,
+                    nama TEXT NOT NULL,
+                    jurusan TEXT NOT NULL,
+                    angkatan TEXT NOT NULL,
+                    email TEXT NOT NULL DEFAULT ''
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_mahasiswa_jurusan ON mahasiswa(jurusan)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_mahasiswa_angkatan ON mahasiswa(angkatan)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_mahasiswa_email ON mahasiswa(email)")
+    
+    def _koneksi(self) -> sqlite3.Connection:
+        """Mengembalikan koneksi milik thread saat ini (dibuat saat pertama dipakai)"""
+        conn = getattr(self.__lokal, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.__path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self.__lokal.conn = conn
+        return conn
+    
+    def _naikkan_versi(self):
+        with self.__kunci_versi:
+            self.__versi += 1
     
     @property
-    def jurusan(self) -> str:
-        return self.__jurusan
+    def versi(self) -> int:
+        """Nomor versi data, naik monoton pada setiap mutasi"""
+        return self.__versi
+    
+    @staticmethod
+    def _ke_mahasiswa(row: Tuple) -> Mahasiswa:
+        return Mahasiswa(nim=row[0], nama=row[1], jurusan=row[2], angkatan=row[3], email=row[4])
+    
+    @staticmethod
+    def _pola_like(keyword: str) -> str:
+        """Membuat pola LIKE substring dengan karakter wildcard di-escape"""
+        keyword = keyword.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        return f"%{keyword}%"
+    
+    # Implementasi metode abstract
+    def tambah(self, mahasiswa: Mahasiswa) -> bool:
+        """Menambahkan mahasiswa ke dalam tabel"""
+        conn = self._koneksi()
+        try:
+            with conn:
+                conn.execute(f"INSERT INTO mahasiswa ({self.KOLOM}) VALUES (?, ?, ?, ?, ?)",
+                             (mahasiswa.nim, mahasiswa.nama, mahasiswa.jurusan, mahasiswa.angkatan, mahasiswa.email))
+        except sqlite3.IntegrityError:
+            raise ValueError(f"Mahasiswa dengan NIM {mahasiswa.nim} sudah ada")
+        self._naikkan_versi()
+        return True
+    
+    def tambah_banyak(self, daftar_mahasiswa: Iterable[Mahasiswa], validasi: bool = True) -> HasilTambahBanyak:
+        """Menambahkan banyak mahasiswa dalam satu transaksi"""
+        hasil = HasilTambahBanyak()
+        conn = self._koneksi()
+        sql = f"INSERT INTO mahasiswa ({self.KOLOM}) VALUES (?, ?, ?, ?, ?)"
+        
+        with conn:
+            for baris, m in enumerate(daftar_mahasiswa, 1):
+                alasan = m._cek_validasi() if validasi else None
+                if alasan:
+                    hasil.tolak(baris, m, alasan)
+                else:
+                    try:
+                        conn.execute(sql, (m.nim, m.nama, m.jurusan, m.angkatan, m.email))
+                        hasil.berhasil += 1
+                    except sqlite3.IntegrityError:
+                        hasil.tolak(baris, m, f"Mahasiswa dengan NIM {m.nim} sudah ada")
+        
+        if hasil.berhasil:
+            self._naikkan_versi()
+        return hasil
+    
+    def hapus(self, nim: str) -> bool:
+        """Menghapus mahasiswa berdasarkan NIM"""
+        conn = self._koneksi()
+        with conn:
+            terhapus = conn.execute("DELETE FROM mahasiswa WHERE nim = ?", (nim,)).rowcount
+        if terhapus:
+            self._naikkan_versi()
+        return terhapus > 0
+    
+    def hapus_banyak(self, nims: Iterable[str]) -> int:
+        """Menghapus banyak NIM dalam satu transaksi"""
+        conn = self._koneksi()
+        with conn:
+            terhapus = conn.executemany("DELETE FROM mahasiswa WHERE nim = ?", ((nim,) for nim in set(nims))).rowcount
+        if terhapus:
+            self._naikkan_versi()
+        return terhapus
+    
+    def edit_banyak(self, perubahan: Dict[str, Mahasiswa]) -> int:
+        """Mengedit banyak mahasiswa dalam satu transaksi setelah batch divalidasi"""
+        conn = self._koneksi()
+        with conn:
+            ada = lambda nim: conn.execute("SELECT 1 FROM mahasiswa WHERE nim = ?", (nim,)).fetchone() is not None
+            self._cek_edit_banyak(perubahan, ada)
+            conn.executemany(
+                "UPDATE mahasiswa SET nim = ?, nama = ?, jurusan = ?, angkatan = ?, email = ? WHERE nim = ?",
+                ((m.nim, m.nama, m.jurusan, m.angkatan, m.email, nim_lama) for nim_lama, m in perubahan.items()))
+        if perubahan:
+            self._naikkan_versi()
+        return len(perubahan)
+    
+    def cari(self, keyword: str) -> List[Mahasiswa]:
+        """Mencari mahasiswa berdasarkan keyword (NIM atau Nama)"""
+        pola = self._pola_like(keyword)
+        rows = self._koneksi().execute(
+            f"SELECT {self.KOLOM} FROM mahasiswa WHERE nim LIKE ? ESCAPE '\\' OR nama LIKE ? ESCAPE '\\' ORDER BY rowid",
+            (pola, pola)
+        )
+        return [self._ke_mahasiswa(row) for row in rows]
+    
+    def cari_teks(self, keyword: str, by: Optional[str] = None) -> List[Mahasiswa]:
+        """Pencarian substring di SQL: instr untuk NIM, LIKE (tanpa beda huruf) untuk nama/email"""
+        kondisi = []
+        parameter = []
+        for field in ((by,) if by else ('nama', 'nim', 'email')):
+            if field == 'nim':
+                kondisi.append("instr(nim, ?) > 0")
+                parameter.append(keyword)
+            elif field in ('nama', 'email'):
+                kondisi.append(f"{field} LIKE ? ESCAPE '\\'")
+                parameter.append(self._pola_like(keyword))
+        if not kondisi:
+            return []
+        rows = self._koneksi().execute(
+            f"SELECT {self.KOLOM} FROM mahasiswa WHERE {' OR '.join(kondisi)} ORDER BY rowid", parameter
+        )
+        return [self._ke_mahasiswa(row) for row in rows]
+    
+    # Metode tambahan
+    def edit(self, nim_lama: str, mahasiswa_baru: Mahasiswa) -> bool:
+        """Mengedit data mahasiswa (satu baris, tanpa menulis ulang dataset)"""
+        conn = self._koneksi()
+        try:
+            with conn:
+                diubah = conn.execute(
+                    "UPDATE mahasiswa SET nim = ?, nama = ?, jurusan = ?, angkatan = ?, email = ? WHERE nim = ?",
+                    (mahasiswa_baru.nim, mahasiswa_baru.nama, mahasiswa_baru.jurusan,
+                     mahasiswa_baru.angkatan, mahasiswa_baru.email, nim_lama)
+                ).rowcount
+        except sqlite3.IntegrityError:
+            raise ValueError(f"Mahasiswa dengan NIM {mahasiswa_baru.nim} sudah ada")
+        if diubah:
+            self._naikkan_versi()
+        return diubah > 0
+    
+    def get_semua(self) -> List[Mahasiswa]:
+        """Mengembalikan semua data mahasiswa sesuai urutan penambahan"""
+        rows = self._koneksi().execute(f"SELECT {self.KOLOM} FROM mahasiswa ORDER BY rowid")
+        return [self._ke_mahasiswa(row) for row in rows]
+    
+    def get_by_nim(self, nim: str) -> Optional[Mahasiswa]:
+        """Mengembalikan mahasiswa berdasarkan NIM"""
+        row = self._koneksi().execute(f"SELECT {self.KOLOM} FROM mahasiswa WHERE nim = ?", (nim,)).fetchone()
+        return self._ke_mahasiswa(row) if row else None
+    
+    def jumlah(self) -> int:
+        """Mengembalikan jumlah mahasiswa"""
+        return self._koneksi().execute("SELECT COUNT(*) FROM mahasiswa").fetchone()[0]
+    
+    def filter(self, nim: str = "", nama: str = "", jurusan: Optional[str] = None,
+               angkatan: Optional[str] = None, urut: Optional[str] = None,
+               ascending: bool = True) -> List[Mahasiswa]:
+        """Menyaring dan mengurutkan data langsung di SQL"""
+        kondisi = []
+        parameter = []
+        if nim:
+            kondisi.append("instr(nim, ?) > 0")
+            parameter.append(nim)
+        if nama:
+            kondisi.append("nama LIKE ? ESCAPE '\\'")
+            parameter.append(self._pola_like(nama))
+        if jurusan is not None:
+            kondisi.append("jurusan = ?")
+            parameter.append(jurusan)
+        if angkatan is not None:
+            kondisi.append("angkatan = ?")
+            parameter.append(angkatan)
+        
+        sql = f"SELECT {self.KOLOM} FROM mahasiswa"
+        if kondisi:
+            sql += " WHERE " + " AND ".join(kondisi)
+        if urut:
+            if urut not in ('nim', 'nama', 'jurusan', 'angkatan', 'email'):
+                raise ValueError(f"Kolom pengurutan tidak dikenal: {urut}")
+            sql += f" ORDER BY {urut} {'ASC' if ascending else 'DESC'}"
+        else:
+            sql += " ORDER BY rowid"
+        
+        return [self._ke_mahasiswa(row) for row in self._koneksi().execute(sql, parameter)]
+    
+    def urut_nim(self) -> Sequence:
+        """Seluruh data terurut NIM, dibaca berurutan dari index PRIMARY KEY (tanpa sort)"""
+        data = [self._ke_mahasiswa(row) for row in
+                self._koneksi().execute(f"SELECT {self.KOLOM} FROM mahasiswa ORDER BY nim")]
+        return TampilanUrutNim([m.nim for m in data], data.__getitem__)
+    
+    def rentang_nim(self, awal: str, akhir: str) -> List[Mahasiswa]:
+        """Rentang NIM sebagai range scan pada index PRIMARY KEY - O(log n + hasil)"""
+        rows = self._koneksi().execute(
+            f"SELECT {self.KOLOM} FROM mahasiswa WHERE nim BETWEEN ? AND ? ORDER BY nim", (awal, akhir))
+        return [self._ke_mahasiswa(row) for row in rows]
+    
+    def prefiks_nim(self, prefiks: str) -> List[Mahasiswa]:
+        """Prefiks NIM sebagai range scan pada index PRIMARY KEY - O(log n + hasil)"""
+        rows = self._koneksi().execute(
+            f"SELECT {self.KOLOM} FROM mahasiswa WHERE nim >= ? AND nim < ? ORDER BY nim",
+            (prefiks, self._batas_prefiks(prefiks)))
+        return [self._ke_mahasiswa(row) for row in rows]
+    
+    def daftar_jurusan(self) -> List[str]:
+        """Mengembalikan daftar jurusan unik (dibaca dari index)"""
+        rows = self._koneksi().execute("SELECT DISTINCT jurusan FROM mahasiswa ORDER BY jurusan")
+        return [row[0] for row in rows]
+    
+    def hitung_jurusan(self) -> Dict[str, int]:
+        """Jumlah mahasiswa per jurusan (GROUP BY di atas index jurusan)"""
+        return dict(self._koneksi().execute("SELECT jurusan, COUNT(*) FROM mahasiswa GROUP BY jurusan"))
+    
+    def hitung_angkatan(self) -> Dict[str, int]:
+        """Jumlah mahasiswa per angkatan (GROUP BY di atas index angkatan)"""
+        return dict(self._koneksi().execute("SELECT angkatan, COUNT(*) FROM mahasiswa GROUP BY angkatan"))
+    
+    def statistik(self) -> RingkasanStatistik:
+        """Statistik agregat dengan kueri agregat SQL (tanpa memuat baris ke Python)"""
+        conn = self._koneksi()
+        total, dengan_email, panjang = conn.execute(
+            "SELECT COUNT(*), COUNT(NULLIF(email, '')), COALESCE(SUM(length(nama)), 0) FROM mahasiswa").fetchone()
+        nama_depan = conn.execute(
+            "SELECT substr(trim(nama), 1, instr(trim(nama) || ' ', ' ') - 1) AS depan FROM mahasiswa "
+            "WHERE trim(nama) != '' GROUP BY depan ORDER BY COUNT(*) DESC LIMIT 1").fetchone()
+        return RingkasanStatistik(total, self.hitung_jurusan(), self.hitung_angkatan(),
+                                  dengan_email, panjang, nama_depan[0] if nama_depan else None)
+    
+    def __iter__(self):
+        """Iterasi streaming di atas cursor, tanpa memuat seluruh tabel"""
+        cursor = self._koneksi().execute(f"SELECT {self.KOLOM} FROM mahasiswa ORDER BY rowid")
+        for row in cursor:
+            yield self._ke_mahasiswa(row)
+    
+    def iter_batches(self, ukuran: Optional[int] = None, sebagai: str = 'list') -> Iterator:
+        """Potongan langsung dari cursor (fetchmany), memori tetap berapa pun ukuran tabel"""
+        ukuran = self._cek_batch(ukuran, sebagai)
+        cursor = self._koneksi().execute(f"SELECT {self.KOLOM} FROM mahasiswa ORDER BY rowid")
+        while True:
+            rows = cursor.fetchmany(ukuran)
+            if not rows:
+                break
+            if sebagai == 'dataframe':
+                yield pd.DataFrame(rows, columns=['NIM', 'Nama', 'Jurusan', 'Angkatan', 'Email'])
+            else:
+                yield [self._ke_mahasiswa(row) for row in rows]
+
+# ==============================
+# COLUMNAR BACKEND
+# ==============================
+
+class TampilanKolom:
+    """
+    Tampilan baca atas sebagian baris store kolom. Berperilaku seperti list
+    Mahasiswa untuk UI (len, indeks, slice, iterasi, copy), tetapi objek Mahasiswa
+    baru dibuat saat diakses. Sumbernya adalah frame satu versi data yang tidak
+    pernah diubah, sehingga tampilan tetap konsisten walau store berubah.
+    """
+    
+    UKURAN_BATCH = 4096
+    
+    def __init__(self, frame: pd.DataFrame, posisi: np.ndarray, versi: Optional[int] = None):
+        self.__frame = frame
+        self.__posisi = posisi  # Nomor baris (iloc) di frame
+        self.versi = versi  # Versi data asal frame (diisi untuk snapshot seluruh data)
+        self.__blok: Dict[int, List[Mahasiswa]] = {}  # Cache objek per batch untuk akses per indeks
+    
+    def _buat_banyak(self, posisi: np.ndarray) -> List[Mahasiswa]:
+        """Membuat objek Mahasiswa untuk baris-baris tertentu; kolom diambil per batch"""
+        bagian = self.__frame.iloc[posisi]
+        kolom = [bagian[nama].tolist() for nama in ('nim', 'nama', 'jurusan', 'angkatan', 'email')]
+        return [Mahasiswa(*baris) for baris in zip(*kolom)]
+    
+    def __len__(self) -> int:
+        return len(self.__posisi)
+    
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return self._buat_banyak(self.__posisi[i])
+        if i < 0:
+            i += len(self.__posisi)
+        if not 0 <= i < len(self.__posisi):
+            raise IndexError("Indeks tampilan di luar jangkauan")
+        # Akses per indeks (misalnya sequential search) membuat satu batch sekaligus
+        nomor, sisa = divmod(i, self.UKURAN_BATCH)
+        blok = self.__blok.get(nomor)
+        if blok is None:
+            awal = nomor * self.UKURAN_BATCH
+            blok = self.__blok[nomor] = self[awal:awal + self.UKURAN_BATCH]
+        return blok[sisa]
+    
+    def satu(self, i: int) -> Mahasiswa:
+        """Membuat satu objek tanpa cache batch (untuk akses acak seperti binary search)"""
+        return self._buat_banyak(self.__posisi[i:i + 1])[0]
     
-    @property
-    def angkatan(self) -> str:
-        return self.__angkatan
+    def __iter__(self) -> Iterator[Mahasiswa]:
+        for awal in range(0, len(self.__posisi), self.UKURAN_BATCH):
+            yield from self[awal:awal + self.UKURAN_BATCH]
     
-    @property
-    def email(self) -> str:
-        return self.__email
-    
-    # Setter methods
-    @nim.setter
-    def nim(self, nim: str):
-        if self._validasi_nim(nim):
-            self.__nim = nim
-        else:
-            raise ValueError("NIM tidak valid")
+    def copy(self) -> List[Mahasiswa]:
+        """Materialisasi menjadi list biasa (dipakai algoritma pengurutan)"""
+        return self[:]
     
-    @nama.setter
-    def nama(self, nama: str):
-        if self._validasi_nama(nama):
-            self.__nama = nama
-        else:
-            raise ValueError("Nama tidak valid")
+    def ambil(self, posisi: np.ndarray) -> 'TampilanKolom':
+        """Tampilan atas baris-baris pada posisi tertentu; objek tetap dibuat saat diakses"""
+        return TampilanKolom(self.__frame, self.__posisi[posisi], self.versi)
     
-    @jurusan.setter
-    def jurusan(self, jurusan: str):
-        self.__jurusan = jurusan
+    def ke_dataframe(self) -> pd.DataFrame:
+        """Mengambil baris-baris tampilan ini sebagai DataFrame tanpa membuat objek per baris"""
+        df = self.__frame.iloc[self.__posisi].reset_index(drop=True)
+        return df.rename(columns=ManajemenMahasiswaKolom.KOLOM_TABEL)
+
+class ManajemenMahasiswaKolom(DataMahasiswa):
+    """
+    Backend data mahasiswa berbentuk kolom (NumPy/pandas) untuk dataset jutaan baris.
+    NIM disimpan sebagai int64 beserta panjangnya (menjaga nol di depan), angkatan
+    int16, jurusan sebagai kode kategori, nama dan email sebagai array string.
+    Filter, hitungan, dan ekspor tabel berjalan sebagai operasi vektor di atas kolom.
+    """
     
-    @angkatan.setter
-    def angkatan(self, angkatan: str):
-        self.__angkatan = angkatan
+    KAPASITAS_AWAL = 1024
+    TIPE_KOLOM = {
+        'nim': np.int64,
+        'panjang_nim': np.int8,
+        'angkatan': np.int16,
+        'jurusan': np.int16,
+        'nama': object,
+        'email': object,
+        'hidup': bool,
+    }
+    KOLOM_TABEL = {'nim': 'NIM', 'nama': 'Nama', 'jurusan': 'Jurusan', 'angkatan': 'Angkatan', 'email': 'Email'}
     
-    @email.setter
-    def email(self, email: str):
-        if self._validasi_email(email):
-            self.__email = email
-        else:
-            raise ValueError("Email tidak valid")
+    def __init__(self, versi_awal: int = 0):
+        self.__kolom = {nama: np.zeros(self.KAPASITAS_AWAL, dtype=tipe) for nama, tipe in self.TIPE_KOLOM.items()}
+        self.__n = 0  # Jumlah baris terpakai, termasuk baris terhapus (tombstone)
+        self.__kategori: List[str] = []  # Kode jurusan -> nama jurusan
+        self.__kode: Dict[str, int] = {}  # Nama jurusan -> kode
+        self.__index: Dict[str, int] = {}  # Hash index NIM -> baris
+        self.__statistik = StatistikAgregat()  # Hitungan hidup per jurusan/angkatan, email, nama
+        self.__lubang = 0
+        self.__versi = versi_awal
+        self.__frame: Optional[Tuple[int, pd.DataFrame]] = None  # (versi, frame teks untuk filter & tampilan)
+        self.__urut: Optional[Tuple[int, np.ndarray, np.ndarray]] = None  # (versi, NIM terurut, baris frame)
+        self._kunci = ReadWriteLock()
     
-    # Validasi private methods
-    def _validasi_nim(self, nim: str) -> bool:
-        """Validasi NIM menggunakan regex"""
-        pattern = r'^\d{9,12}$'
-        return bool(re.match(pattern, nim))
+    @property
+    def versi(self) -> int:
+        """Nomor versi data, naik monoton pada setiap mutasi"""
+        return self.__versi
     
-    def _validasi_nama(self, nama: str) -> bool:
-        """Validasi nama menggunakan regex"""
-        pattern = r'^[A-Za-z\s\.\,]{3,50}$'
-        return bool(re.match(pattern, nama))
+    @staticmethod
+    def _teks_nim(nim: np.ndarray, panjang: np.ndarray) -> np.ndarray:
+        """Mengubah kolom NIM int64 kembali ke teks, termasuk nol di depan"""
+        teks = nim.astype(str)
+        for i in np.flatnonzero(np.char.str_len(teks) < panjang):  # Jarang: NIM diawali nol
+            teks[i] = teks[i].zfill(int(panjang[i]))
+        return teks.astype(object)
     
-    def _validasi_email(self, email: str) -> bool:
-        """Validasi email menggunakan regex"""
-        if not email:  # Email boleh kosong
-            return True
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+    @staticmethod
+    def _ke_baris(mahasiswa: Mahasiswa) -> Tuple[int, int, int]:
+        """Mengonversi NIM dan angkatan ke nilai numerik kolom"""
+        nim, angkatan = mahasiswa.nim, mahasiswa.angkatan
+        if not (nim.isascii() and nim.isdigit() and len(nim) <= 18
+                and angkatan.isascii() and angkatan.isdigit() and int(angkatan) <= np.iinfo(np.int16).max):
+            raise ValueError(f"NIM dan angkatan harus numerik untuk backend kolom: {nim}")
+        return int(nim), len(nim), int(angkatan)
     
-    def to_dict(self) -> Dict:
-        """Mengembalikan data mahasiswa sebagai dictionary"""
-        return {
-            'nim': self.__nim,
-            'nama': self.__nama,
-            'jurusan': self.__jurusan,
-            'angkatan': self.__angkatan,
-            'email': self.__email
-        }
+    def _kode_jurusan(self, jurusan: str) -> int:
+        kode = self.__kode.get(jurusan)
+        if kode is None:
+            kode = self.__kode[jurusan] = len(self.__kategori)
+            self.__kategori.append(jurusan)
+        return kode
     
-    def __str__(self) -> str:
-        return f"{self.__nim} - {self.__nama} - {self.__jurusan}"
-
-# ==============================
-# INHERITANCE & POLYMORPHISM
-# ==============================
-
-class DataMahasiswa(ABC):
-    """Abstract Base Class untuk manajemen data mahasiswa"""
+    def _ubah_hitungan(self, mahasiswa: Mahasiswa, angkatan: int, delta: int):
+        """Memperbarui statistik agregat; angkatan memakai nilai kolom agar sama saat dikeluarkan"""
+        self.__statistik.ubah(mahasiswa.jurusan, str(angkatan), mahasiswa.nama, mahasiswa.email, delta)
     
-    @abstractmethod
-    def tambah(self, mahasiswa: Mahasiswa) -> bool:
-        pass
+    def _hitungan_keluar(self, baris: int):
+        kolom = self.__kolom
+        self.__statistik.ubah(self.__kategori[kolom['jurusan'][baris]], str(kolom['angkatan'][baris]),
+                              kolom['nama'][baris], kolom['email'][baris], -1)
     
-    @abstractmethod
-    def hapus(self, nim: str) -> bool:
-        pass
+    def _pastikan_kapasitas(self, tambahan: int):
+        """Menggandakan kapasitas array (amortisasi O(1) per baris) bila perlu"""
+        kapasitas = len(self.__kolom['hidup'])
+        perlu = self.__n + tambahan
+        if perlu <= kapasitas:
+            return
+        while kapasitas < perlu:
+            kapasitas *= 2
+        baru = {}
+        for nama, lama in self.__kolom.items():
+            baru[nama] = np.zeros(kapasitas, dtype=lama.dtype)
+            baru[nama][:self.__n] = lama[:self.__n]
+        self.__kolom = baru
     
-    @abstractmethod
-    def cari(self, keyword: str) -> List[Mahasiswa]:
-        pass
-
-class ManajemenMahasiswa(DataMahasiswa):
-    """Kelas untuk mengelola data mahasiswa menggunakan array dan pointer"""
+    def _tulis_baris(self, baris: int, mahasiswa: Mahasiswa, nilai: Tuple[int, int, int]):
+        kolom = self.__kolom
+        kolom['nim'][baris], kolom['panjang_nim'][baris], kolom['angkatan'][baris] = nilai
+        kolom['jurusan'][baris] = self._kode_jurusan(mahasiswa.jurusan)
+        kolom['nama'][baris] = mahasiswa.nama
+        kolom['email'][baris] = mahasiswa.email
+        kolom['hidup'][baris] = True
     
-    def __init__(self):
-        self.__data = []  # Private array untuk menyimpan data
-        self.__pointer = 0  # Pointer untuk iterasi
+    def _baris_hidup(self) -> np.ndarray:
+        return np.flatnonzero(self.__kolom['hidup'][:self.__n])
     
     # Implementasi metode abstract
     def tambah(self, mahasiswa: Mahasiswa) -> bool:
-        """Menambahkan mahasiswa ke dalam array"""
-        try:
-            # Cek duplikasi NIM
-            for m in self.__data:
-                if m.nim == mahasiswa.nim:
-                    raise ValueError(f"Mahasiswa dengan NIM {mahasiswa.nim} sudah ada")
-            
-            self.__data.append(mahasiswa)
+        """Menambahkan mahasiswa sebagai baris baru di semua kolom"""
+        nilai = self._ke_baris(mahasiswa)
+        with self._kunci.tulis():
+            if mahasiswa.nim in self.__index:
+                raise ValueError(f"Mahasiswa dengan NIM {mahasiswa.nim} sudah ada")
+            self._pastikan_kapasitas(1)
+            self._tulis_baris(self.__n, mahasiswa, nilai)
+            self._ubah_hitungan(mahasiswa, nilai[2], 1)
+            self.__index[mahasiswa.nim] = self.__n
+            self.__n += 1
+            self.__versi += 1
             return True
-        except Exception as e:
-            raise e
+    
+    def tambah_banyak(self, daftar_mahasiswa: Iterable[Mahasiswa], validasi: bool = True) -> HasilTambahBanyak:
+        """Menambahkan banyak mahasiswa; kolom diisi sekaligus per batch, bukan per baris"""
+        hasil = HasilTambahBanyak()
+        nim, panjang, angkatan, jurusan, nama, email = [], [], [], [], [], []
+        
+        with self._kunci.tulis():
+            index = self.__index
+            awal = self.__n
+            for baris, m in enumerate(daftar_mahasiswa, 1):
+                alasan = m._cek_validasi() if validasi else None
+                if not alasan and m.nim in index:
+                    alasan = f"Mahasiswa dengan NIM {m.nim} sudah ada"
+                if not alasan:
+                    try:
+                        nilai = self._ke_baris(m)
+                    except ValueError as e:
+                        alasan = str(e)
+                if alasan:
+                    hasil.tolak(baris, m, alasan)
+                    continue
+                index[m.nim] = awal + len(nim)
+                nim.append(nilai[0])
+                panjang.append(nilai[1])
+                angkatan.append(nilai[2])
+                jurusan.append(self._kode_jurusan(m.jurusan))
+                self._ubah_hitungan(m, nilai[2], 1)
+                nama.append(m.nama)
+                email.append(m.email)
+            
+            if nim:
+                self._pastikan_kapasitas(len(nim))
+                akhir = awal + len(nim)
+                kolom = self.__kolom
+                kolom['nim'][awal:akhir] = nim
+                kolom['panjang_nim'][awal:akhir] = panjang
+                kolom['angkatan'][awal:akhir] = angkatan
+                kolom['jurusan'][awal:akhir] = jurusan
+                kolom['nama'][awal:akhir] = nama
+                kolom['email'][awal:akhir] = email
+                kolom['hidup'][awal:akhir] = True
+                self.__n = akhir
+                hasil.berhasil = len(nim)
+                self.__versi += 1
+        
+        return hasil
     
     def hapus(self, nim: str) -> bool:
-        """Menghapus mahasiswa berdasarkan NIM"""
-        for i, m in enumerate(self.__data):
-            if m.nim == nim:
-                del self.__data[i]
-                return True
-        return False
+        """Menghapus mahasiswa berdasarkan NIM (baris ditandai mati)"""
+        with self._kunci.tulis():
+            baris = self.__index.pop(nim, None)
+            if baris is None:
+                return False
+            self.__kolom['hidup'][baris] = False
+            self._hitungan_keluar(baris)
+            self.__lubang += 1
+            if self.__lubang > self.__n // 2:
+                self._padatkan()
+            self.__versi += 1
+            return True
+    
+    def hapus_banyak(self, nims: Iterable[str]) -> int:
+        """Menghapus banyak NIM: baris dimatikan sekaligus dengan satu penugasan mask"""
+        with self._kunci.tulis():
+            baris = [b for b in (self.__index.pop(nim, None) for nim in nims) if b is not None]
+            if not baris:
+                return 0
+            for b in baris:
+                self._hitungan_keluar(b)
+            self.__kolom['hidup'][baris] = False
+            self.__lubang += len(baris)
+            if self.__lubang > self.__n // 2:
+                self._padatkan()
+            self.__versi += 1
+            return len(baris)
+    
+    def edit_banyak(self, perubahan: Dict[str, Mahasiswa]) -> int:
+        """Mengedit banyak baris di tempat; batch divalidasi utuh sebelum ada kolom yang ditulis"""
+        nilai = {nim_lama: self._ke_baris(baru) for nim_lama, baru in perubahan.items()}
+        with self._kunci.tulis():
+            self._cek_edit_banyak(perubahan, self.__index.__contains__)
+            for nim_lama, baru in perubahan.items():
+                baris = self.__index.pop(nim_lama)
+                self.__index[baru.nim] = baris
+                self._hitungan_keluar(baris)
+                self._tulis_baris(baris, baru, nilai[nim_lama])
+                self._ubah_hitungan(baru, nilai[nim_lama][2], 1)
+            if perubahan:
+                self.__versi += 1
+            return len(perubahan)
     
     def cari(self, keyword: str) -> List[Mahasiswa]:
         """Mencari mahasiswa berdasarkan keyword (NIM atau Nama)"""
-        hasil = []
-        for m in self.__data:
-            if keyword.lower() in m.nim.lower() or keyword.lower() in m.nama.lower():
-                hasil.append(m)
-        return hasil
+        frame = self._frame()
+        cocok = (frame['nim'].str.contains(keyword, case=False, regex=False)
+                 | frame['nama'].str.contains(keyword, case=False, regex=False))
+        return TampilanKolom(frame, np.flatnonzero(cocok.to_numpy(dtype=bool)))
+    
+    def cari_teks(self, keyword: str, by: Optional[str] = None) -> List[Mahasiswa]:
+        """Pencarian substring sebagai str.contains vektor pada kolom teks"""
+        frame = self._frame()
+        cocok = np.zeros(len(frame), dtype=bool)
+        for field in ((by,) if by else ('nama', 'nim', 'email')):
+            # NIM dicocokkan apa adanya, nama/email tanpa membedakan huruf besar-kecil
+            cocok |= frame[field].str.contains(keyword, case=field == 'nim', regex=False).to_numpy(dtype=bool)
+        return TampilanKolom(frame, np.flatnonzero(cocok))
     
     # Metode tambahan
     def edit(self, nim_lama: str, mahasiswa_baru: Mahasiswa) -> bool:
-        """Mengedit data mahasiswa"""
-        for i, m in enumerate(self.__data):
-            if m.nim == nim_lama:
-                # Cek jika NIM baru sudah ada (kecuali NIM sama)
-                if nim_lama != mahasiswa_baru.nim:
-                    for m2 in self.__data:
-                        if m2.nim == mahasiswa_baru.nim:
-                            raise ValueError(f"Mahasiswa dengan NIM {mahasiswa_baru.nim} sudah ada")
-                
-                self.__data[i] = mahasiswa_baru
-                return True
-        return False
+        """Mengedit data mahasiswa di baris yang sama"""
+        nilai = self._ke_baris(mahasiswa_baru)
+        with self._kunci.tulis():
+            baris = self.__index.get(nim_lama)
+            if baris is None:
+                return False
+            if nim_lama != mahasiswa_baru.nim:
+                if mahasiswa_baru.nim in self.__index:
+                    raise ValueError(f"Mahasiswa dengan NIM {mahasiswa_baru.nim} sudah ada")
+                del self.__index[nim_lama]
+                self.__index[mahasiswa_baru.nim] = baris
+            self._hitungan_keluar(baris)
+            self._tulis_baris(baris, mahasiswa_baru, nilai)
+            self._ubah_hitungan(mahasiswa_baru, nilai[2], 1)
+            self.__versi += 1
+            return True
     
-    def get_semua(self) -> List[Mahasiswa]:
-        """Mengembalikan semua data mahasiswa"""
-        return self.__data.copy()
+    def _padatkan(self):
+        """Menyalin baris hidup ke array baru dan membangun ulang index (kunci tulis dipegang)"""
+        hidup = self._baris_hidup()
+        kapasitas = max(self.KAPASITAS_AWAL, 2 * len(hidup))
+        baru = {}
+        for nama, lama in self.__kolom.items():
+            baru[nama] = np.zeros(kapasitas, dtype=lama.dtype)
+            baru[nama][:len(hidup)] = lama[hidup]
+        self.__kolom = baru
+        self.__n = len(hidup)
+        nim = self._teks_nim(baru['nim'][:self.__n], baru['panjang_nim'][:self.__n])
+        self.__index = dict(zip(nim.tolist(), range(self.__n)))
+        self.__lubang = 0
+    
+    def snapshot(self) -> 'TampilanKolom':
+        """Tampilan atas frame versi saat ini; frame per versi sudah tidak pernah diubah"""
+        versi, frame = self._frame_versi()
+        return TampilanKolom(frame, np.arange(len(frame)), versi)
+    
+    def get_semua(self) -> 'TampilanKolom':
+        """Mengembalikan tampilan atas semua baris sesuai urutan penambahan"""
+        return self.snapshot()
     
     def get_by_nim(self, nim: str) -> Optional[Mahasiswa]:
         """Mengembalikan mahasiswa berdasarkan NIM"""
-        for m in self.__data:
-            if m.nim == nim:
-                return m
-        return None
+        with self._kunci.baca():
+            baris = self.__index.get(nim)
+            if baris is None:
+                return None
+            kolom = self.__kolom
+            return Mahasiswa(
+                nim=nim,
+                nama=kolom['nama'][baris],
+                jurusan=self.__kategori[kolom['jurusan'][baris]],
+                angkatan=str(kolom['angkatan'][baris]),
+                email=kolom['email'][baris]
+            )
     
     def jumlah(self) -> int:
         """Mengembalikan jumlah mahasiswa"""
-        return len(self.__data)
+        return len(self.__index)
+    
+    def _frame(self) -> pd.DataFrame:
+        return self._frame_versi()[1]
+    
+    def _frame_versi(self) -> Tuple[int, pd.DataFrame]:
+        """
+        Kolom teks siap-filter untuk versi data saat ini (baris hidup, urutan penambahan).
+        Dibangun sekali per versi sehingga filter berulang (setiap rerun) tidak mengonversi
+        ulang, dan tidak pernah diubah sehingga aman dibaca tanpa kunci.
+        """
+        cache = self.__frame
+        if cache is not None and cache[0] == self.__versi:
+            return cache
+        with self._kunci.baca():
+            versi = self.__versi
+            kolom = self.__kolom
+            baris = self._baris_hidup()
+            frame = pd.DataFrame({
+                'nim': pd.array(self._teks_nim(kolom['nim'][baris], kolom['panjang_nim'][baris]), dtype='string'),
+                'nama': pd.array(kolom['nama'][baris], dtype='string'),
+                'jurusan': pd.Categorical.from_codes(kolom['jurusan'][baris], categories=list(self.__kategori)),
+                'angkatan': pd.Categorical(kolom['angkatan'][baris]).rename_categories(str),
+                'email': pd.array(kolom['email'][baris], dtype='string'),
+            })
+        self.__frame = (versi, frame)
+        return versi, frame
+    
+    def _urutan_nim(self) -> Tuple[pd.DataFrame, np.ndarray, np.ndarray]:
+        """
+        Permutasi baris frame terurut NIM (urutan teks) untuk versi data saat ini.
+        Disisipkan per baris akan menggeser seluruh array, jadi urutan dibangun
+        ulang sekali per versi (argsort C atas array unicode) lalu dipakai ulang.
+        """
+        frame = self._frame()
+        cache = self.__urut
+        if cache is not None and cache[0] == self.__versi and len(cache[1]) == len(frame):
+            return frame, cache[1], cache[2]
+        teks = frame['nim'].to_numpy(dtype=str)
+        posisi = np.argsort(teks, kind='stable')
+        teks = teks[posisi]
+        self.__urut = (self.__versi, teks, posisi)
+        return frame, teks, posisi
+    
+    def urut_nim(self) -> Sequence:
+        frame, teks, posisi = self._urutan_nim()
+        return TampilanUrutNim(teks, TampilanKolom(frame, posisi).satu)
+    
+    def rentang_nim(self, awal: str, akhir: str) -> List[Mahasiswa]:
+        """Rentang NIM lewat np.searchsorted pada urutan per versi - O(log n + hasil)"""
+        frame, teks, posisi = self._urutan_nim()
+        kiri, kanan = np.searchsorted(teks, awal, 'left'), np.searchsorted(teks, akhir, 'right')
+        return TampilanKolom(frame, posisi[kiri:kanan])
+    
+    def prefiks_nim(self, prefiks: str) -> List[Mahasiswa]:
+        """Prefiks NIM lewat np.searchsorted pada urutan per versi - O(log n + hasil)"""
+        frame, teks, posisi = self._urutan_nim()
+        kiri = np.searchsorted(teks, prefiks, 'left')
+        kanan = np.searchsorted(teks, self._batas_prefiks(prefiks), 'left')
+        return TampilanKolom(frame, posisi[kiri:kanan])
+    
+    def filter(self, nim: str = "", nama: str = "", jurusan: Optional[str] = None,
+               angkatan: Optional[str] = None, urut: Optional[str] = None,
+               ascending: bool = True) -> List[Mahasiswa]:
+        """Menyaring dan mengurutkan data dengan mask boolean di atas kolom"""
+        frame = self._frame()
+        cocok = np.ones(len(frame), dtype=bool)
+        if nim:
+            cocok &= frame['nim'].str.contains(nim, regex=False).to_numpy(dtype=bool)
+        if nama:
+            cocok &= frame['nama'].str.contains(nama, case=False, regex=False).to_numpy(dtype=bool)
+        if jurusan is not None:
+            cocok &= (frame['jurusan'] == jurusan).to_numpy()
+        if angkatan is not None:
+            cocok &= (frame['angkatan'] == angkatan).to_numpy()
+        
+        posisi = np.flatnonzero(cocok)
+        if urut:
+            if urut not in self.KOLOM_TABEL:
+                raise ValueError(f"Kolom pengurutan tidak dikenal: {urut}")
+            kunci = frame[urut].iloc[posisi].astype(str).to_numpy(dtype=object)
+            posisi = posisi[np.argsort(kunci, kind='stable')]
+            if not ascending:
+                posisi = posisi[::-1]
+        return TampilanKolom(frame, posisi)
+    
+    def hitung_jurusan(self) -> Dict[str, int]:
+        """Jumlah mahasiswa per jurusan dari hitungan yang dipelihara - O(jumlah jurusan)"""
+        with self._kunci.baca():
+            return self.__statistik.hitung_jurusan()
+    
+    def hitung_angkatan(self) -> Dict[str, int]:
+        """Jumlah mahasiswa per angkatan dari hitungan yang dipelihara - O(jumlah angkatan)"""
+        with self._kunci.baca():
+            return self.__statistik.hitung_angkatan()
+    
+    def statistik(self) -> RingkasanStatistik:
+        """Statistik agregat yang dipelihara per mutasi - tanpa memindai kolom"""
+        with self._kunci.baca():
+            return self.__statistik.ringkasan()
+    
+    def ke_dataframe(self, data: Optional[Iterable[Mahasiswa]] = None) -> pd.DataFrame:
+        if data is None:
+            data = self.get_semua()
+        if isinstance(data, TampilanKolom):
+            return data.ke_dataframe()
+        return super().ke_dataframe(data)
     
     def __iter__(self):
-        """Mengimplementasikan iterator"""
-        self.__pointer = 0
-        return self
+        return iter(self.get_semua())
     
-    def __next__(self):
-        """Mengembalikan elemen berikutnya dalam iterasi"""
-        if self.__pointer < len(self.__data):
-            result = self.__data[self.__pointer]
-            self.__pointer += 1
-            return result
-        else:
-            raise StopIteration
+    def iter_batches(self, ukuran: Optional[int] = None, sebagai: str = 'list') -> Iterator:
+        """Potongan dari frame satu versi; bentuk DataFrame diiris langsung tanpa objek per baris"""
+        ukuran = self._cek_batch(ukuran, sebagai)
+        versi, frame = self._frame_versi()
+        for awal in range(0, len(frame), ukuran):
+            if sebagai == 'dataframe':
+                yield frame.iloc[awal:awal + ukuran].reset_index(drop=True).rename(columns=self.KOLOM_TABEL)
+            else:
+                yield TampilanKolom(frame, np.arange(awal, min(awal + ukuran, len(frame))), versi).copy()
 
 # ==============================
 # ALGORITMA PENCARIAN
@@ -237,19 +2179,18 @@ class AlgoritmaPencarian:
     def binary_search(data: List[Mahasiswa], nim: str) -> Optional[Mahasiswa]:
         """
         Binary Search - O(log n)
-        Hanya bekerja pada data yang sudah terurut berdasarkan NIM
+        Hanya bekerja pada data yang sudah terurut berdasarkan NIM,
+        misalnya tampilan dari manajemen.urut_nim() (tidak diurutkan ulang di sini)
         """
-        # Pastikan data terurut berdasarkan NIM
-        data_sorted = sorted(data, key=lambda x: x.nim)
-        
         low = 0
-        high = len(data_sorted) - 1
+        high = len(data) - 1
         
         while low <= high:
             mid = (low + high) // 2
-            if data_sorted[mid].nim == nim:
-                return data_sorted[mid]
-            elif data_sorted[mid].nim < nim:
+            tengah = data[mid]
+            if tengah.nim == nim:
+                return tengah
+            elif tengah.nim < nim:
                 low = mid + 1
             else:
                 high = mid - 1
@@ -270,6 +2211,166 @@ class AlgoritmaPencarian:
                 hasil.append(data[i])
             i += 1
         return hasil
+    
+    @staticmethod
+    def indexed_search(manajemen: DataMahasiswa, keyword: str, by: Optional[str] = None) -> List[Mahasiswa]:
+        """
+        Indexed Search - O(k) untuk k kandidat
+        Memakai index trigram milik store untuk mempersempit kandidat,
+        lalu memverifikasi seperti linear search (by=None: semua field)
+        """
+        return manajemen.cari_teks(keyword, by)
+    
+    @staticmethod
+    def fuzzy_search(manajemen: DataMahasiswa, keyword: str, maks_jarak: int = 2) -> List[Tuple[Mahasiswa, int]]:
+        """
+        Fuzzy Search - O(kosakata x panjang keyword) secara vektor, lalu O(hasil)
+        Mencari nama yang toleran salah ketik: setiap kata keyword harus punya padanan
+        di nama dengan jarak edit <= maks_jarak. Hasil (mahasiswa, total jarak) terurut
+        dari yang paling mirip.
+        """
+        if maks_jarak < 0:
+            raise ValueError("Jarak maksimum tidak boleh negatif")
+        data, indeks = manajemen.indeks_fuzzy()
+        posisi, jarak = indeks.cari(keyword, maks_jarak)
+        return list(zip(data.ambil(posisi), jarak.tolist()))
+    
+    FIELD_VEKTOR = ('nim', 'nama', 'jurusan', 'angkatan', 'email')
+    
+    @staticmethod
+    def vectorized_search(manajemen: DataMahasiswa, kondisi: Iterable[Tuple[str, str, bool]]) -> List[Mahasiswa]:
+        """
+        Vectorized Search - O(n) di kode C pandas/Arrow, tanpa loop Python per objek
+        Kondisi berupa (field, nilai, persis): persis=False memakai str.contains, True memakai ==.
+        Semua kondisi digabung dengan AND dan tidak peka huruf besar/kecil; nilai kosong diabaikan.
+        Kolom diambil dari tabel_pencarian() milik store yang di-cache per versi.
+        """
+        data, frame = manajemen.tabel_pencarian()
+        kondisi = [k for k in kondisi if k[1]]
+        for field, _, _ in kondisi:
+            if field not in AlgoritmaPencarian.FIELD_VEKTOR:
+                raise ValueError(f"Field pencarian tidak dikenal: {field}")
+        
+        # Kondisi persis (murah pada kolom kategori) dulu; kondisi berikutnya hanya
+        # dievaluasi pada baris yang masih lolos
+        posisi = np.arange(len(frame))
+        for field, nilai, persis in sorted(kondisi, key=lambda k: not k[2]):
+            kolom = frame[field]
+            if len(posisi) < len(frame):
+                kolom = kolom.iloc[posisi]
+            nilai = nilai.lower()
+            hasil = kolom == nilai if persis else kolom.str.contains(nilai, regex=False)
+            posisi = posisi[hasil.to_numpy(dtype=bool, na_value=False)]
+        return data.ambil(posisi)
+
+class CacheHasilPencarian:
+    """
+    Cache LRU hasil pencarian, dipakai bersama semua sesi. Kuncinya (algoritma, keyword,
+    field, versi store): setiap mutasi menaikkan versi sehingga hasil lama tidak pernah
+    terpakai lagi, dan entri versi lama dibuang saat versi yang lebih baru pertama kali
+    terlihat. Ukurannya dibatasi jumlah entri dan total record yang dirujuk hasil.
+    Hasil dibagi antar pemanggil sehingga tidak boleh diubah.
+    """
+    
+    def __init__(self, kapasitas: int = 256, maks_record: int = 1_000_000):
+        self.kapasitas = kapasitas
+        self.maks_record = maks_record
+        self.__entri: OrderedDict = OrderedDict()  # kunci -> (hasil, ukuran), paling lama dipakai di depan
+        self.__record = 0
+        self.__versi = -1  # Versi store terbaru yang pernah terlihat
+        self.hit = 0
+        self.miss = 0
+        self.__kunci = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self.__entri)
+    
+    @staticmethod
+    def _ukuran(hasil: Any) -> int:
+        # Semua hasil ber-len (list, DataFrame, TampilanKolom, ...) dihitung per record
+        return len(hasil) if isinstance(hasil, Sized) else 1
+    
+    def _buang(self, kunci: Tuple):
+        _, ukuran = self.__entri.pop(kunci)
+        self.__record -= ukuran
+    
+    def ambil(self, algoritma: str, keyword: str, field: Any, versi: int, hitung: Callable[[], Any]) -> Any:
+        """
+        Hasil untuk kunci dari cache - O(1); jika tidak ada, hitung() dijalankan (di luar
+        kunci, agar pencarian panjang tidak menahan sesi lain) lalu hasilnya disimpan.
+        field dan hasil harus hashable/tidak diubah; field boleh tuple untuk kondisi gabungan.
+        """
+        kunci = (algoritma, keyword, field, versi)
+        with self.__kunci:
+            if versi > self.__versi:
+                # Data berubah: entri versi lama tidak akan pernah cocok lagi
+                for lama in [k for k in self.__entri if k[3] < versi]:
+                    self._buang(lama)
+                self.__versi = versi
+            entri = self.__entri.get(kunci)
+            if entri is not None:
+                self.__entri.move_to_end(kunci)
+                self.hit += 1
+                return entri[0]
+            self.miss += 1
+        
+        hasil = hitung()
+        ukuran = self._ukuran(hasil)
+        if ukuran > self.maks_record:
+            return hasil  # Lebih besar dari seluruh anggaran: tidak disimpan
+        with self.__kunci:
+            if kunci in self.__entri:
+                self._buang(kunci)  # Dihitung juga oleh sesi lain sementara itu
+            self.__entri[kunci] = (hasil, ukuran)
+            self.__record += ukuran
+            while len(self.__entri) > self.kapasitas or self.__record > self.maks_record:
+                self._buang(next(iter(self.__entri)))
+        return hasil
+    
+    def kosongkan(self):
+        with self.__kunci:
+            self.__entri.clear()
+            self.__record = 0
+            self.hit = self.miss = 0
+
+class PencarianBertahap:
+    """
+    Penyaringan bertahap untuk pencarian sambil mengetik, disimpan per sesi. Untuk setiap
+    kanal (tab atau filter) diingat keyword, parameter lain, versi store dan hasil terakhir.
+    Jika versi dan parameter lain sama dan setiap keyword lama termuat di keyword baru
+    ("ah" -> "ahm"), hasil baru pasti himpunan bagian hasil lama sehingga cukup hasil lama
+    yang disaring - O(hasil lama), bukan O(n). Jika keyword dipendekkan/diganti atau data
+    berubah, pencarian penuh (atau lewat index) dijalankan.
+    """
+    
+    def __init__(self):
+        self.__terakhir: Dict[str, Tuple[Tuple[str, ...], Any, int, List]] = {}  # kanal -> (keyword, lain, versi, hasil)
+        self.bertahap = 0
+        self.penuh = 0
+    
+    def ingat(self, kanal: str, keyword: Tuple[str, ...], lain: Any, versi: int, hasil: List):
+        """Mencatat hasil terakhir kanal (juga hasil yang datang dari cache bersama)"""
+        self.__terakhir[kanal] = (tuple(keyword), lain, versi, hasil)
+    
+    def cari(self, kanal: str, keyword: Tuple[str, ...], lain: Any, versi: int,
+             cari_penuh: Callable[[], List], saring: Callable[[List], List]) -> List:
+        """
+        keyword: tuple teks yang dicari secara substring (misalnya (nim, nama)); lain: parameter
+        yang harus sama persis. saring(hasil_lama) harus memakai predikat yang sama dengan
+        cari_penuh() agar hasilnya identik (urutan hasil lama dipertahankan).
+        """
+        terakhir = self.__terakhir.get(kanal)
+        # Pembandingan peka huruf besar/kecil: aman juga untuk field yang tidak peka huruf.
+        # Keyword lama yang semuanya kosong bukan pencarian, hasilnya bukan penyempitan.
+        if (terakhir is not None and terakhir[1] == lain and terakhir[2] == versi and any(terakhir[0])
+                and all(lama in baru for lama, baru in zip(terakhir[0], keyword))):
+            hasil = saring(terakhir[3])
+            self.bertahap += 1
+        else:
+            hasil = cari_penuh()
+            self.penuh += 1
+        self.ingat(kanal, keyword, lain, versi, hasil)
+        return hasil
 
 # ==============================
 # ALGORITMA PENGURUTAN
@@ -482,8 +2583,9 @@ class EmailHandler:
             st.error(f"❌ Gagal mengirim email: {str(e)}")
             return False
     
-    def generate_html_report(self, data: List[Mahasiswa], judul: str = "Laporan Data Mahasiswa") -> str:
-        """Membuat laporan HTML dari data mahasiswa"""
+    def generate_html_report(self, data: List[Mahasiswa], judul: str = "Laporan Data Mahasiswa",
+                             statistik: Optional[RingkasanStatistik] = None) -> str:
+        """Membuat laporan HTML dari data mahasiswa (statistik bisa disiapkan oleh store)"""
         html_content = f"""
         <!DOCTYPE html>
         <html>
@@ -583,9 +2685,15 @@ class EmailHandler:
         
         # Tambahkan statistik
         if data:
-            jurusan_count = len(set([m.jurusan for m in data]))
-            angkatan_count = len(set([m.nim[:4] for m in data if len(m.nim) >= 4]))
-            dengan_email = len([m for m in data if m.email])
+            if statistik is None:
+                statistik = RingkasanStatistik.dari_dataframe(pd.DataFrame({
+                    'Nama': [m.nama for m in data],
+                    'Jurusan': [m.jurusan for m in data],
+                    'Angkatan': [m.angkatan for m in data],
+                    'Email': [m.email for m in data],
+                }))
+            jurusan_count = len(statistik.per_jurusan)
+            dengan_email = statistik.dengan_email
             
             html_content += f"""
             <div class="statistics">
@@ -647,73 +2755,777 @@ class EmailHandler:
         
         return html_content
     
-    def generate_csv_report(self, data: List[Mahasiswa], filename: str = "data_mahasiswa.csv") -> str:
-        """Membuat file CSV dari data mahasiswa"""
-        # Buat DataFrame
-        df_data = []
-        for m in data:
-            df_data.append({
-                'NIM': m.nim,
-                'Nama': m.nama,
-                'Jurusan': m.jurusan,
-                'Angkatan': m.angkatan,
-                'Email': m.email if m.email else ''
-            })
+    def generate_csv_report(self, data: List[Mahasiswa], filename: str = "data_mahasiswa.csv",
+                            df: Optional[pd.DataFrame] = None,
+                            potongan: Optional[Iterable[pd.DataFrame]] = None) -> str:
+        """
+        Membuat file CSV dari data mahasiswa, DataFrame yang sudah disiapkan store,
+        atau potongan DataFrame dari iter_batches (ditulis bertahap, memori tetap)
+        """
+        csv_path = f"temp_{filename}"
+        if potongan is not None:
+            with open(csv_path, 'w', encoding='utf-8', newline='') as file:
+                for i, bagian in enumerate(potongan):
+                    bagian.to_csv(file, index=False, header=i == 0)
+            return csv_path
         
-        df = pd.DataFrame(df_data)
+        # Buat DataFrame
+        if df is None:
+            df_data = []
+            for m in data:
+                df_data.append({
+                    'NIM': m.nim,
+                    'Nama': m.nama,
+                    'Jurusan': m.jurusan,
+                    'Angkatan': m.angkatan,
+                    'Email': m.email if m.email else ''
+                })
+            
+            df = pd.DataFrame(df_data)
         
         # Simpan ke file
-        csv_path = f"temp_{filename}"
         df.to_csv(csv_path, index=False, encoding='utf-8')
         
-        return csv_path
-
-# ==============================
-# FILE I/O OPERATIONS
-# ==============================
-
-class FileHandler:
-    """Kelas untuk menangani operasi file I/O"""
+        return csv_path
+
+# ==============================
+# FILE I/O OPERATIONS
+# ==============================
+
+class SnapshotBiner:
+    """
+    Pembaca snapshot biner yang di-memory-map. Objek Mahasiswa baru dibuat
+    saat record diakses, sehingga membuka file berukuran besar hanya membaca header.
+    
+    Tata letak file (little-endian):
+      header   : magic 'MHSB', versi u16, jumlah record u32, jumlah jurusan u16,
+                 panjang id snapshot u16, lalu id snapshot (utf-8)
+      jurusan  : kamus jurusan, tiap entri u16 panjang + teks utf-8
+      record   : lebar tetap - NIM u64, panjang NIM u8 (menjaga nol di depan),
+                 angkatan u16, kode jurusan u16, offset & panjang nama (u32, u16),
+                 offset & panjang email (u32, u16)
+      heap     : teks nama dan email (utf-8) yang ditunjuk oleh record
+    """
+    
+    MAGIC = b'MHSB'
+    VERSI_FORMAT = 1
+    HEADER = struct.Struct('<4sHIHH')
+    PANJANG = struct.Struct('<H')
+    REKAM = struct.Struct('<QBHHIHIH')
+    
+    def __init__(self, path: str):
+        self.__file = open(path, 'rb')
+        try:
+            self.__mm = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.__file.close()
+            raise ValueError(f"Snapshot biner kosong: {path}")
+        
+        magic, versi, self.__jumlah, jumlah_jurusan, panjang_id = self.HEADER.unpack_from(self.__mm, 0)
+        if magic != self.MAGIC or versi != self.VERSI_FORMAT:
+            self.close()
+            raise ValueError(f"Bukan snapshot biner yang didukung: {path}")
+        
+        posisi = self.HEADER.size
+        self.id_snapshot = self.__mm[posisi:posisi + panjang_id].decode('utf-8') or None
+        posisi += panjang_id
+        
+        self.__jurusan = []
+        for _ in range(jumlah_jurusan):
+            (panjang,) = self.PANJANG.unpack_from(self.__mm, posisi)
+            posisi += self.PANJANG.size
+            self.__jurusan.append(self.__mm[posisi:posisi + panjang].decode('utf-8'))
+            posisi += panjang
+        
+        self.__awal_rekam = posisi
+        self.__awal_heap = posisi + self.__jumlah * self.REKAM.size
+    
+    def __len__(self) -> int:
+        return self.__jumlah
+    
+    def _buat(self, nim: int, panjang_nim: int, angkatan: int, kode_jurusan: int,
+              nama_off: int, nama_len: int, email_off: int, email_len: int) -> Mahasiswa:
+        mm = self.__mm
+        heap = self.__awal_heap
+        return Mahasiswa(
+            nim=str(nim).zfill(panjang_nim),
+            nama=mm[heap + nama_off:heap + nama_off + nama_len].decode('utf-8'),
+            jurusan=self.__jurusan[kode_jurusan],
+            angkatan=str(angkatan),
+            email=mm[heap + email_off:heap + email_off + email_len].decode('utf-8')
+        )
+    
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self.__jumlah))]
+        if i < 0:
+            i += self.__jumlah
+        if not 0 <= i < self.__jumlah:
+            raise IndexError("Indeks snapshot di luar jangkauan")
+        return self._buat(*self.REKAM.unpack_from(self.__mm, self.__awal_rekam + i * self.REKAM.size))
+    
+    def __iter__(self) -> Iterator[Mahasiswa]:
+        rekam = memoryview(self.__mm)[self.__awal_rekam:self.__awal_heap]
+        try:
+            for field in self.REKAM.iter_unpack(rekam):
+                yield self._buat(*field)
+        finally:
+            rekam.release()
+    
+    def close(self):
+        self.__mm.close()
+        self.__file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    @staticmethod
+    def tulis(data: Iterable[Mahasiswa], path: str, id_snapshot: Optional[str] = None):
+        """Menulis snapshot biner secara atomik (file sementara lalu rename)"""
+        kode_jurusan: Dict[str, int] = {}
+        rekam = bytearray()
+        heap = bytearray()
+        jumlah = 0
+        
+        for m in data:
+            if not (m.nim.isascii() and m.nim.isdigit() and m.angkatan.isascii() and m.angkatan.isdigit()):
+                raise ValueError(f"NIM dan angkatan harus numerik untuk snapshot biner: {m.nim}")
+            kode = kode_jurusan.setdefault(m.jurusan, len(kode_jurusan))
+            nama = m.nama.encode('utf-8')
+            email = m.email.encode('utf-8')
+            try:
+                rekam += SnapshotBiner.REKAM.pack(int(m.nim), len(m.nim), int(m.angkatan), kode,
+                                                  len(heap), len(nama), len(heap) + len(nama), len(email))
+            except struct.error:
+                raise ValueError(f"Nilai record melebihi lebar field snapshot biner: {m.nim}")
+            heap += nama
+            heap += email
+            jumlah += 1
+        
+        # Header dan kamus jurusan dikodekan sebelum file dibuka agar nilai yang
+        # tidak muat (struct.error) tidak meninggalkan file sementara
+        id_bytes = (id_snapshot or '').encode('utf-8')
+        kepala = bytearray(SnapshotBiner.HEADER.pack(SnapshotBiner.MAGIC, SnapshotBiner.VERSI_FORMAT,
+                                                     jumlah, len(kode_jurusan), len(id_bytes)))
+        kepala += id_bytes
+        for jurusan in kode_jurusan:  # dict menjaga urutan kode
+            teks = jurusan.encode('utf-8')
+            kepala += SnapshotBiner.PANJANG.pack(len(teks))
+            kepala += teks
+        
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as file:
+            file.write(kepala)
+            file.write(rekam)
+            file.write(heap)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+
+class FileHandler:
+    """
+    Kelas untuk menangani operasi file I/O.
+    
+    Data disimpan sebagai snapshot NDJSON (satu record JSON per baris, dibaca
+    dan ditulis secara streaming) ditambah journal append-only (file
+    <snapshot>.journal, satu operasi JSON per baris). Setiap perubahan
+    cukup menambah satu baris ke journal; snapshot ditulis ulang hanya saat
+    compaction. Baris pertama snapshot memuat id generasi acak yang dibuat saat
+    compaction, dan baris pertama journal mencatat id snapshot yang menjadi dasarnya,
+    sehingga journal lama yang sudah di-compact tidak diputar ulang. Id ada di dalam
+    isi file, jadi touch, salin, atau restore tidak memutus journal dari snapshot-nya.
+    """
+    
+    _kunci = threading.RLock()  # Menyerialkan append journal dan compaction
+    MIN_UKURAN_COMPACTION = 64 * 1024  # Byte journal minimum sebelum compaction
+    TULIS_BINER = True  # Tulis juga snapshot biner (.bin) untuk startup cepat
+    UKURAN_CHUNK = 1024 * 1024  # Ukuran potongan baca untuk format array JSON lama
+    
+    @staticmethod
+    def path_journal(filename: str = 'data_mahasiswa.json') -> str:
+        return filename + '.journal'
+    
+    @staticmethod
+    def path_biner(filename: str = 'data_mahasiswa.json') -> str:
+        return os.path.splitext(filename)[0] + '.bin'
+    
+    @staticmethod
+    def _header(id_snapshot: Optional[str]) -> str:
+        """Baris header snapshot dan journal untuk satu generasi snapshot"""
+        return json.dumps({'op': 'snapshot', 'id': id_snapshot}) + '\n'
+    
+    @staticmethod
+    def _id_header(filename: str) -> Optional[str]:
+        """Id generasi dari baris header snapshot NDJSON; None untuk snapshot tanpa header"""
+        if not os.path.exists(filename) or FileHandler.format_lama(filename):
+            return None  # Array JSON lama bisa satu baris raksasa: jangan readline
+        with open(filename, 'r') as file:
+            baris = file.readline()
+        try:
+            entri = json.loads(baris)
+        except json.JSONDecodeError:
+            return None
+        if isinstance(entri, dict) and entri.get('op') == 'snapshot':
+            return entri.get('id')
+        return None
+    
+    @staticmethod
+    def _id_stat(filename: str) -> Optional[str]:
+        """Identitas berdasarkan ukuran dan waktu modifikasi file"""
+        try:
+            stat = os.stat(filename)
+        except FileNotFoundError:
+            return None
+        return f"{stat.st_size}-{stat.st_mtime_ns}"
+    
+    @staticmethod
+    def _id_snapshot(filename: str) -> Optional[str]:
+        """
+        Identitas snapshot untuk mencocokkan journal: id generasi di header. Snapshot
+        tanpa header (format lama, dimigrasi saat dimuat) memakai ukuran dan mtime.
+        """
+        return FileHandler._id_header(filename) or FileHandler._id_stat(filename)
+    
+    @staticmethod
+    def _id_biner(filename: str) -> Optional[str]:
+        """
+        Snapshot biner terikat ke generasi dan stat snapshot NDJSON: isi NDJSON yang
+        diedit tangan tanpa mengubah header tidak membuat file biner basi terpakai.
+        """
+        return f"{FileHandler._id_snapshot(filename)}/{FileHandler._id_stat(filename)}"
+    
+    @staticmethod
+    def _sisihkan_journal_asing(filename: str):
+        """
+        Journal yang header-nya tidak cocok dengan snapshot saat ini tidak pernah dipotong
+        atau ditimpa: jika masih berisi operasi, file dipindah ke <journal>.<waktu>.bak.
+        """
+        path = FileHandler.path_journal(filename)
+        try:
+            with open(path, 'rb') as file:
+                pertama = file.readline()
+                ada_operasi = bool(file.read(4096).strip())
+        except FileNotFoundError:
+            return
+        if ada_operasi and pertama.decode('utf-8', 'replace') != FileHandler._header(FileHandler._id_snapshot(filename)):
+            cadangan = f"{path}.{time.time_ns()}.bak"
+            os.replace(path, cadangan)
+            print(f"Journal milik snapshot lain tidak diputar ulang, disimpan di {cadangan}")
+    
+    @staticmethod
+    def _ke_mahasiswa(item: Dict) -> Mahasiswa:
+        return Mahasiswa(
+            nim=item['nim'],
+            nama=item['nama'],
+            jurusan=item.get('jurusan', 'Teknik Informatika'),
+            angkatan=item.get('angkatan', '2024'),
+            email=item.get('email', '')
+        )
+    
+    @staticmethod
+    def _tulis_atomik(path: str, baris: Iterable[str]):
+        """Menulis baris ke file sementara lalu rename, sehingga file tidak pernah setengah jadi"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as file:
+            file.writelines(baris)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+    
+    @staticmethod
+    def tulis_ndjson(data: Iterable[Mahasiswa]) -> Iterator[str]:
+        """Generator baris NDJSON, satu record per baris"""
+        for m in data:
+            yield json.dumps(m.to_dict(), separators=(',', ':')) + '\n'
+    
+    @staticmethod
+    def simpan_ke_file(data: Iterable[Mahasiswa], filename: str = 'data_mahasiswa.json'):
+        """Menyimpan seluruh data sebagai snapshot NDJSON baru dan mengosongkan journal (compaction)"""
+        try:
+            with FileHandler._kunci:
+                if FileHandler.TULIS_BINER and not isinstance(data, Sequence):
+                    data = list(data)  # Dipakai dua kali: NDJSON dan biner
+                # Journal yang bukan milik snapshot lama ini tidak ikut ditimpa di bawah
+                FileHandler._sisihkan_journal_asing(filename)
+                header = FileHandler._header(uuid.uuid4().hex)
+                FileHandler._tulis_atomik(filename, chain([header], FileHandler.tulis_ndjson(data)))
+                if FileHandler.TULIS_BINER:
+                    FileHandler.simpan_biner(data, FileHandler.path_biner(filename), FileHandler._id_biner(filename))
+                # Journal baru berisi header yang menunjuk ke snapshot ini
+                FileHandler._tulis_atomik(FileHandler.path_journal(filename), [header])
+            return True
+        except Exception as e:
+            raise Exception(f"Gagal menyimpan ke file: {str(e)}")
+    
+    @staticmethod
+    def simpan_biner(data: Iterable[Mahasiswa], path: str = 'data_mahasiswa.bin',
+                     id_snapshot: Optional[str] = None) -> bool:
+        """
+        Menyimpan snapshot biner ringkas. id_snapshot menandai snapshot NDJSON
+        yang isinya sama, sehingga file biner yang basi tidak dipakai saat memuat.
+        """
+        try:
+            SnapshotBiner.tulis(data, path, id_snapshot)
+            return True
+        except (ValueError, struct.error) as e:
+            # Data tidak bisa dikodekan biner; hapus file lama agar tidak terpakai
+            print(f"Snapshot biner dilewati: {str(e)}")
+            if os.path.exists(path):
+                os.remove(path)
+            return False
+    
+    @staticmethod
+    def baca_biner(path: str = 'data_mahasiswa.bin') -> SnapshotBiner:
+        """Membuka snapshot biner (memory-mapped, record dibuat secara lazy)"""
+        return SnapshotBiner(path)
+    
+    @staticmethod
+    def simpan_snapshot(manajemen: DataMahasiswa, filename: str = 'data_mahasiswa.json'):
+        """
+        Compaction dari store: data diambil di dalam kunci file sehingga tidak ada
+        operasi journal yang tercatat di antara pengambilan data dan penulisan snapshot.
+        """
+        with FileHandler._kunci:
+            return FileHandler.simpan_ke_file(manajemen.get_semua(), filename)
+    
+    @staticmethod
+    def catat_operasi(op: str, nim: str = None, mahasiswa: Mahasiswa = None,
+                      filename: str = 'data_mahasiswa.json'):
+        """
+        Menambahkan satu operasi ('tambah', 'edit', 'hapus') ke journal - O(1).
+        Untuk 'edit' dan 'hapus', nim adalah NIM lama yang diubah/dihapus.
+        """
+        FileHandler.catat_operasi_banyak([FileHandler.entri_journal(op, nim, mahasiswa)], filename)
+    
+    @staticmethod
+    def entri_journal(op: str, nim: str = None, mahasiswa: Mahasiswa = None) -> Dict:
+        """Membuat satu entri journal"""
+        entri = {'op': op}
+        if nim is not None:
+            entri['nim'] = nim
+        if mahasiswa is not None:
+            entri['data'] = mahasiswa.to_dict()
+        return entri
+    
+    @staticmethod
+    def catat_operasi_banyak(daftar_entri: List[Dict], filename: str = 'data_mahasiswa.json'):
+        """Menambahkan beberapa entri journal dengan satu kali write dan fsync"""
+        if not daftar_entri:
+            return
+        try:
+            with FileHandler._kunci:
+                path = FileHandler.path_journal(filename)
+                header = FileHandler._header(FileHandler._id_snapshot(filename))
+                FileHandler._sisihkan_journal_asing(filename)
+                with open(path, 'ab+') as file:
+                    baris = ''.join(json.dumps(entri, separators=(',', ':')) + '\n' for entri in daftar_entri)
+                    file.seek(0)
+                    if file.readline().decode('utf-8', 'replace') != header:
+                        # Journal kosong atau hanya berisi header lain (operasi sudah disisihkan): mulai baru
+                        file.truncate(0)
+                        baris = header + baris
+                    else:
+                        file.seek(-1, os.SEEK_END)
+                        if file.read(1) != b'\n':
+                            baris = '\n' + baris  # Tutup baris yang terpotong oleh crash sebelumnya
+                    file.write(baris.encode('utf-8'))
+                    file.flush()
+                    os.fsync(file.fileno())
+        except Exception as e:
+            raise Exception(f"Gagal mencatat ke journal: {str(e)}")
+    
+    @staticmethod
+    def perlu_compaction(filename: str = 'data_mahasiswa.json') -> bool:
+        """Journal perlu di-compact jika sudah lebih besar dari separuh snapshot"""
+        try:
+            ukuran_journal = os.path.getsize(FileHandler.path_journal(filename))
+        except FileNotFoundError:
+            return False
+        ukuran_snapshot = os.path.getsize(filename) if os.path.exists(filename) else 0
+        return ukuran_journal > max(FileHandler.MIN_UKURAN_COMPACTION, ukuran_snapshot // 2)
+    
+    @staticmethod
+    def _baca_journal(filename: str) -> List[Dict]:
+        """
+        Membaca operasi journal yang berlaku untuk snapshot saat ini.
+        Baris yang terpotong akibat crash saat menulis diabaikan.
+        """
+        path = FileHandler.path_journal(filename)
+        if not os.path.exists(path):
+            return []
+        
+        operasi = []
+        with open(path, 'r') as file:
+            for nomor, baris in enumerate(file):
+                if not baris.endswith('\n'):
+                    break  # Penulisan terakhir tidak selesai
+                try:
+                    entri = json.loads(baris)
+                except json.JSONDecodeError:
+                    if nomor == 0:
+                        return []
+                    continue  # Sisa penulisan yang terpotong, sudah ditutup oleh append berikutnya
+                if nomor == 0:
+                    if entri.get('op') != 'snapshot' or entri.get('id') != FileHandler._id_snapshot(filename):
+                        # Milik snapshot lain (mis. crash saat compaction); disisihkan, bukan dipotong,
+                        # pada penulisan journal berikutnya
+                        print(f"Journal {path} bukan milik snapshot saat ini, tidak diputar ulang")
+                        return []
+                    continue
+                operasi.append(entri)
+        return operasi
+    
+    @staticmethod
+    def perlu_migrasi(filename: str = 'data_mahasiswa.json') -> bool:
+        """True jika snapshot belum NDJSON ber-header generasi (array JSON lama atau NDJSON lama)"""
+        return os.path.exists(filename) and FileHandler._id_header(filename) is None
+    
+    @staticmethod
+    def format_lama(filename: str = 'data_mahasiswa.json') -> bool:
+        """True jika snapshot masih berformat array JSON lama (belum NDJSON)"""
+        if not os.path.exists(filename):
+            return False
+        with open(filename, 'r') as file:
+            while True:
+                karakter = file.read(1)
+                if not karakter or not karakter.isspace():
+                    return karakter == '['
+    
+    @staticmethod
+    def _iter_array_json(file) -> Iterator[Dict]:
+        """Membaca array JSON lama elemen demi elemen tanpa memuat seluruh file"""
+        decoder = json.JSONDecoder()
+        buffer = file.read(FileHandler.UKURAN_CHUNK).lstrip()
+        if not buffer.startswith('['):
+            raise ValueError("Format array JSON tidak valid")
+        posisi = 1
+        habis = False
+        
+        while True:
+            # Lewati spasi dan koma pemisah elemen
+            while posisi < len(buffer) and (buffer[posisi].isspace() or buffer[posisi] == ','):
+                posisi += 1
+            if posisi < len(buffer) and buffer[posisi] == ']':
+                return
+            try:
+                if posisi >= len(buffer):
+                    raise json.JSONDecodeError("Buffer habis", buffer, posisi)
+                item, posisi = decoder.raw_decode(buffer, posisi)
+            except json.JSONDecodeError:
+                if habis:
+                    raise
+                # Elemen terpotong di batas chunk: buang bagian yang sudah dibaca, tambah chunk
+                potongan = file.read(FileHandler.UKURAN_CHUNK)
+                habis = not potongan
+                buffer = buffer[posisi:] + potongan
+                posisi = 0
+                continue
+            yield item
+    
+    @staticmethod
+    def _iter_dict(filename: str) -> Iterator[Dict]:
+        """Generator dictionary record dari snapshot (NDJSON atau array JSON lama)"""
+        if not os.path.exists(filename):
+            return
+        format_lama = FileHandler.format_lama(filename)
+        with open(filename, 'r') as file:
+            if format_lama:
+                yield from FileHandler._iter_array_json(file)
+                return
+            for nomor, baris in enumerate(file, 1):
+                baris = baris.strip()
+                if not baris:
+                    continue
+                try:
+                    item = json.loads(baris)
+                except json.JSONDecodeError as e:
+                    print(f"Error parsing baris {nomor}: {str(e)}")
+                    continue
+                if nomor == 1 and isinstance(item, dict) and item.get('op') == 'snapshot':
+                    continue  # Header generasi snapshot
+                yield item
+    
+    @staticmethod
+    def iter_dari_file(filename: str = 'data_mahasiswa.json') -> Iterator[Mahasiswa]:
+        """
+        Generator mahasiswa dari snapshot; setiap record di-parse satu per satu
+        sehingga memori puncak tidak bergantung pada ukuran file.
+        Journal tidak ikut diputar - gunakan muat_ke_store atau baca_dari_file.
+        """
+        for item in FileHandler._iter_dict(filename):
+            try:
+                yield FileHandler._ke_mahasiswa(item)
+            except Exception as e:
+                print(f"Error parsing data: {item} - {str(e)}")
+    
+    @staticmethod
+    def _tambah_dari_snapshot(manajemen: DataMahasiswa, filename: str) -> HasilTambahBanyak:
+        """
+        tambah_banyak dari snapshot teks. Record yang tidak bisa dibentuk menjadi
+        Mahasiswa ikut dilaporkan sebagai ditolak, dan nomor baris di laporan
+        selalu urutan record di file.
+        """
+        gagal = []  # (nomor record di file, item, alasan)
+        
+        def parse() -> Iterator[Mahasiswa]:
+            for nomor, item in enumerate(FileHandler._iter_dict(filename), 1):
+                try:
+                    yield FileHandler._ke_mahasiswa(item)
+                except Exception as e:
+                    print(f"Error parsing data: {item} - {str(e)}")
+                    gagal.append((nomor, item, str(e)))
+        
+        hasil = manajemen.tambah_banyak(parse(), validasi=False)
+        if gagal:
+            # Nomor dari tambah_banyak hanya menghitung record yang ter-parse: geser melewati yang gagal
+            j = 0
+            for entri in hasil.ditolak:
+                nomor = entri['baris'] + j
+                while j < len(gagal) and gagal[j][0] <= nomor:
+                    j += 1
+                    nomor += 1
+                entri['baris'] = nomor
+            for nomor, item, alasan in gagal:
+                isi = item if isinstance(item, dict) else {}
+                hasil.ditolak.append({'baris': nomor, 'nim': isi.get('nim'), 'nama': isi.get('nama'),
+                                      'alasan': f"Record tidak lengkap: {alasan}"})
+            hasil.ditolak.sort(key=lambda entri: entri['baris'])
+        return hasil
     
     @staticmethod
-    def simpan_ke_file(data: List[Mahasiswa], filename: str = 'data_mahasiswa.json'):
-        """Menyimpan data mahasiswa ke file JSON"""
+    def muat_ke_store(manajemen: DataMahasiswa, filename: str = 'data_mahasiswa.json') -> HasilTambahBanyak:
+        """
+        Memuat snapshot secara streaming langsung ke store, lalu memutar ulang
+        journal lewat API store. Snapshot format lama dimigrasi ke NDJSON.
+        """
         try:
-            data_dict = [m.to_dict() for m in data]
-            with open(filename, 'w') as file:
-                json.dump(data_dict, file, indent=4)
-            return True
+            with FileHandler._kunci:
+                hasil = None
+                path_biner = FileHandler.path_biner(filename)
+                if os.path.exists(path_biner):
+                    # Snapshot biner dipakai hanya jika dibuat dari snapshot NDJSON saat ini
+                    try:
+                        with FileHandler.baca_biner(path_biner) as snapshot:
+                            if snapshot.id_snapshot is not None and snapshot.id_snapshot == FileHandler._id_biner(filename):
+                                hasil = manajemen.tambah_banyak(snapshot, validasi=False)
+                    except (ValueError, struct.error) as e:
+                        print(f"Snapshot biner diabaikan: {str(e)}")
+                if hasil is None:
+                    # Data yang sudah tersimpan tidak divalidasi ulang: record lama atau yang
+                    # ditulis tangan tetap dimuat (regex hanya untuk input form dan impor)
+                    hasil = FileHandler._tambah_dari_snapshot(manajemen, filename)
+                
+                for entri in FileHandler._baca_journal(filename):
+                    try:
+                        if entri['op'] == 'tambah':
+                            manajemen.tambah(FileHandler._ke_mahasiswa(entri['data']))
+                        elif entri['op'] == 'hapus':
+                            manajemen.hapus(entri['nim'])
+                        elif entri['op'] == 'edit':
+                            manajemen.edit(entri['nim'], FileHandler._ke_mahasiswa(entri['data']))
+                    except ValueError:
+                        pass  # Operasi sudah tercermin di snapshot
+                    except Exception as e:
+                        print(f"Error replay journal: {entri} - {str(e)}")
+                
+                if FileHandler.perlu_migrasi(filename):
+                    # File lama disimpan utuh: record yang tidak diterima store tidak ikut ke NDJSON
+                    path_cadangan = filename + '.bak'
+                    shutil.copy2(filename, path_cadangan)
+                    FileHandler.simpan_snapshot(manajemen, filename)
+                    if hasil.ditolak:
+                        print(f"{hasil.jumlah_ditolak} record tidak ikut dimigrasi, file asli tersimpan di {path_cadangan}")
+            return hasil
         except Exception as e:
-            raise Exception(f"Gagal menyimpan ke file: {str(e)}")
+            raise Exception(f"Gagal membaca dari file: {str(e)}")
     
     @staticmethod
     def baca_dari_file(filename: str = 'data_mahasiswa.json') -> List[Mahasiswa]:
-        """Membaca data mahasiswa dari file JSON"""
+        """Membaca data mahasiswa dari snapshot lalu memutar ulang journal"""
         try:
-            if not os.path.exists(filename):
-                return []
+            with FileHandler._kunci:
+                data_mahasiswa = list(FileHandler.iter_dari_file(filename))
+                operasi = FileHandler._baca_journal(filename)
             
-            with open(filename, 'r') as file:
-                data_dict = json.load(file)
+            if not operasi:
+                return data_mahasiswa
             
-            data_mahasiswa = []
-            for item in data_dict:
+            # Replay journal; slot yang dihapus ditandai None agar urutan tetap terjaga
+            posisi = {m.nim: i for i, m in enumerate(data_mahasiswa)}
+            for entri in operasi:
                 try:
-                    mahasiswa = Mahasiswa(
-                        nim=item['nim'],
-                        nama=item['nama'],
-                        jurusan=item.get('jurusan', 'Teknik Informatika'),
-                        angkatan=item.get('angkatan', '2024'),
-                        email=item.get('email', '')
-                    )
-                    data_mahasiswa.append(mahasiswa)
+                    if entri['op'] == 'tambah':
+                        m = FileHandler._ke_mahasiswa(entri['data'])
+                        if m.nim not in posisi:
+                            posisi[m.nim] = len(data_mahasiswa)
+                            data_mahasiswa.append(m)
+                    elif entri['op'] == 'hapus':
+                        i = posisi.pop(entri['nim'], None)
+                        if i is not None:
+                            data_mahasiswa[i] = None
+                    elif entri['op'] == 'edit':
+                        m = FileHandler._ke_mahasiswa(entri['data'])
+                        i = posisi.get(entri['nim'])
+                        if i is not None and (m.nim == entri['nim'] or m.nim not in posisi):
+                            del posisi[entri['nim']]
+                            posisi[m.nim] = i
+                            data_mahasiswa[i] = m
                 except Exception as e:
-                    print(f"Error parsing data: {item} - {str(e)}")
+                    print(f"Error replay journal: {entri} - {str(e)}")
             
-            return data_mahasiswa
+            return [m for m in data_mahasiswa if m is not None]
         except Exception as e:
             raise Exception(f"Gagal membaca dari file: {str(e)}")
 
+# ==============================
+# IMPOR DATA
+# ==============================
+
+class ImporMahasiswa:
+    """
+    Impor massal dari file CSV/Excel. File dibaca per potongan, tiap potongan
+    divalidasi secara vektor di process pool sementara potongan berikutnya dibaca,
+    lalu di-commit lewat tambah_banyak. NIM duplikat (dengan data yang sudah ada
+    maupun antar baris file) ditolak oleh hash index store.
+    """
+    
+    UKURAN_POTONGAN = 20_000
+    KOLOM = ('NIM', 'Nama', 'Jurusan', 'Angkatan', 'Email')
+    KOLOM_WAJIB = ('NIM', 'Nama')
+    DEFAULT = {'Jurusan': "Teknik Informatika", 'Angkatan': "2024"}  # Sama dengan default Mahasiswa
+    
+    @staticmethod
+    def baca_potongan(file, nama_file: str, ukuran: int = None) -> Iterator[Tuple[float, pd.DataFrame]]:
+        """
+        Menghasilkan (fraksi_selesai, potongan) dengan kolom KOLOM dan indeks = nomor
+        baris data berbasis 0. CSV dibaca streaming; Excel dibaca sekali lalu dipotong.
+        """
+        ukuran = ukuran or ImporMahasiswa.UKURAN_POTONGAN
+        if nama_file.lower().endswith('.xlsx'):
+            try:
+                df = pd.read_excel(file, dtype=str, keep_default_na=False, engine='openpyxl')
+            except ImportError:
+                raise ValueError("Membaca file .xlsx membutuhkan paket openpyxl (pip install openpyxl)")
+            for awal in range(0, len(df), ukuran):
+                akhir = min(awal + ukuran, len(df))
+                yield akhir / len(df), ImporMahasiswa._seragamkan(df.iloc[awal:akhir])
+            return
+        
+        file.seek(0, os.SEEK_END)
+        ukuran_file = max(file.tell(), 1)
+        file.seek(0)
+        for df in pd.read_csv(file, dtype=str, keep_default_na=False, chunksize=ukuran):
+            yield min(file.tell() / ukuran_file, 1.0), ImporMahasiswa._seragamkan(df)
+    
+    @staticmethod
+    def _seragamkan(df: pd.DataFrame) -> pd.DataFrame:
+        """Memetakan header (tanpa peka huruf besar/kecil) ke KOLOM; kolom opsional diisi kosong"""
+        peta = {str(k).strip().lower(): k for k in df.columns}
+        hilang = [k for k in ImporMahasiswa.KOLOM_WAJIB if k.lower() not in peta]
+        if hilang:
+            raise ValueError(f"Kolom wajib tidak ditemukan: {', '.join(hilang)}")
+        return pd.DataFrame({k: df[peta[k.lower()]] if k.lower() in peta else '' for k in ImporMahasiswa.KOLOM},
+                            index=df.index)
+    
+    @staticmethod
+    def validasi_potongan(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Dijalankan di proses pekerja: merapikan spasi, mengisi default jurusan/angkatan,
+        dan menambah kolom 'Alasan' (kosong untuk baris yang valid).
+        """
+        df = df.apply(lambda kolom: kolom.astype(str).str.strip())
+        for kolom, nilai in ImporMahasiswa.DEFAULT.items():
+            df[kolom] = df[kolom].mask(df[kolom] == '', nilai)
+        df['Alasan'] = ValidatorMahasiswa.alasan_batch(ValidatorMahasiswa.validasi_batch(df))
+        return df
+    
+    @staticmethod
+    def validasi_paralel(potongan: Iterable[Tuple[float, pd.DataFrame]],
+                         pekerja: int = None) -> Iterator[Tuple[float, pd.DataFrame]]:
+        """
+        Memvalidasi potongan di process pool dengan urutan hasil tetap. Paling banyak
+        2 x pekerja potongan menunggu di memori. Jika pool tidak bisa dipakai (misalnya
+        proses anak tidak dapat dibuat), sisa potongan divalidasi di proses ini.
+        """
+        pekerja = pekerja or min(4, os.cpu_count() or 1)
+        validasi = ImporMahasiswa.validasi_potongan
+        if pekerja < 2:
+            for fraksi, df in potongan:
+                yield fraksi, validasi(df)
+            return
+        
+        try:
+            pool = ProcessPoolExecutor(max_workers=pekerja)
+        except (OSError, NotImplementedError):
+            pool = None
+        antrian = deque()  # (fraksi, potongan, future) sesuai urutan file
+        
+        def ambil():
+            fraksi, df, future = antrian.popleft()
+            if future is not None:
+                try:
+                    return fraksi, future.result()
+                except (BrokenProcessPool, pickle.PicklingError, OSError):
+                    pass
+            return fraksi, validasi(df)
+        
+        try:
+            for fraksi, df in potongan:
+                future = None
+                if pool is not None:
+                    try:
+                        future = pool.submit(validasi, df)
+                    except (BrokenProcessPool, RuntimeError):
+                        pool = None
+                antrian.append((fraksi, df, future))
+                if len(antrian) >= 2 * pekerja:
+                    yield ambil()
+            while antrian:
+                yield ambil()
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+    
+    @staticmethod
+    def commit_potongan(manajemen: DataMahasiswa, df: pd.DataFrame, hasil: HasilTambahBanyak) -> List[Mahasiswa]:
+        """
+        Memasukkan baris valid sebuah potongan tervalidasi lewat tambah_banyak dan mencatat
+        semua penolakan ke hasil (nomor baris = baris data di file, mulai dari 1).
+        Mengembalikan record yang benar-benar masuk (untuk journal).
+        """
+        valid = df['Alasan'] == ''
+        salah = df[~valid]
+        hasil.ditolak.extend({'baris': i + 1, 'nim': nim, 'nama': nama, 'alasan': alasan}
+                             for i, nim, nama, alasan in zip(salah.index.tolist(), salah['NIM'].tolist(),
+                                                             salah['Nama'].tolist(), salah['Alasan'].tolist()))
+        
+        df = df[valid]
+        daftar = [Mahasiswa(nim=nim, nama=nama, jurusan=jurusan, angkatan=angkatan, email=email)
+                  for nim, nama, jurusan, angkatan, email in zip(*(df[k].tolist() for k in ImporMahasiswa.KOLOM))]
+        tambahan = manajemen.tambah_banyak(daftar, validasi=False)
+        if not tambahan.ditolak:
+            hasil.berhasil += tambahan.berhasil
+            return daftar
+        
+        # Nomor baris dari tambah_banyak adalah posisi di daftar (mulai 1)
+        gagal = {entri['baris'] - 1 for entri in tambahan.ditolak}
+        baris_file = df.index.tolist()
+        for entri in tambahan.ditolak:
+            entri['baris'] = baris_file[entri['baris'] - 1] + 1
+        hasil.ditolak.extend(tambahan.ditolak)
+        hasil.berhasil += tambahan.berhasil
+        return [m for i, m in enumerate(daftar) if i not in gagal]
+    
+    @staticmethod
+    def laporan_tolak(hasil: HasilTambahBanyak) -> pd.DataFrame:
+        """Laporan penolakan terurut per baris file"""
+        laporan = pd.DataFrame(hasil.ditolak, columns=['baris', 'nim', 'nama', 'alasan'])
+        laporan = laporan.sort_values('baris', kind='stable').reset_index(drop=True)
+        return laporan.rename(columns={'baris': 'Baris', 'nim': 'NIM', 'nama': 'Nama', 'alasan': 'Alasan'})
+
 # ==============================
 # AUTHENTICATION SYSTEM
 # ==============================
@@ -736,6 +3548,290 @@ class AuthSystem:
             return self.__users[username] == self._hash_password(password)
         return False
 
+# ==============================
+# SHARED STORE
+# ==============================
+
+# Backend store: "list" (array di memori + file JSON), "kolom" (kolom NumPy + file JSON) atau "sqlite"
+BACKEND_STORE = os.environ.get('MAHASISWA_BACKEND', 'list')
+
+class PenyimpanOtomatis:
+    """
+    Penulis latar belakang untuk perubahan data. Mutasi dari UI hanya masuk
+    antrian (tanpa I/O); thread penulis menunggu sampai tidak ada mutasi baru
+    selama `jeda` detik (paling lama `jeda_maks` detik sejak mutasi pertama),
+    lalu menulis seluruh antrian ke journal dengan satu write+fsync dan
+    melakukan compaction (snapshot sementara + rename atomik) bila perlu.
+    Penulisan yang gagal dicoba lagi dengan jeda bertambah (paling lama
+    `jeda_gagal_maks` detik); pesan galat terakhir tersedia di `galat`.
+    """
+    
+    def __init__(self, tulis_journal, padatkan, jeda: float = 0.5, jeda_maks: float = 5.0,
+                 jeda_gagal_maks: float = 60.0):
+        self._tulis_journal = tulis_journal  # Callable(entri: List[Dict], manajemen)
+        self._padatkan = padatkan  # Callable(manajemen, paksa: bool) - compaction bila perlu
+        self.jeda = jeda
+        self.jeda_maks = jeda_maks
+        self.jeda_gagal_maks = jeda_gagal_maks
+        self.galat: Optional[str] = None  # Galat penulisan terakhir, None setelah berhasil
+        self._gagal_beruntun = 0
+        self._coba_lagi = 0.0  # Waktu paling awal percobaan ulang setelah gagal
+        self._kondisi = threading.Condition()
+        self._antrian: List[Dict] = []
+        self._manajemen: Optional[DataMahasiswa] = None
+        self._snapshot_diminta = False
+        self._sedang_menulis = False
+        self._pertama = 0.0  # Waktu mutasi pertama yang belum ditulis
+        self._terakhir = 0.0  # Waktu mutasi terakhir
+        self._thread: Optional[threading.Thread] = None
+        self._kunci_mutasi = threading.Lock()
+        atexit.register(self.flush)
+    
+    def _jadwalkan(self, manajemen: DataMahasiswa):
+        """Dipanggil dengan self._kondisi dipegang"""
+        sekarang = time.monotonic()
+        if not self._antrian and not self._snapshot_diminta:
+            self._pertama = sekarang
+        self._terakhir = sekarang
+        self._manajemen = manajemen
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._jalan, name="penyimpan-otomatis", daemon=True)
+            self._thread.start()
+        self._kondisi.notify_all()
+    
+    @contextmanager
+    def mutasi(self):
+        """
+        Dipegang pemanggil selama mutasi store dan pencatatannya, sehingga urutan
+        entri di antrian sama dengan urutan mutasi diterapkan oleh semua sesi.
+        """
+        with self._kunci_mutasi:
+            yield
+    
+    def catat(self, manajemen: DataMahasiswa, op: str, nim: str = None, mahasiswa: Mahasiswa = None):
+        """Memasukkan satu perubahan ke antrian simpan - tidak menyentuh disk"""
+        entri = FileHandler.entri_journal(op, nim, mahasiswa)
+        with self._kondisi:
+            self._antrian.append(entri)
+            self._jadwalkan(manajemen)
+    
+    def catat_banyak(self, manajemen: DataMahasiswa, daftar_entri: List[Dict]):
+        """Memasukkan banyak perubahan (misalnya satu batch hapus/edit) ke antrian sekaligus"""
+        if not daftar_entri:
+            return
+        with self._kondisi:
+            self._antrian.extend(daftar_entri)
+            self._jadwalkan(manajemen)
+    
+    def minta_snapshot(self, manajemen: DataMahasiswa):
+        """Meminta penulisan snapshot penuh (compaction) pada giliran simpan berikutnya"""
+        with self._kondisi:
+            self._snapshot_diminta = True
+            self._jadwalkan(manajemen)
+    
+    def jumlah_tertunda(self) -> int:
+        """Jumlah perubahan yang belum tertulis ke disk"""
+        with self._kondisi:
+            return len(self._antrian) + (1 if self._snapshot_diminta or self._sedang_menulis else 0)
+    
+    def _ambil_batch(self, tunggu: bool) -> Optional[Tuple[List[Dict], DataMahasiswa, bool]]:
+        with self._kondisi:
+            while True:
+                if not self._antrian and not self._snapshot_diminta:
+                    if not tunggu:
+                        return None
+                    self._kondisi.wait()
+                    continue
+                sekarang = time.monotonic()
+                batas = max(min(self._terakhir + self.jeda, self._pertama + self.jeda_maks), self._coba_lagi)
+                if tunggu and sekarang < batas:
+                    self._kondisi.wait(batas - sekarang)
+                    continue
+                batch = (self._antrian, self._manajemen, self._snapshot_diminta)
+                self._antrian = []
+                self._snapshot_diminta = False
+                self._sedang_menulis = True
+                return batch
+    
+    def _proses(self, batch: Tuple[List[Dict], DataMahasiswa, bool]):
+        entri, manajemen, snapshot = batch
+        try:
+            if entri:
+                self._tulis_journal(entri, manajemen)
+                entri = []  # Sudah tahan lama; percobaan ulang tidak menambahkannya lagi ke journal
+            self._padatkan(manajemen, snapshot)
+            with self._kondisi:
+                self.galat = None
+                self._gagal_beruntun = 0
+                self._coba_lagi = 0.0
+        except Exception as e:
+            print(f"Gagal menyimpan otomatis, dicoba lagi: {str(e)}")
+            with self._kondisi:
+                self._antrian = entri + self._antrian
+                self._snapshot_diminta = self._snapshot_diminta or snapshot
+                self.galat = str(e)
+                self._gagal_beruntun += 1
+                tunda = min(self.jeda * 2 ** self._gagal_beruntun, self.jeda_gagal_maks)
+                self._pertama = self._terakhir = time.monotonic()
+                self._coba_lagi = self._pertama + tunda
+        finally:
+            with self._kondisi:
+                self._sedang_menulis = False
+                self._kondisi.notify_all()
+    
+    def _jalan(self):
+        while True:
+            self._proses(self._ambil_batch(tunggu=True))
+    
+    def flush(self):
+        """Menulis semua perubahan tertunda sekarang (dipakai saat proses berhenti)"""
+        with self._kondisi:
+            while self._sedang_menulis:
+                self._kondisi.wait()
+        batch = self._ambil_batch(tunggu=False)
+        if batch is not None:
+            self._proses(batch)
+
+class PemuatData:
+    """
+    Memegang store bersama beserta sidik jari file data (mtime, ukuran, hash isi).
+    File hanya di-parse ulang jika sidik jarinya berubah; store baru dibangun
+    terpisah lalu ditukar secara atomik sehingga pembaca tidak melihat store setengah jadi.
+    """
+    
+    def __init__(self, filename: str = 'data_mahasiswa.json'):
+        self.filename = filename
+        self.manajemen: Optional[DataMahasiswa] = None
+        self.hasil_muat = HasilTambahBanyak()
+        self.__stat = None  # (mtime, ukuran) snapshot & journal saat terakhir dimuat
+        self.__hash = None  # Hash isi snapshot & journal saat terakhir dimuat
+        self.__kunci = threading.Lock()
+        self.penyimpan = PenyimpanOtomatis(self._tulis_journal, self._padatkan)
+    
+    def _path_dipantau(self) -> List[str]:
+        return [self.filename, FileHandler.path_journal(self.filename)]
+    
+    def _stat_file(self) -> Tuple:
+        hasil = []
+        for path in self._path_dipantau():
+            try:
+                stat = os.stat(path)
+                hasil.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                hasil.append(None)
+        return tuple(hasil)
+    
+    def _hash_file(self) -> str:
+        sha = hashlib.sha256()
+        for path in self._path_dipantau():
+            if os.path.exists(path):
+                with open(path, 'rb') as file:
+                    for potongan in iter(lambda: file.read(1024 * 1024), b''):
+                        sha.update(potongan)
+            sha.update(b'\0')
+        return sha.hexdigest()
+    
+    def _berubah(self) -> bool:
+        """Cek murah lewat stat; hash isi hanya dihitung jika mtime/ukuran berbeda"""
+        stat = self._stat_file()
+        if stat == self.__stat:
+            return False
+        hash_isi = self._hash_file()
+        if hash_isi == self.__hash:
+            self.__stat = stat  # File disentuh tanpa perubahan isi
+            return False
+        return True
+    
+    def muat(self) -> bool:
+        """Memuat ulang store jika file berubah. Mengembalikan True jika store diganti."""
+        if BACKEND_STORE == 'sqlite':
+            if self.manajemen is not None:
+                return False
+            with self.__kunci:
+                if self.manajemen is None:
+                    manajemen = ManajemenMahasiswaSQLite(os.environ.get('MAHASISWA_DB', 'data_mahasiswa.db'))
+                    if manajemen.jumlah() == 0:
+                        # Database baru: migrasi sekali dari file JSON
+                        self.hasil_muat = FileHandler.muat_ke_store(manajemen, self.filename)
+                    self.manajemen = manajemen
+            return True
+        
+        if self.manajemen is not None:
+            if self.penyimpan.jumlah_tertunda():
+                return False  # Store di memori lebih baru dari file; muat setelah tersimpan
+            if self._stat_file() == self.__stat:
+                return False  # Cek murah tanpa kunci; isi file di-hash hanya di dalam kunci
+        
+        # Thread UI tidak pernah menunggu penulis: jika journal/compaction sedang
+        # berjalan, cek diulang pada rerun berikutnya. Muat pertama tetap menunggu.
+        if not self.__kunci.acquire(blocking=self.manajemen is None):
+            return False
+        try:
+            if self.manajemen is not None and self.penyimpan.jumlah_tertunda():
+                return False
+            stat = self._stat_file()
+            if self.manajemen is not None and stat == self.__stat:
+                return False  # Sudah dimuat ulang oleh sesi lain
+            # Satu kali hash per perubahan isi; digest yang sama dipakai sebagai sidik jari baru
+            hash_isi = self._hash_file()
+            if self.manajemen is not None and hash_isi == self.__hash:
+                # File disentuh tanpa perubahan isi: journal tetap cocok karena header-nya menunjuk
+                # id generasi di dalam snapshot, bukan stat, jadi cukup catat stat baru
+                self.__stat = stat
+                return False
+            migrasi = FileHandler.perlu_migrasi(self.filename)
+            versi_awal = self.manajemen.versi + 1 if self.manajemen is not None else 0
+            kelas = ManajemenMahasiswaKolom if BACKEND_STORE == 'kolom' else ManajemenMahasiswa
+            manajemen = kelas(versi_awal)
+            hasil = FileHandler.muat_ke_store(manajemen, self.filename)
+            if migrasi:
+                # File baru saja ditulis ulang ke NDJSON oleh muat_ke_store; seperti setelah
+                # compaction, stat baru dicatat tanpa hash (hash dihitung jika stat berubah lagi)
+                stat, hash_isi = self._stat_file(), None
+            # Tukar store lama dengan yang baru dalam satu assignment
+            self.manajemen, self.hasil_muat = manajemen, hasil
+            self.__stat, self.__hash = stat, hash_isi
+            return True
+        finally:
+            self.__kunci.release()
+    
+    def _perbarui_sidik(self, manajemen: DataMahasiswa, berubah_dari_luar: bool):
+        """Perubahan dari luar aplikasi tidak boleh tertutupi oleh sidik jari baru"""
+        if not berubah_dari_luar and manajemen is self.manajemen:
+            self.__stat = self._stat_file()
+            self.__hash = None
+    
+    def _tulis_journal(self, entri: List[Dict], manajemen: DataMahasiswa):
+        """Dijalankan oleh thread penyimpan: append journal lalu sidik jari"""
+        with self.__kunci:
+            berubah_dari_luar = self._berubah()
+            FileHandler.catat_operasi_banyak(entri, self.filename)
+            self._perbarui_sidik(manajemen, berubah_dari_luar)
+    
+    def _padatkan(self, manajemen: DataMahasiswa, paksa: bool):
+        """Dijalankan oleh thread penyimpan: compaction jika diminta atau journal sudah besar"""
+        with self.__kunci:
+            if not paksa and not FileHandler.perlu_compaction(self.filename):
+                return
+            berubah_dari_luar = self._berubah()
+            FileHandler.simpan_snapshot(manajemen, self.filename)
+            self._perbarui_sidik(manajemen, berubah_dari_luar)
+
+@st.cache_resource(show_spinner="⏳ Memuat data mahasiswa...")
+def pemuat_data_bersama(filename: str = 'data_mahasiswa.json') -> PemuatData:
+    """
+    Membuat pemuat data sekali per proses server. Store di dalamnya dipakai
+    bersama oleh semua sesi browser dan semua rerun.
+    """
+    pemuat = PemuatData(filename)
+    pemuat.muat()
+    return pemuat
+
+@st.cache_resource
+def cache_pencarian_bersama() -> CacheHasilPencarian:
+    """Cache hasil pencarian sekali per proses server, dipakai bersama semua sesi"""
+    return CacheHasilPencarian()
+
 # ==============================
 # STREAMLIT GUI APPLICATION
 # ==============================
@@ -744,7 +3840,12 @@ class AplikasiManajemenMahasiswa:
     """Kelas utama untuk aplikasi Streamlit"""
     
     def __init__(self):
-        self.manajemen = ManajemenMahasiswa()
+        # Store dipakai bersama semua sesi; file hanya di-parse ulang jika berubah
+        self.pemuat = pemuat_data_bersama()
+        self.pemuat.muat()
+        self.manajemen = self.pemuat.manajemen
+        self.cache_pencarian = cache_pencarian_bersama()
+        hasil_muat = self.pemuat.hasil_muat
         self.auth = AuthSystem()
         self.file_handler = FileHandler()
         self.email_handler = EmailHandler()
@@ -754,28 +3855,54 @@ class AplikasiManajemenMahasiswa:
             st.session_state.logged_in = False
         if 'user_role' not in st.session_state:
             st.session_state.user_role = None
+        if 'pencarian_bertahap' not in st.session_state:
+            st.session_state.pencarian_bertahap = PencarianBertahap()
         if 'data_mahasiswa' not in st.session_state:
-            st.session_state.data_mahasiswa = []
-        
-        # Load data dari file saat aplikasi dimulai
-        self._load_data()
+            # Sesi hanya menyimpan nomor versi store, bukan salinan data
+            st.session_state.data_mahasiswa = self.manajemen.versi
+            if hasil_muat.ditolak:
+                st.warning(f"⚠️ {hasil_muat.jumlah_ditolak} data dilewati saat memuat file "
+                           f"(contoh: NIM {hasil_muat.ditolak[0]['nim']} - {hasil_muat.ditolak[0]['alasan']})")
     
-    def _load_data(self):
-        """Memuat data dari file"""
+    def _load_data(self) -> bool:
+        """Memuat ulang data dari file jika file berubah sejak terakhir dimuat"""
         try:
-            data = self.file_handler.baca_dari_file()
-            for m in data:
-                self.manajemen.tambah(m)
-            st.session_state.data_mahasiswa = self.manajemen.get_semua()
+            dimuat = self.pemuat.muat()
+            self.manajemen = self.pemuat.manajemen
+            hasil = self.pemuat.hasil_muat
+            if dimuat and hasil.ditolak:
+                st.warning(f"⚠️ {hasil.jumlah_ditolak} data dilewati saat memuat file "
+                           f"(contoh: NIM {hasil.ditolak[0]['nim']} - {hasil.ditolak[0]['alasan']})")
+            st.session_state.data_mahasiswa = self.manajemen.versi
+            return dimuat
         except Exception as e:
             st.error(f"Error loading data: {str(e)}")
+            return False
     
     def _save_data(self):
-        """Menyimpan data ke file"""
-        try:
-            self.file_handler.simpan_ke_file(self.manajemen.get_semua())
-        except Exception as e:
-            st.error(f"Error saving data: {str(e)}")
+        """Menjadwalkan penyimpanan snapshot penuh di thread latar belakang"""
+        self.pemuat.penyimpan.minta_snapshot(self.manajemen)
+    
+    def _catat_perubahan(self, op: str, nim: str = None, mahasiswa: Mahasiswa = None):
+        """
+        Mengantrikan satu perubahan untuk disimpan otomatis (debounced, di latar belakang).
+        Panggil di dalam penyimpan.mutasi() bersama mutasinya agar urutan journal terjaga.
+        """
+        if BACKEND_STORE == 'sqlite':
+            return  # Perubahan sudah tahan lama di database
+        self.pemuat.penyimpan.catat(self.manajemen, op, nim=nim, mahasiswa=mahasiswa)
+    
+    def _catat_hapus_banyak(self, nims: Iterable[str]):
+        """Mengantrikan satu entri journal 'hapus' per NIM dari sebuah batch"""
+        if BACKEND_STORE == 'sqlite':
+            return
+        self.pemuat.penyimpan.catat_banyak(self.manajemen, [FileHandler.entri_journal('hapus', nim=nim) for nim in nims])
+    
+    def _catat_tambah_banyak(self, daftar: Iterable[Mahasiswa]):
+        """Mengantrikan satu entri journal 'tambah' per record dari sebuah batch"""
+        if BACKEND_STORE == 'sqlite':
+            return
+        self.pemuat.penyimpan.catat_banyak(self.manajemen, [FileHandler.entri_journal('tambah', mahasiswa=m) for m in daftar])
     
     def login_page(self):
         """Halaman login dengan desain modern"""
@@ -860,6 +3987,10 @@ class AplikasiManajemenMahasiswa:
         
         # Stats bar
         self._display_stats_bar()
+        galat_simpan = self.pemuat.penyimpan.galat
+        if galat_simpan:
+            st.error(f"⚠️ {self.pemuat.penyimpan.jumlah_tertunda()} perubahan belum tersimpan ke disk "
+                     f"(dicoba lagi otomatis): {galat_simpan}")
         
         # Sidebar menu dengan glassmorphism
         with st.sidebar:
@@ -872,6 +4003,7 @@ class AplikasiManajemenMahasiswa:
             menu_options = [
                 ("📊 Dashboard", "dashboard"),
                 ("➕ Tambah Data", "tambah"),
+                ("📥 Impor Data", "impor"),
                 ("✏️ Edit Data", "edit"),
                 ("🗑️ Hapus Data", "hapus"),
                 ("🔍 Pencarian", "pencarian"),
@@ -899,26 +4031,27 @@ class AplikasiManajemenMahasiswa:
             with col1:
                 if st.button("💾 Simpan", use_container_width=True):
                     self._save_data()
-                    st.toast("✅ Data berhasil disimpan!", icon="✅")
+                    st.toast("✅ Data sedang disimpan di latar belakang!", icon="✅")
             with col2:
                 if st.button("🔄 Muat Ulang", use_container_width=True):
-                    self._load_data()
-                    st.toast("🔄 Data berhasil dimuat ulang!", icon="🔄")
+                    if self._load_data():
+                        st.toast("🔄 Data berhasil dimuat ulang!", icon="🔄")
+                    else:
+                        st.toast("✅ File tidak berubah, data sudah terbaru", icon="✅")
+            
+            tertunda = self.pemuat.penyimpan.jumlah_tertunda()
+            if tertunda:
+                st.caption(f"⏳ {tertunda} perubahan menunggu disimpan otomatis")
             
             # Real-time stats
             st.markdown("---")
             st.markdown("### 📈 Statistik Real-time")
             
-            data = self.manajemen.get_semua()
-            if data:
-                jurusan_counts = {}
-                for m in data:
-                    jurusan_counts[m.jurusan] = jurusan_counts.get(m.jurusan, 0) + 1
-                
-                most_common_jurusan = max(jurusan_counts, key=jurusan_counts.get)
-                
-                st.metric("👥 Total Mahasiswa", self.manajemen.jumlah())
-                st.metric("🎓 Jurusan Terbanyak", most_common_jurusan)
+            # Dibaca dari statistik agregat store, bukan dihitung ulang
+            statistik = self.manajemen.statistik()
+            if statistik.total:
+                st.metric("👥 Total Mahasiswa", statistik.total)
+                st.metric("🎓 Jurusan Terbanyak", statistik.jurusan_terbanyak)
                 st.metric("📅 Tahun Aktif", "2024")
         
         # Konten berdasarkan menu
@@ -926,6 +4059,8 @@ class AplikasiManajemenMahasiswa:
             self._dashboard()
         elif menu_key == "tambah":
             self._tambah_data()
+        elif menu_key == "impor":
+            self._impor_data()
         elif menu_key == "edit":
             self._edit_data()
         elif menu_key == "hapus":
@@ -945,6 +4080,7 @@ class AplikasiManajemenMahasiswa:
     
     def _display_stats_bar(self):
         """Menampilkan statistik bar"""
+        statistik = self.manajemen.statistik()
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
@@ -952,15 +4088,14 @@ class AplikasiManajemenMahasiswa:
             <div class="stat-card blue-card">
                 <div class="stat-icon">👥</div>
                 <div class="stat-content">
-                    <div class="stat-value">{self.manajemen.jumlah()}</div>
+                    <div class="stat-value">{statistik.total}</div>
                     <div class="stat-label">Total Mahasiswa</div>
                 </div>
             </div>
             """, unsafe_allow_html=True)
         
         with col2:
-            data = self.manajemen.get_semua()
-            jurusan_count = len(set([m.jurusan for m in data])) if data else 0
+            jurusan_count = len(statistik.per_jurusan)
             st.markdown(f"""
             <div class="stat-card green-card">
                 <div class="stat-icon">🎓</div>
@@ -972,10 +4107,7 @@ class AplikasiManajemenMahasiswa:
             """, unsafe_allow_html=True)
         
         with col3:
-            if data:
-                angkatan_count = len(set([m.nim[:4] for m in data if len(m.nim) >= 4]))
-            else:
-                angkatan_count = 0
+            angkatan_count = len(statistik.per_angkatan)
             st.markdown(f"""
             <div class="stat-card orange-card">
                 <div class="stat-icon">📅</div>
@@ -1007,24 +4139,24 @@ class AplikasiManajemenMahasiswa:
             col1, col2, col3 = st.columns(3)
             with col1:
                 filter_nim = st.text_input("🔍 Filter NIM", placeholder="Cari berdasarkan NIM...")
+                self._tampilkan_saran(filter_nim, lambda m: m.nim)
             with col2:
                 filter_nama = st.text_input("🔍 Filter Nama", placeholder="Cari berdasarkan nama...")
+                self._tampilkan_saran(filter_nama, lambda m: m.nama)
             with col3:
                 filter_jurusan = st.selectbox(
                     "🎓 Filter Jurusan",
-                    ["Semua Jurusan"] + list(sorted(set([m.jurusan for m in self.manajemen.get_semua()])))
+                    ["Semua Jurusan"] + self.manajemen.daftar_jurusan()
                 )
         
-        # Data tabel
-        data = self.manajemen.get_semua()
-        
-        # Filter data
-        if filter_nim:
-            data = [m for m in data if filter_nim in m.nim]
-        if filter_nama:
-            data = [m for m in data if filter_nama.lower() in m.nama.lower()]
-        if filter_jurusan != "Semua Jurusan":
-            data = [m for m in data if m.jurusan == filter_jurusan]
+        # Data tabel (filter dijalankan oleh backend store; saat keyword diperpanjang
+        # cukup hasil ketikan sebelumnya yang disaring)
+        jurusan = None if filter_jurusan == "Semua Jurusan" else filter_jurusan
+        data = st.session_state.pencarian_bertahap.cari(
+            'dashboard', (filter_nim, filter_nama), jurusan, self.manajemen.versi,
+            lambda: self.manajemen.filter(nim=filter_nim, nama=filter_nama, jurusan=jurusan),
+            lambda lama: DataMahasiswa._saring(lama, filter_nim, filter_nama, None, True)
+        )
         
         if data:
             # Tampilkan data dalam card grid
@@ -1039,22 +4171,17 @@ class AplikasiManajemenMahasiswa:
             # Jika ada lebih dari 12 data, tampilkan tabel
             if len(data) > 12:
                 with st.expander("📋 Lihat Semua Data dalam Tabel"):
-                    df_data = []
-                    for m in data:
-                        df_data.append({
-                            'NIM': m.nim,
-                            'Nama': m.nama,
-                            'Jurusan': m.jurusan,
-                            'Angkatan': m.angkatan,
-                            'Email': m.email if m.email else '-'
-                        })
-                    
-                    df = pd.DataFrame(df_data)
+                    df = self.manajemen.ke_dataframe(data)
+                    df['Email'] = df['Email'].replace('', '-')
                     st.dataframe(df, use_container_width=True, hide_index=True)
             
-            # Visualisasi data
+            # Visualisasi data: tanpa filter dibaca dari statistik store, dengan filter dihitung dari hasilnya
             st.markdown("---")
-            self._visualize_data(data)
+            if filter_nim or filter_nama or filter_jurusan != "Semua Jurusan":
+                statistik = RingkasanStatistik.dari_dataframe(self.manajemen.ke_dataframe(data))
+            else:
+                statistik = self.manajemen.statistik()
+            self._visualize_data(statistik)
             
         else:
             st.markdown("""
@@ -1087,7 +4214,7 @@ class AplikasiManajemenMahasiswa:
         </div>
         """, unsafe_allow_html=True)
     
-    def _visualize_data(self, data: List[Mahasiswa]):
+    def _visualize_data(self, statistik: RingkasanStatistik):
         """Visualisasi data dengan Plotly"""
         st.subheader("📊 Visualisasi Data")
         
@@ -1095,9 +4222,7 @@ class AplikasiManajemenMahasiswa:
         
         with tab1:
             # Jurusan distribution
-            jurusan_counts = {}
-            for m in data:
-                jurusan_counts[m.jurusan] = jurusan_counts.get(m.jurusan, 0) + 1
+            jurusan_counts = statistik.per_jurusan
             
             if jurusan_counts:
                 fig = go.Figure(data=[
@@ -1116,10 +4241,7 @@ class AplikasiManajemenMahasiswa:
         
         with tab2:
             # Angkatan distribution
-            angkatan_counts = {}
-            for m in data:
-                angkatan = m.angkatan
-                angkatan_counts[angkatan] = angkatan_counts.get(angkatan, 0) + 1
+            angkatan_counts = dict(sorted(statistik.per_angkatan.items()))
             
             if angkatan_counts:
                 fig = go.Figure(data=[
@@ -1143,18 +4265,14 @@ class AplikasiManajemenMahasiswa:
             # Statistics
             col1, col2, col3 = st.columns(3)
             with col1:
-                avg_name_len = sum(len(m.nama) for m in data) / len(data) if data else 0
-                st.metric("📝 Rata-rata Panjang Nama", f"{avg_name_len:.1f} karakter")
+                st.metric("📝 Rata-rata Panjang Nama", f"{statistik.rata_panjang_nama:.1f} karakter")
             
             with col2:
-                jurusan_unique = len(set(m.jurusan for m in data))
-                st.metric("🎓 Jumlah Jurusan Unik", jurusan_unique)
+                st.metric("🎓 Jumlah Jurusan Unik", len(statistik.per_jurusan))
             
             with col3:
-                if data:
-                    dengan_email = len([m for m in data if m.email])
-                    persentase = (dengan_email / len(data)) * 100 if data else 0
-                    st.metric("📧 Memiliki Email", f"{dengan_email} ({persentase:.1f}%)")
+                if statistik.total:
+                    st.metric("📧 Memiliki Email", f"{statistik.dengan_email} ({statistik.persen_email:.1f}%)")
     
     def _tambah_data(self):
         """Form tambah data mahasiswa dengan desain modern"""
@@ -1206,28 +4324,28 @@ class AplikasiManajemenMahasiswa:
                 if st.button("📋 **Template**", use_container_width=True):
                     st.code("NIM: 24101140099\nNama: Azka Insan Robbani\nJurusan: Teknik Informatika\nEmail: azka@example.com")
     
+    def _cek_form(self, nim: str, nama: str, email: str) -> bool:
+        """Validasi input form tambah/edit; pesan kesalahan ditampilkan langsung"""
+        if not nim or not nama:
+            st.error("❌ NIM dan Nama wajib diisi!")
+            return False
+        field = ValidatorMahasiswa.cek(nim, nama, email)
+        if field:
+            st.error(f"❌ {ValidatorMahasiswa.PESAN[field]}")
+            return False
+        return True
+    
     def _process_tambah_data(self, nim: str, nama: str, jurusan: str, angkatan: str, email: str):
         """Memproses penambahan data"""
         try:
-            if not nim or not nama:
-                st.error("❌ NIM dan Nama wajib diisi!")
-                return
-            
-            if not re.match(r'^\d{9,12}$', nim):
-                st.error("❌ NIM harus terdiri dari 9-12 digit angka!")
-                return
-            
-            if not re.match(r'^[A-Za-z\s\.\,]{3,50}$', nama):
-                st.error("❌ Nama hanya boleh mengandung huruf, spasi, titik, dan koma!")
-                return
-            
-            if email and not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', email):
-                st.error("❌ Format email tidak valid!")
+            if not self._cek_form(nim, nama, email):
                 return
             
             mahasiswa_baru = Mahasiswa(nim=nim, nama=nama, jurusan=jurusan, angkatan=angkatan, email=email)
-            self.manajemen.tambah(mahasiswa_baru)
-            st.session_state.data_mahasiswa = self.manajemen.get_semua()
+            with self.pemuat.penyimpan.mutasi():
+                self.manajemen.tambah(mahasiswa_baru)
+                self._catat_perubahan('tambah', mahasiswa=mahasiswa_baru)
+            st.session_state.data_mahasiswa = self.manajemen.versi
             
             # Success animation
             st.success(f"✅ Data **{nama}** berhasil ditambahkan!")
@@ -1242,12 +4360,93 @@ class AplikasiManajemenMahasiswa:
         except Exception as e:
             st.error(f"❌ Terjadi kesalahan: {str(e)}")
     
+    def _impor_data(self):
+        """Halaman impor massal dari file CSV/Excel"""
+        st.markdown("## 📥 Impor Data Mahasiswa")
+        st.caption("Kolom: **NIM**, **Nama**, Jurusan, Angkatan, Email (header tidak peka huruf besar/kecil). "
+                   f"Jurusan dan angkatan kosong diisi {ImporMahasiswa.DEFAULT['Jurusan']} / {ImporMahasiswa.DEFAULT['Angkatan']}.")
+        
+        with st.container(border=True):
+            file = st.file_uploader("Pilih file CSV atau Excel (.xlsx)", type=['csv', 'xlsx'], key="file_impor")
+            if file is not None and st.button("📥 **Impor Sekarang**", type="primary", use_container_width=True):
+                self._process_impor(file)
+        
+        # Hasil impor terakhir disimpan di sesi agar tetap tampil saat laporan diunduh
+        hasil = st.session_state.get('hasil_impor')
+        if not hasil:
+            return
+        st.markdown(f"### 📋 Hasil Impor: {hasil['nama_file']}")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("✅ Berhasil", f"{hasil['berhasil']:,}")
+        with col2:
+            st.metric("❌ Ditolak", f"{len(hasil['laporan']):,}")
+        with col3:
+            st.metric("⏱️ Waktu", f"{hasil['waktu']:.2f} s")
+        
+        if len(hasil['laporan']):
+            with st.expander(f"📄 Baris Ditolak ({len(hasil['laporan'])})"):
+                st.dataframe(hasil['laporan'].head(1000), use_container_width=True, hide_index=True)
+            st.download_button(
+                "⬇️ Unduh Laporan Penolakan (CSV)",
+                data=hasil['laporan'].to_csv(index=False).encode('utf-8'),
+                file_name=f"ditolak_{os.path.splitext(hasil['nama_file'])[0]}.csv",
+                mime="text/csv",
+            )
+    
+    def _process_impor(self, file):
+        """Membaca, memvalidasi (paralel), dan meng-commit file impor per potongan"""
+        hasil = HasilTambahBanyak()
+        progres = st.progress(0.0, text="Membaca file...")
+        mulai = time.perf_counter()
+        selesai = False
+        try:
+            potongan = ImporMahasiswa.baca_potongan(file, file.name)
+            for fraksi, df in ImporMahasiswa.validasi_paralel(potongan):
+                with self.pemuat.penyimpan.mutasi():
+                    masuk = ImporMahasiswa.commit_potongan(self.manajemen, df, hasil)
+                    self._catat_tambah_banyak(masuk)
+                progres.progress(fraksi, text=f"⏳ {hasil.berhasil:,} masuk, {hasil.jumlah_ditolak:,} ditolak")
+            selesai = True
+        except ValueError as e:
+            st.error(f"❌ Error: {str(e)}")
+        except Exception as e:
+            st.error(f"❌ Gagal membaca file: {str(e)}")
+        finally:
+            progres.empty()
+        
+        if hasil.berhasil:
+            st.session_state.data_mahasiswa = self.manajemen.versi
+        if selesai or hasil.berhasil:
+            st.session_state.hasil_impor = {
+                'nama_file': file.name,
+                'berhasil': hasil.berhasil,
+                'laporan': ImporMahasiswa.laporan_tolak(hasil),
+                'waktu': time.perf_counter() - mulai,
+            }
+        if selesai:
+            st.rerun()
+    
+    def _tampilkan_saran(self, teks: str, label, k: int = 5):
+        """Caption saran autocomplete (top-k dari index prefiks) di bawah input filter"""
+        if teks:
+            saran = self.manajemen.lengkapi(teks, k)
+            if saran:
+                st.caption("💡 " + " · ".join(label(m) for m in saran))
+    
+    def _pilihan_mahasiswa(self, teks: str) -> List[Mahasiswa]:
+        """
+        Kandidat untuk selectbox pilih mahasiswa: top-k saran prefiks, atau top-k hasil
+        pencarian substring jika tidak ada saran. Selectbox tidak pernah memuat semua N data.
+        """
+        saran = self.manajemen.lengkapi(teks)
+        return saran or self.manajemen.cari(teks)[:DataMahasiswa.BATAS_SARAN]
+    
     def _edit_data(self):
         """Form edit data mahasiswa"""
         st.markdown("## ✏️ Edit Data Mahasiswa")
         
-        data = self.manajemen.get_semua()
-        if not data:
+        if not self.manajemen.jumlah():
             st.info("📭 Tidak ada data mahasiswa yang dapat diedit.")
             return
         
@@ -1256,9 +4455,10 @@ class AplikasiManajemenMahasiswa:
         with search_col1:
             search_term = st.text_input("🔍 Cari mahasiswa:", placeholder="Masukkan NIM atau nama...")
         
-        filtered_data = data
-        if search_term:
-            filtered_data = [m for m in data if search_term.lower() in m.nama.lower() or search_term in m.nim]
+        if not search_term:
+            st.info(f"⌨️ Ketik awal NIM atau nama untuk menampilkan {DataMahasiswa.BATAS_SARAN} saran teratas.")
+            return
+        filtered_data = self._pilihan_mahasiswa(search_term)
         
         if filtered_data:
             pilihan = {f"{m.nim} - {m.nama} ({m.jurusan})": m.nim for m in filtered_data}
@@ -1310,25 +4510,14 @@ class AplikasiManajemenMahasiswa:
     def _process_edit_data(self, nim_lama: str, nim_baru: str, nama_baru: str, jurusan_baru: str, angkatan_baru: str, email_baru: str):
         """Memproses edit data"""
         try:
-            if not nim_baru or not nama_baru:
-                st.error("❌ NIM dan Nama wajib diisi!")
-                return
-            
-            if not re.match(r'^\d{9,12}$', nim_baru):
-                st.error("❌ NIM harus terdiri dari 9-12 digit angka!")
-                return
-            
-            if not re.match(r'^[A-Za-z\s\.\,]{3,50}$', nama_baru):
-                st.error("❌ Nama hanya boleh mengandung huruf, spasi, titik, dan koma!")
-                return
-            
-            if email_baru and not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', email_baru):
-                st.error("❌ Format email tidak valid!")
+            if not self._cek_form(nim_baru, nama_baru, email_baru):
                 return
             
             mahasiswa_baru = Mahasiswa(nim=nim_baru, nama=nama_baru, jurusan=jurusan_baru, angkatan=angkatan_baru, email=email_baru)
-            self.manajemen.edit(nim_lama, mahasiswa_baru)
-            st.session_state.data_mahasiswa = self.manajemen.get_semua()
+            with self.pemuat.penyimpan.mutasi():
+                if self.manajemen.edit(nim_lama, mahasiswa_baru):
+                    self._catat_perubahan('edit', nim=nim_lama, mahasiswa=mahasiswa_baru)
+            st.session_state.data_mahasiswa = self.manajemen.versi
             
             st.success("✅ Data mahasiswa berhasil diupdate!")
             st.balloons()
@@ -1344,12 +4533,24 @@ class AplikasiManajemenMahasiswa:
         """Form hapus data mahasiswa"""
         st.markdown("## 🗑️ Hapus Data Mahasiswa")
         
-        data = self.manajemen.get_semua()
-        if not data:
+        if not self.manajemen.jumlah():
             st.info("📭 Tidak ada data mahasiswa yang dapat dihapus.")
             return
         
-        pilihan = {f"{m.nim} - {m.nama}": m.nim for m in data}
+        mode = st.radio("Mode penghapusan:", ["👤 Satu Mahasiswa", "📦 Hapus Massal"], horizontal=True, key="mode_hapus")
+        if mode == "📦 Hapus Massal":
+            self._hapus_massal()
+            return
+        
+        cari_hapus = st.text_input("🔍 Cari mahasiswa:", placeholder="Masukkan NIM atau nama...", key="cari_hapus")
+        if not cari_hapus:
+            st.info(f"⌨️ Ketik awal NIM atau nama untuk menampilkan {DataMahasiswa.BATAS_SARAN} saran teratas.")
+            return
+        
+        pilihan = {f"{m.nim} - {m.nama}": m.nim for m in self._pilihan_mahasiswa(cari_hapus)}
+        if not pilihan:
+            st.warning("🔍 Tidak ditemukan mahasiswa dengan kriteria tersebut.")
+            return
         selected = st.selectbox("Pilih Mahasiswa yang akan dihapus:", list(pilihan.keys()))
         
         if selected:
@@ -1381,8 +4582,12 @@ class AplikasiManajemenMahasiswa:
                 with col_btn1:
                     if st.button("🗑️ **Hapus Permanen**", type="primary", disabled=not confirm, use_container_width=True):
                         try:
-                            if self.manajemen.hapus(nim_hapus):
-                                st.session_state.data_mahasiswa = self.manajemen.get_semua()
+                            with self.pemuat.penyimpan.mutasi():
+                                dihapus = self.manajemen.hapus(nim_hapus)
+                                if dihapus:
+                                    self._catat_perubahan('hapus', nim=nim_hapus)
+                            if dihapus:
+                                st.session_state.data_mahasiswa = self.manajemen.versi
                                 st.error(f"🗑️ Data **{mahasiswa.nama}** berhasil dihapus!")
                                 time.sleep(2)
                                 st.rerun()
@@ -1395,6 +4600,63 @@ class AplikasiManajemenMahasiswa:
                     if st.button("↩️ **Batal**", use_container_width=True):
                         st.rerun()
     
+    def _hapus_massal(self):
+        """Hapus banyak mahasiswa sekaligus, misalnya seluruh angkatan yang sudah lulus"""
+        statistik = self.manajemen.statistik()
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            angkatan_pilih = st.multiselect(
+                "📅 Angkatan yang dihapus",
+                sorted(statistik.per_angkatan),
+                format_func=lambda a: f"{a} ({statistik.per_angkatan.get(a, 0)} mahasiswa)",
+                key="hapus_angkatan"
+            )
+        with col2:
+            jurusan_pilih = st.multiselect(
+                "🎓 Batasi ke jurusan (kosong = semua jurusan)",
+                sorted(statistik.per_jurusan),
+                key="hapus_jurusan"
+            )
+        
+        if not angkatan_pilih:
+            st.info("ℹ️ Pilih minimal satu angkatan untuk dihapus.")
+            return
+        
+        # Target dikumpulkan lewat index sekunder angkatan/jurusan di store
+        target = []
+        for angkatan in angkatan_pilih:
+            for jurusan in (jurusan_pilih or [None]):
+                target.extend(self.manajemen.filter(jurusan=jurusan, angkatan=angkatan))
+        
+        if not target:
+            st.info("ℹ️ Tidak ada mahasiswa yang cocok dengan pilihan tersebut.")
+            return
+        
+        st.markdown(f"""
+        <div class="warning-card">
+            <h3>⚠️ PERINGATAN: Penghapusan {len(target)} Data</h3>
+            <p>Data yang dihapus tidak dapat dikembalikan. Pastikan angkatan dan jurusan yang dipilih benar.</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        with st.expander(f"📋 Pratinjau ({min(len(target), 100)} dari {len(target)} data)"):
+            st.dataframe(self.manajemen.ke_dataframe(target[:100]), use_container_width=True, hide_index=True)
+        
+        confirm = st.checkbox(f"✅ Saya yakin ingin menghapus {len(target)} data ini", key="konfirmasi_hapus_massal")
+        if st.button("🗑️ **Hapus Massal Permanen**", type="primary", disabled=not confirm, use_container_width=True):
+            try:
+                nims = [m.nim for m in target]
+                with self.pemuat.penyimpan.mutasi():
+                    jumlah = self.manajemen.hapus_banyak(nims)
+                    self._catat_hapus_banyak(nims)
+                st.session_state.data_mahasiswa = self.manajemen.versi
+                st.success(f"🗑️ **{jumlah}** data mahasiswa berhasil dihapus!")
+                time.sleep(2)
+                st.rerun()
+            except Exception as e:
+                st.error(f"❌ Terjadi kesalahan: {str(e)}")
+    
     def _pencarian_data(self):
         """Halaman pencarian data dengan visualisasi"""
         st.markdown("## 🔍 Pencarian Data Mahasiswa")
@@ -1408,11 +4670,16 @@ class AplikasiManajemenMahasiswa:
             )
         
         if keyword:
+            # Versi dibaca sebelum snapshot: mutasi di antaranya hanya membuat entri cache tampak lebih lama
+            versi = self.manajemen.versi
             data = self.manajemen.get_semua()
             
             # Tabs untuk berbagai algoritma
-            tab1, tab2, tab3 = st.tabs([
+            tab1, tab_index, tab_vektor, tab_fuzzy, tab2, tab3 = st.tabs([
                 "🔍 Linear Search", 
+                "🗂️ Indexed Search",
+                "🧮 Vectorized Search",
+                "🔤 Fuzzy Search",
                 "⚡ Binary Search", 
                 "📊 Perbandingan"
             ])
@@ -1426,109 +4693,266 @@ class AplikasiManajemenMahasiswa:
                     by = st.radio("Cari berdasarkan:", ["Nama", "NIM", "Email"], horizontal=True)
                 
                 with st.spinner("Sedang mencari..."):
-                    start_time = time.time()
-                    hasil = AlgoritmaPencarian.linear_search(data, keyword, by.lower())
-                    end_time = time.time()
-                    exec_time = end_time - start_time
+                    hasil, exec_time = self._cari_bertahap(
+                        'linear', versi, keyword, by.lower(),
+                        lambda: AlgoritmaPencarian.linear_search(data, keyword, by.lower()),
+                        lambda lama: AlgoritmaPencarian.linear_search(lama, keyword, by.lower()))
                 
                 self._display_search_results(hasil, exec_time, "Linear Search")
             
+            with tab_index:
+                st.markdown("### 🗂️ Indexed Search")
+                st.caption("**Kompleksitas:** O(k) untuk k kandidat | **Keuntungan:** Index trigram mempersempit kandidat sebelum diverifikasi (keyword minimal 3 karakter)")
+                
+                by_index = st.radio("Cari berdasarkan:", ["Semua", "Nama", "NIM", "Email"], horizontal=True, key="by_indexed")
+                
+                with st.spinner("Sedang mencari dengan index..."):
+                    field_index = None if by_index == "Semua" else by_index.lower()
+                    hasil_index, exec_time = self._cari_bertahap(
+                        'indexed', versi, keyword, field_index,
+                        lambda: AlgoritmaPencarian.indexed_search(self.manajemen, keyword, field_index),
+                        lambda lama: AlgoritmaPencarian.sequential_search(lama, keyword) if field_index is None
+                        else AlgoritmaPencarian.linear_search(lama, keyword, field_index))
+                
+                self._display_search_results(hasil_index, exec_time, "Indexed Search")
+            
+            with tab_vektor:
+                st.markdown("### 🧮 Vectorized Search")
+                st.caption("**Kompleksitas:** O(n) di kode C pandas/Arrow | **Keuntungan:** Tanpa loop Python per objek, kondisi beberapa field digabung dengan AND")
+                
+                by_vektor = st.radio("Keyword dicari di:", ["Nama", "NIM", "Email", "Jurusan", "Angkatan"],
+                                     horizontal=True, key="by_vektor")
+                persis = st.checkbox("Keyword harus sama persis (bukan sebagian)", key="vektor_persis")
+                
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    jurusan_vektor = st.selectbox("Jurusan:", ["Semua"] + self.manajemen.daftar_jurusan(), key="vektor_jurusan")
+                with col2:
+                    angkatan_vektor = st.selectbox("Angkatan:", ["Semua"] + sorted(self.manajemen.hitung_angkatan()), key="vektor_angkatan")
+                with col3:
+                    email_vektor = st.text_input("Email mengandung:", key="vektor_email", placeholder="Contoh: @example.com")
+                
+                kondisi = [(by_vektor.lower(), keyword, persis), ('email', email_vektor, False)]
+                if jurusan_vektor != "Semua":
+                    kondisi.append(('jurusan', jurusan_vektor, True))
+                if angkatan_vektor != "Semua":
+                    kondisi.append(('angkatan', angkatan_vektor, True))
+                
+                # Streamlit menjalankan semua tab setiap rerun; tabel kolom pencarian dibangun
+                # ulang setelah data berubah, jadi hanya dihitung jika diaktifkan di tab ini
+                if st.toggle("Jalankan pencarian vektor", key="vektor_aktif"):
+                    with st.spinner("Sedang mencari secara vektor..."):
+                        hasil_vektor, exec_time = self._cari_dengan_cache(
+                            'vektor', versi, keyword, tuple(kondisi),
+                            lambda: AlgoritmaPencarian.vectorized_search(self.manajemen, kondisi))
+                    
+                    self._display_search_results(hasil_vektor, exec_time, "Vectorized Search")
+                else:
+                    st.info("ℹ️ Aktifkan pencarian vektor untuk melihat hasil.")
+            
+            with tab_fuzzy:
+                st.markdown("### 🔤 Fuzzy Search (Nama)")
+                st.caption("**Kompleksitas:** O(kosakata x panjang keyword) secara vektor | **Keuntungan:** Toleran salah ketik, misalnya \"Ramadan\" menemukan \"Ramadhan\"")
+                
+                maks_jarak = st.slider("Jarak edit maksimum per kata:", 0, 3, 2, key="fuzzy_jarak",
+                                       help="Jumlah huruf yang boleh berbeda (sisip, hapus, atau ganti) untuk setiap kata keyword")
+                
+                # Index fuzzy juga dibangun ulang setelah data berubah: hanya dihitung jika diaktifkan
+                if st.toggle("Jalankan fuzzy search", key="fuzzy_aktif"):
+                    with st.spinner("Sedang mencari nama yang mirip..."):
+                        hasil_fuzzy, exec_time = self._cari_dengan_cache(
+                            'fuzzy', versi, keyword, maks_jarak,
+                            lambda: AlgoritmaPencarian.fuzzy_search(self.manajemen, keyword, maks_jarak))
+                    
+                    self._display_search_results([m for m, _ in hasil_fuzzy], exec_time, "Fuzzy Search")
+                    if hasil_fuzzy:
+                        st.markdown("#### 🏅 Peringkat Kemiripan")
+                        st.dataframe(pd.DataFrame([
+                            {'Jarak': jarak, 'NIM': m.nim, 'Nama': m.nama, 'Jurusan': m.jurusan}
+                            for m, jarak in hasil_fuzzy[:20]
+                        ]), use_container_width=True, hide_index=True)
+                else:
+                    st.info("ℹ️ Aktifkan fuzzy search untuk melihat hasil.")
+            
             with tab2:
                 st.markdown("### ⚡ Binary Search")
                 st.caption("**Kompleksitas:** O(log n) | **Persyaratan:** Data harus terurut berdasarkan NIM")
                 
                 if re.match(r'^\d+$', keyword):
-                    data_sorted = sorted(data, key=lambda x: x.nim)
-                    
+                    # Tampilan terurut dipelihara store, tidak perlu sorted() setiap pencarian
                     with st.spinner("Sedang mencari dengan binary search..."):
-                        start_time = time.time()
-                        hasil_binary = AlgoritmaPencarian.binary_search(data_sorted, keyword)
-                        end_time = time.time()
-                        exec_time = end_time - start_time
+                        hasil_binary, exec_time = self._cari_dengan_cache(
+                            'binary', versi, keyword, 'nim',
+                            lambda: AlgoritmaPencarian.binary_search(self.manajemen.urut_nim(), keyword))
                     
                     if hasil_binary:
                         self._display_search_results([hasil_binary], exec_time, "Binary Search")
                     else:
                         st.info("ℹ️ Tidak ditemukan hasil.")
                         st.metric("⏱️ Waktu Eksekusi", f"{exec_time:.6f} detik")
+                    
+                    # Prefix search pada tampilan terurut yang sama
+                    hasil_prefiks, exec_time = self._cari_dengan_cache(
+                        'prefiks', versi, keyword, 'nim', lambda: self.manajemen.prefiks_nim(keyword))
+                    if hasil_prefiks:
+                        self._display_search_results(hasil_prefiks, exec_time, "Prefix Search (NIM)")
                 else:
                     st.warning("⚠️ Binary Search hanya bisa mencari berdasarkan NIM (angka)")
+                
+                st.markdown("#### 📏 Rentang NIM")
+                col_awal, col_akhir = st.columns(2)
+                with col_awal:
+                    nim_awal = st.text_input("NIM awal", key="rentang_awal", placeholder="Contoh: 2021001")
+                with col_akhir:
+                    nim_akhir = st.text_input("NIM akhir", key="rentang_akhir", placeholder="Contoh: 2021999")
+                
+                if nim_awal and nim_akhir:
+                    if nim_awal > nim_akhir:
+                        st.warning("⚠️ NIM awal harus lebih kecil atau sama dengan NIM akhir")
+                    else:
+                        hasil_rentang, exec_time = self._cari_dengan_cache(
+                            'rentang', versi, nim_awal, nim_akhir, lambda: self.manajemen.rentang_nim(nim_awal, nim_akhir))
+                        if hasil_rentang:
+                            self._display_search_results(hasil_rentang, exec_time, "Range Search (NIM)")
+                        else:
+                            st.info("ℹ️ Tidak ada NIM dalam rentang tersebut.")
             
             with tab3:
                 st.markdown("### 📊 Perbandingan Algoritma")
                 
-                # Benchmark comparison
-                comparison_data = []
-                
-                # Linear Search benchmark
-                start_time = time.time()
-                linear_results = AlgoritmaPencarian.linear_search(data, keyword, 'nama')
-                linear_time = time.time() - start_time
-                
-                comparison_data.append({
-                    'Algoritma': 'Linear Search',
-                    'Waktu (ms)': linear_time * 1000,
-                    'Hasil': len(linear_results),
-                    'Kompleksitas': 'O(n)'
-                })
-                
-                # Sequential Search benchmark
-                start_time = time.time()
-                seq_results = AlgoritmaPencarian.sequential_search(data, keyword)
-                seq_time = time.time() - start_time
-                
-                comparison_data.append({
-                    'Algoritma': 'Sequential Search',
-                    'Waktu (ms)': seq_time * 1000,
-                    'Hasil': len(seq_results),
-                    'Kompleksitas': 'O(n)'
-                })
-                
-                # Binary Search benchmark (jika NIM)
-                if re.match(r'^\d+$', keyword):
-                    data_sorted = sorted(data, key=lambda x: x.nim)
-                    start_time = time.time()
-                    binary_result = AlgoritmaPencarian.binary_search(data_sorted, keyword)
-                    binary_time = time.time() - start_time
+                # Perbandingan ikut menjalankan pencarian vektor, jadi juga harus diaktifkan
+                if st.toggle("Jalankan perbandingan", key="perbandingan_aktif"):
+                    # Waktu diukur sekali per keyword dan versi data; rerun memakai tabel yang sama
+                    comparison_data, _ = self._cari_dengan_cache(
+                        'perbandingan', versi, keyword, None, lambda: self._ukur_perbandingan(data, keyword))
                     
-                    comparison_data.append({
-                        'Algoritma': 'Binary Search',
-                        'Waktu (ms)': binary_time * 1000,
-                        'Hasil': 1 if binary_result else 0,
-                        'Kompleksitas': 'O(log n)'
-                    })
-                
-                df_comparison = pd.DataFrame(comparison_data)
-                
-                # Visualisasi perbandingan
-                col_chart, col_table = st.columns(2)
-                with col_chart:
-                    fig = px.bar(
-                        df_comparison,
-                        x='Algoritma',
-                        y='Waktu (ms)',
-                        color='Algoritma',
-                        title='Perbandingan Waktu Eksekusi',
-                        text='Waktu (ms)',
-                        color_discrete_sequence=px.colors.qualitative.Set3
-                    )
-                    fig.update_traces(texttemplate='%{text:.3f}ms', textposition='outside')
-                    st.plotly_chart(fig, use_container_width=True)
-                
-                with col_table:
-                    st.dataframe(
-                        df_comparison,
-                        column_config={
-                            "Waktu (ms)": st.column_config.ProgressColumn(
-                                "Waktu (ms)",
-                                format="%.3f",
-                                min_value=0,
-                                max_value=max(df_comparison['Waktu (ms)']) * 1.1
-                            )
-                        },
-                        hide_index=True,
-                        use_container_width=True
-                    )
+                    df_comparison = pd.DataFrame(comparison_data)
+                    
+                    # Visualisasi perbandingan
+                    col_chart, col_table = st.columns(2)
+                    with col_chart:
+                        fig = px.bar(
+                            df_comparison,
+                            x='Algoritma',
+                            y='Waktu (ms)',
+                            color='Algoritma',
+                            title='Perbandingan Waktu Eksekusi',
+                            text='Waktu (ms)',
+                            color_discrete_sequence=px.colors.qualitative.Set3
+                        )
+                        fig.update_traces(texttemplate='%{text:.3f}ms', textposition='outside')
+                        st.plotly_chart(fig, use_container_width=True)
+                    
+                    with col_table:
+                        st.dataframe(
+                            df_comparison,
+                            column_config={
+                                "Waktu (ms)": st.column_config.ProgressColumn(
+                                    "Waktu (ms)",
+                                    format="%.3f",
+                                    min_value=0,
+                                    max_value=max(df_comparison['Waktu (ms)']) * 1.1
+                                )
+                            },
+                            hide_index=True,
+                            use_container_width=True
+                        )
+                else:
+                    st.info("ℹ️ Aktifkan perbandingan untuk mengukur semua algoritma.")
+            
+            cache = self.cache_pencarian
+            bertahap = st.session_state.pencarian_bertahap
+            st.caption(f"🗃️ Cache hasil pencarian (bersama semua sesi): **{cache.hit}** hit · "
+                       f"**{cache.miss}** miss · {len(cache)}/{cache.kapasitas} entri · versi data {versi}")
+            st.caption(f"✂️ Pencarian sesi ini: **{bertahap.bertahap}** kali menyaring hasil ketikan sebelumnya · "
+                       f"**{bertahap.penuh}** kali pencarian penuh")
+    
+    def _ukur_perbandingan(self, data: Sequence, keyword: str) -> List[Dict]:
+        """Mengukur waktu setiap algoritma untuk tab perbandingan (tanpa cache)"""
+        comparison_data = []
+        
+        # Linear Search benchmark
+        start_time = time.time()
+        linear_results = AlgoritmaPencarian.linear_search(data, keyword, 'nama')
+        linear_time = time.time() - start_time
+        
+        comparison_data.append({
+            'Algoritma': 'Linear Search',
+            'Waktu (ms)': linear_time * 1000,
+            'Hasil': len(linear_results),
+            'Kompleksitas': 'O(n)'
+        })
+        
+        # Sequential Search benchmark
+        start_time = time.time()
+        seq_results = AlgoritmaPencarian.sequential_search(data, keyword)
+        seq_time = time.time() - start_time
+        
+        comparison_data.append({
+            'Algoritma': 'Sequential Search',
+            'Waktu (ms)': seq_time * 1000,
+            'Hasil': len(seq_results),
+            'Kompleksitas': 'O(n)'
+        })
+        
+        # Indexed Search benchmark (semua field, sama seperti sequential)
+        start_time = time.time()
+        index_results = AlgoritmaPencarian.indexed_search(self.manajemen, keyword)
+        index_time = time.time() - start_time
+        
+        comparison_data.append({
+            'Algoritma': 'Indexed Search',
+            'Waktu (ms)': index_time * 1000,
+            'Hasil': len(index_results),
+            'Kompleksitas': 'O(k)'
+        })
+        
+        # Vectorized Search benchmark (field nama, sama seperti linear search)
+        start_time = time.time()
+        vektor_results = AlgoritmaPencarian.vectorized_search(self.manajemen, [('nama', keyword, False)])
+        vektor_time = time.time() - start_time
+        
+        comparison_data.append({
+            'Algoritma': 'Vectorized Search',
+            'Waktu (ms)': vektor_time * 1000,
+            'Hasil': len(vektor_results),
+            'Kompleksitas': 'O(n) vektor'
+        })
+        
+        # Binary Search benchmark (jika NIM)
+        if re.match(r'^\d+$', keyword):
+            data_sorted = self.manajemen.urut_nim()
+            start_time = time.time()
+            binary_result = AlgoritmaPencarian.binary_search(data_sorted, keyword)
+            binary_time = time.time() - start_time
+        
+            comparison_data.append({
+                'Algoritma': 'Binary Search',
+                'Waktu (ms)': binary_time * 1000,
+                'Hasil': 1 if binary_result else 0,
+                'Kompleksitas': 'O(log n)'
+            })
+        
+        return comparison_data
+    
+    def _cari_dengan_cache(self, algoritma: str, versi: int, keyword: str, field: Any,
+                           hitung: Callable[[], Any]) -> Tuple[Any, float]:
+        """Hasil pencarian lewat cache bersama untuk versi store yang diberikan, beserta waktunya"""
+        start_time = time.time()
+        hasil = self.cache_pencarian.ambil(algoritma, keyword, field, versi, hitung)
+        return hasil, time.time() - start_time
+    
+    def _cari_bertahap(self, kanal: str, versi: int, keyword: str, field: Any,
+                       cari_penuh: Callable[[], List], saring: Callable[[List], List]) -> Tuple[List, float]:
+        """
+        Cache bersama dulu; jika miss dan keyword hanya diperpanjang dari ketikan sebelumnya
+        di sesi ini, hasil sebelumnya yang disaring alih-alih mencari ulang semua data
+        """
+        bertahap = st.session_state.pencarian_bertahap
+        hasil, exec_time = self._cari_dengan_cache(
+            kanal, versi, keyword, field, lambda: bertahap.cari(kanal, (keyword,), field, versi, cari_penuh, saring))
+        bertahap.ingat(kanal, (keyword,), field, versi, hasil)  # Hit cache juga menjadi titik awal penyaringan
+        return hasil, exec_time
     
     def _display_search_results(self, hasil: List[Mahasiswa], exec_time: float, algorithm: str):
         """Menampilkan hasil pencarian"""
@@ -1696,8 +5120,9 @@ class AplikasiManajemenMahasiswa:
         """Halaman visualisasi data lengkap"""
         st.markdown("## 📊 Visualisasi Data Lengkap")
         
-        data = self.manajemen.get_semua()
-        if not data:
+        # Hitungan dibaca dari statistik agregat store; hanya timeline yang butuh tabel per baris
+        statistik = self.manajemen.statistik()
+        if not statistik.total:
             st.info("📭 Tidak ada data untuk divisualisasikan.")
             return
         
@@ -1708,9 +5133,7 @@ class AplikasiManajemenMahasiswa:
             
             with col1:
                 # Jurusan distribution
-                jurusan_counts = {}
-                for m in data:
-                    jurusan_counts[m.jurusan] = jurusan_counts.get(m.jurusan, 0) + 1
+                jurusan_counts = statistik.per_jurusan
                 
                 fig1 = px.pie(
                     values=list(jurusan_counts.values()),
@@ -1723,9 +5146,7 @@ class AplikasiManajemenMahasiswa:
             
             with col2:
                 # Angkatan distribution
-                angkatan_counts = {}
-                for m in data:
-                    angkatan_counts[m.angkatan] = angkatan_counts.get(m.angkatan, 0) + 1
+                angkatan_counts = dict(sorted(statistik.per_angkatan.items()))
                 
                 fig2 = px.bar(
                     x=list(angkatan_counts.keys()),
@@ -1741,16 +5162,13 @@ class AplikasiManajemenMahasiswa:
             st.subheader("📅 Timeline Data Mahasiswa")
             
             # Create timeline data
-            timeline_data = []
-            for m in data:
-                timeline_data.append({
-                    'Tahun': int(m.angkatan),
-                    'Nama': m.nama,
-                    'Jurusan': m.jurusan,
-                    'NIM': m.nim
-                })
-            
-            df_timeline = pd.DataFrame(timeline_data)
+            df = self.manajemen.ke_dataframe()
+            df_timeline = pd.DataFrame({
+                'Tahun': df['Angkatan'].astype(int),
+                'Nama': df['Nama'],
+                'Jurusan': df['Jurusan'].astype(str),
+                'NIM': df['NIM']
+            })
             
             if not df_timeline.empty:
                 fig = px.scatter(
@@ -1773,27 +5191,18 @@ class AplikasiManajemenMahasiswa:
             
             with insights_col1:
                 # Statistik
-                total = len(data)
-                jurusan_count = len(set([m.jurusan for m in data]))
-                avg_name_len = sum(len(m.nama) for m in data) / total
-                
-                st.metric("👥 Total Mahasiswa", total)
-                st.metric("🎓 Jurusan Unik", jurusan_count)
-                st.metric("📝 Rata-rata Panjang Nama", f"{avg_name_len:.1f} karakter")
+                st.metric("👥 Total Mahasiswa", statistik.total)
+                st.metric("🎓 Jurusan Unik", len(statistik.per_jurusan))
+                st.metric("📝 Rata-rata Panjang Nama", f"{statistik.rata_panjang_nama:.1f} karakter")
             
             with insights_col2:
                 # Additional insights
-                if data:
-                    # Email statistics
-                    dengan_email = len([m for m in data if m.email])
-                    persentase = (dengan_email / len(data)) * 100
-                    st.metric("📧 Dengan Email", f"{dengan_email} ({persentase:.1f}%)")
-                    
-                    # Find most common first name
-                    first_names = [m.nama.split()[0] for m in data if m.nama]
-                    if first_names:
-                        most_common_name = max(set(first_names), key=first_names.count)
-                        st.metric("👤 Nama Depan Terbanyak", most_common_name)
+                # Email statistics
+                st.metric("📧 Dengan Email", f"{statistik.dengan_email} ({statistik.persen_email:.1f}%)")
+                
+                # Nama depan terbanyak dipelihara dalam ember hitungan, bukan dihitung ulang
+                if statistik.nama_depan_terbanyak:
+                    st.metric("👤 Nama Depan Terbanyak", statistik.nama_depan_terbanyak)
     
     def _email_page(self):
         """Halaman untuk mengirim email data mahasiswa"""
@@ -1877,7 +5286,7 @@ class AplikasiManajemenMahasiswa:
                 st.error("❌ Email penerima wajib diisi!")
                 return
             
-            if not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', penerima):
+            if not ValidatorMahasiswa.email_valid(penerima):
                 st.error("❌ Format email penerima tidak valid!")
                 return
             
@@ -1908,16 +5317,28 @@ class AplikasiManajemenMahasiswa:
             # Siapkan lampiran jika diperlukan
             lampiran_path = None
             
+            # Statistik laporan: seluruh data dibaca dari statistik store, sebagian dihitung dari tabelnya
+            semua = data_kirim is data
+            df_kirim = None if semua else self.manajemen.ke_dataframe(data_kirim)
+            statistik = self.manajemen.statistik() if semua else RingkasanStatistik.dari_dataframe(df_kirim)
+            
             if jenis_laporan in ["CSV Attachment", "Kedua-duanya"]:
-                # Generate CSV report
-                csv_path = self.email_handler.generate_csv_report(data_kirim, "data_mahasiswa.csv")
+                # Generate CSV report: seluruh data ditulis per potongan, sebagian dari tabel yang sudah dibangun
+                if semua:
+                    csv_path = self.email_handler.generate_csv_report(
+                        data_kirim, "data_mahasiswa.csv", potongan=self.manajemen.iter_batches(sebagai='dataframe')
+                    )
+                else:
+                    csv_path = self.email_handler.generate_csv_report(
+                        data_kirim, "data_mahasiswa.csv", df=df_kirim
+                    )
                 lampiran_path = csv_path
             
             status_text.text("🔄 Membuat laporan...")
             progress_bar.progress(50)
             
             # Generate HTML content
-            html_content = self.email_handler.generate_html_report(data_kirim, subjek)
+            html_content = self.email_handler.generate_html_report(data_kirim, subjek, statistik)
             
             # Tambahkan pesan tambahan jika ada
             if pesan_tambahan:
@@ -2836,8 +6257,9 @@ if __name__ == "__main__":
                 except Exception as e:
                     print(f"Error menambahkan {nama}: {str(e)}")
             
-            # Simpan ke file
-            app.file_handler.simpan_ke_file(app.manajemen.get_semua())
+            # Simpan ke file (langsung, bukan debounced, agar rerun berikutnya melihat file)
+            app._save_data()
+            app.pemuat.penyimpan.flush()
             print("✅ Data contoh berhasil diinisialisasi!")
         
         # Jalankan aplikasi